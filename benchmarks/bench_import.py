@@ -0,0 +1,112 @@
+"""
+Measures the import cost of the yamtimes package with `python -X importtime`.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--output results.json]
+
+Each scenario runs in a fresh interpreter. Its cost is the sum of the
+self times reported by -X importtime for every module that a bare
+interpreter does not import already, and the best of --runs runs is kept.
+Each scenario also runs once unmeasured first, so that compilation is not
+measured; its bytecode goes to a temporary PYTHONPYCACHEPREFIX rather than
+into the source tree.
+
+The JSON output has the same layout as benchmarks/run.py, so two runs can be
+compared with `python benchmarks/run.py --compare before.json after.json`.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "import.package": "import yamtimes",
+    "import.YamTimes": "from yamtimes import YamTimes",
+    "import.YamTimes+format": "from yamtimes import YamTimes; YamTimes().from_timestamp(0).to_string('%Y-%m-%d')",
+    "import.YamTimesArray": "from yamtimes import YamTimesArray",
+}
+
+
+def import_times(statement: str, environment: dict) -> dict:
+    """
+    Runs a statement in a new interpreter and returns the self import time, in
+    microseconds, of every module it imported.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=environment,
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_time)
+    return times
+
+
+def measure(statement: str, baseline: set, runs: int, environment: dict) -> dict:
+    best = None
+    for _ in range(runs):
+        times = {name: value for name, value in import_times(statement, environment).items() if name not in baseline}
+        total = sum(times.values())
+        if best is None or total < best[0]:
+            best = (total, times)
+    total, times = best
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:5]
+    return {
+        "seconds": total / 1e6,
+        "modules": len(times),
+        "slowest": [{"module": name, "seconds": value / 1e6} for name, value in slowest],
+        "repeat": runs,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="interpreter runs per scenario (the best is kept)")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as cache:
+        environment = dict(os.environ, PYTHONPATH=ROOT, PYTHONPYCACHEPREFIX=cache)
+        # The warm-up runs must be able to write their bytecode.
+        environment.pop("PYTHONDONTWRITEBYTECODE", None)
+        import_times("pass", environment)
+        baseline = set(import_times("pass", environment))
+        results = {}
+        for name, statement in SCENARIOS.items():
+            # Fills the cache prefix with the bytecode of every module the scenario imports.
+            import_times(statement, environment)
+            results[name] = measure(statement, baseline, args.runs, environment)
+            modules = ", ".join(entry["module"] for entry in results[name]["slowest"][:3])
+            print(f"{name:<28} {results[name]['seconds'] * 1e3:8.2f} ms  ({modules})", file=sys.stderr)
+    report = json.dumps({
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+Measures the memory cost of holding many YamTimes instances.
+
+Usage:
+    python benchmarks/bench_memory.py [--count N]
+
+The "dict-based" row reproduces the previous YamTimes layout (a plain class
+whose instances keep the datetime in a per-instance __dict__) so the saving
+of the __slots__ representation can be read directly from the output.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from yamtimes import YamTimes  # noqa: E402
+
+
+class DictYamTimes:
+    def __init__(self, dt):
+        self.__datetime = dt
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    start = datetime(2024, 1, 1)
+    step = timedelta(seconds=1)
+    datetimes = [start + step * i for i in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(dt) for dt in datetimes]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the instances is not part of the per-instance cost.
+    overhead = sys.getsizeof(instances)
+    del instances
+    return (after - before - overhead) / count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200000, help="number of instances to allocate")
+    args = parser.parse_args(argv)
+
+    rows = [
+        ("dict-based (before)", lambda dt: DictYamTimes(dt)),
+        ("YamTimes (slots)", lambda dt: YamTimes(dt=dt)),
+    ]
+    for label, factory in rows:
+        print(f"{label:<24} {bytes_per_instance(factory, args.count):8.1f} bytes/instance")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
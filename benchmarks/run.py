@@ -0,0 +1,220 @@
+"""
+Runs the YamTimes benchmark suite and optionally compares two runs.
+
+Usage:
+    python benchmarks/run.py [--filter TEXT] [--repeat N] [--output results.json]
+    python benchmarks/run.py --compare baseline.json candidate.json [--threshold 0.1]
+
+Every benchmark is timed with timeit: the number of loops is calibrated with
+Timer.autorange and the best of --repeat runs is reported, as seconds per
+call. Batch benchmarks process a whole batch per call; their name ends with
+the batch size in brackets. Results are written as JSON (to stdout, or to
+--output) so that runs can be stored and compared later.
+
+--compare prints the relative change of every benchmark present in both
+files and exits with status 1 when any of them got slower than --threshold.
+"""
+import argparse
+import json
+import os
+import pickle
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yamtimes  # noqa: E402
+from yamtimes import BusinessCalendar, YamCursor, YamTimes, YamTimesArray  # noqa: E402
+from yamtimes import differences  # noqa: E402
+from yamtimes.clock import CoarseClock, use_clock  # noqa: E402
+
+BATCH_SIZE = 10000
+
+
+def _instants(count: int) -> list:
+    start = datetime(2024, 1, 1, 8, 30)
+    step = timedelta(hours=7, minutes=13, seconds=11)
+    return [YamTimes(dt=start + step * index) for index in range(count)]
+
+
+def scalar_benchmarks() -> dict:
+    time_ = YamTimes(2024, 3, 15, 12, 30)
+    other = YamTimes(2024, 3, 16, 9, 0)
+    calendar = BusinessCalendar.for_country("US", 2024, 2026)
+    return {
+        "construct.now": lambda: YamTimes(),
+        "construct.fields": lambda: YamTimes(2024, 3, 15, 12, 30),
+        "construct.from_string": lambda: time_.from_string("2024-03-15 12:30:00"),
+        "construct.from_iso_format": lambda: time_.from_iso_format("2024-03-15T12:30:00+00:00"),
+        "construct.from_timestamp": lambda: time_.from_timestamp(1710505800.0),
+        "arithmetic.add_days": lambda: time_.add_days(10),
+        "arithmetic.add_months": lambda: time_.add_months(13),
+        "arithmetic.after": lambda: time_.after(years=1, months=2, days=3, hours=4),
+        "format.to_string": lambda: time_.to_string("%Y-%m-%d %H:%M:%S"),
+        "format.readable_format": lambda: time_.readable_format(),
+        "format.month_name[pt_BR]": lambda: time_.month_name("pt_BR"),
+        "format.weekday_name[es_ES]": lambda: time_.weekday_name("es_ES"),
+        "compare.eq": lambda: time_ == other,
+        "compare.lt": lambda: time_ < other,
+        "compare.is_before": lambda: time_.is_before(other),
+        "business.next_business_day": lambda: time_.next_business_day(),
+        "business.add_business_days[holidays]": lambda: time_.add_business_days(45, calendar),
+        "business.business_days_until[holidays]": lambda: time_.business_days_until(other, calendar),
+    }
+
+
+def batch_benchmarks(size: int = BATCH_SIZE) -> dict:
+    instants = _instants(size)
+    strings = [instant.to_string("%Y-%m-%d %H:%M:%S") for instant in instants]
+    isos = [instant.to_iso_format() for instant in instants]
+    batch = YamTimesArray(instants)
+    calendar = BusinessCalendar.for_country("US", 2024, 2040)
+    reference_time = instants[0]
+    reference = reference_time.datetime
+    encoded = batch.to_bytes()
+    pickled = pickle.dumps(instants, pickle.HIGHEST_PROTOCOL)
+    suffix = f"[{size}]"
+
+    def loop(operation):
+        return lambda: [operation(instant) for instant in instants]
+
+    def with_clock(clock, operation):
+        def run():
+            with use_clock(clock):
+                operation()
+        return run
+
+    def walk_minutes():
+        instant = reference_time
+        for _ in range(size):
+            instant = instant.add_minutes(1)
+            instant.hour()
+
+    def walk_minutes_cursor():
+        cursor = YamCursor(reference_time)
+        for _ in range(size):
+            cursor.add_minutes(1)
+            cursor.hour()
+
+    return {
+        "batch.construct.YamTimesArray" + suffix: lambda: YamTimesArray(instants),
+        "batch.construct.from_strings" + suffix: lambda: YamTimesArray.from_strings(strings),
+        "batch.construct.from_iso_strings" + suffix: lambda: YamTimesArray.from_iso_strings(isos),
+        "batch.arithmetic.add_months" + suffix: lambda: batch.add_months(13),
+        "batch.arithmetic.shift" + suffix: lambda: batch.shift(years=1, months=2, days=3, hours=4),
+        "batch.format.to_strings" + suffix: lambda: batch.to_strings("%Y-%m-%d %H:%M:%S"),
+        "batch.query.is_weekend" + suffix: lambda: batch.is_weekend(),
+        "batch.query.week_number" + suffix: lambda: batch.week_number(),
+        "batch.difference.hours_until" + suffix: lambda: differences.hours_until(batch, reference),
+        "batch.difference.months_until" + suffix: lambda: differences.months_until(batch, reference),
+        "batch.relative.is_in_current_week" + suffix: lambda: batch.is_in_current_week(reference),
+        "batch.relative.classify" + suffix: lambda: batch.classify(reference),
+        "batch.periods.bucketize_week" + suffix: lambda: batch.bucketize("week"),
+        "batch.periods.truncate_month" + suffix: lambda: batch.truncate("month"),
+        "batch.binary.to_bytes" + suffix: lambda: batch.to_bytes(),
+        "batch.binary.from_bytes" + suffix: lambda: YamTimesArray.from_bytes(encoded),
+        "batch.pickle.dumps" + suffix: lambda: pickle.dumps(instants, pickle.HIGHEST_PROTOCOL),
+        "batch.pickle.loads" + suffix: lambda: pickle.loads(pickled),
+        "batch.loop.start_of_month" + suffix: loop(lambda instant: instant.start_of_month()),
+        "batch.compare.sorted" + suffix: lambda: sorted(instants),
+        "batch.loop.add_days" + suffix: loop(lambda instant: instant.add_days(10)),
+        "batch.loop.hours_until" + suffix: loop(lambda instant: instant.hours_until(reference_time)),
+        "batch.loop.walk_minutes" + suffix: walk_minutes,
+        "batch.cursor.walk_minutes" + suffix: walk_minutes_cursor,
+        "batch.loop.is_in_current_week" + suffix: loop(lambda instant: instant.is_in_current_week()),
+        "batch.loop.is_in_current_week[coarse]" + suffix: with_clock(
+            CoarseClock(), loop(lambda instant: instant.is_in_current_week())
+        ),
+        "batch.loop.to_string" + suffix: loop(lambda instant: instant.to_string("%Y-%m-%d")),
+        "batch.business.add_business_days" + suffix: loop(lambda instant: instant.add_business_days(45, calendar)),
+    }
+
+
+def measure(function, repeat: int) -> dict:
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return {"seconds": best / number, "loops": number, "repeat": repeat}
+
+
+def run(filter_text: str = None, repeat: int = 5, batch_size: int = BATCH_SIZE) -> dict:
+    benchmarks = dict(scalar_benchmarks())
+    benchmarks.update(batch_benchmarks(batch_size))
+    results = {}
+    for name, function in benchmarks.items():
+        if filter_text and filter_text not in name:
+            continue
+        results[name] = measure(function, repeat)
+        print(f"{name:<52} {_format_seconds(results[name]['seconds'])}", file=sys.stderr)
+    return {
+        "meta": {
+            "yamtimes": yamtimes.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> list:
+    """
+    Returns (name, baseline seconds, candidate seconds, relative change, regressed) rows
+    for the benchmarks present in both runs.
+    """
+    rows = []
+    for name, before in baseline["results"].items():
+        after = candidate["results"].get(name)
+        if after is None:
+            continue
+        change = after["seconds"] / before["seconds"] - 1
+        rows.append((name, before["seconds"], after["seconds"], change, change > threshold))
+    return rows
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:9.3f} {unit}"
+    return f"{seconds / 1e-9:9.1f} ns"
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per benchmark (the best is kept)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="instants per batch benchmark")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"), help="compare two JSON result files")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown reported as a regression")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        rows = compare(_load(args.compare[0]), _load(args.compare[1]), args.threshold)
+        for name, before, after, change, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<52} {_format_seconds(before)} -> {_format_seconds(after)} {change:+8.1%}{flag}")
+        regressions = sum(row[4] for row in rows)
+        print(f"{len(rows)} benchmarks compared, {regressions} regressions over {args.threshold:.0%}")
+        return 1 if regressions else 0
+
+    report = json.dumps(run(args.filter, args.repeat, args.batch_size), indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,12 +9,13 @@ setup(
     author="svidaniya",
     author_email="svidaniyafg@gmail.com",
     url="https://github.com/svidaniya/yamtimes",  
-    packages=find_packages(),
+    packages=find_packages(exclude=("tests", "tests.*")),
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
+    entry_points={"console_scripts": ["yamtimes=yamtimes.cli:main"]},
     install_requires=["python-dateutil==2.9.0.post0","six==1.17.0"],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
 )
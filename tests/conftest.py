@@ -0,0 +1,47 @@
+import random
+from datetime import MAXYEAR, MINYEAR, datetime, timedelta
+
+import pytest
+
+# Instants that calendar code gets wrong first: the ends of the datetime range, the epoch,
+# leap days and century years, and the last moments of months, years and ISO weeks.
+BOUNDARIES = (
+    datetime.min,
+    datetime(MINYEAR, 1, 1, 0, 0, 0, 1),
+    datetime(MINYEAR, 2, 28, 23, 59, 59),
+    datetime(MINYEAR, 12, 31, 23, 59, 59, 999999),
+    datetime(1600, 2, 29, 12),
+    datetime(1900, 2, 28, 23, 59),
+    datetime(1900, 3, 1),
+    datetime(1969, 12, 31, 23, 59, 59, 999999),
+    datetime(1970, 1, 1),
+    datetime(2000, 2, 29, 12),
+    datetime(2020, 12, 31),
+    datetime(2021, 1, 3, 23, 59, 59),
+    datetime(2024, 2, 29, 23, 59, 59, 999999),
+    datetime(MAXYEAR, 1, 1),
+    datetime(MAXYEAR, 12, 30, 12),
+    datetime.max,
+)
+
+
+@pytest.fixture(scope="session")
+def boundary_datetimes():
+    """
+    The naive BOUNDARIES instants, as a new list.
+    """
+    return list(BOUNDARIES)
+
+
+@pytest.fixture(scope="session")
+def random_datetimes():
+    """
+    Returns random_datetimes(seed, count, start=datetime.min, end=datetime.max, step=1 microsecond):
+    `count` reproducible datetimes drawn uniformly from [start, end] on multiples of step after start.
+    """
+    def generate(seed, count, start=datetime.min, end=datetime.max, step=timedelta(microseconds=1)):
+        rng = random.Random(seed)
+        steps = (end - start) // step
+        return [start + rng.randrange(steps + 1) * step for _ in range(count)]
+
+    return generate
@@ -0,0 +1,85 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from yamtimes import YamTimes, YamTimesArray, arithmetic
+from yamtimes._civil import EPOCH_ORDINAL, civil_from_days, days_from_civil, months_between, shift_datetime
+
+PERIODS = [
+    dict(months=1), dict(months=-1), dict(months=13), dict(years=1), dict(years=-4), dict(years=3, months=-25),
+    dict(days=45, hours=-3), dict(months=1, days=1), dict(years=-1, months=11, days=-30, hours=5, minutes=7, seconds=9),
+]
+
+
+@pytest.fixture(scope="module")
+def datetimes(random_datetimes):
+    values = [datetime(2024, 1, 31, 10), datetime(2024, 2, 29), datetime(2023, 3, 31, 23, 59), datetime(2000, 12, 31)]
+    return values + random_datetimes(2, 500, datetime(1800, 1, 1), datetime(2200, 1, 1), timedelta(seconds=1))
+
+
+def test_civil_kernels():
+    for ordinal in list(range(1, 800)) + list(range(700000, 740000, 7)) + list(range(3651000, 3652060)):
+        expected = date.fromordinal(ordinal)
+        days = ordinal - EPOCH_ORDINAL
+        assert civil_from_days(days) == (expected.year, expected.month, expected.day)
+        assert days_from_civil(expected.year, expected.month, expected.day) == days
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_shift_matches_relativedelta(datetimes, period):
+    expected = [dt + relativedelta(**period) for dt in datetimes]
+    assert [shift_datetime(dt, **period) for dt in datetimes] == expected
+    assert arithmetic.shift(datetimes, **period) == expected
+    assert arithmetic.shift(YamTimesArray(datetimes), **period).to_datetimes() == expected
+    assert YamTimesArray(datetimes).shift(**period).to_datetimes() == expected
+
+
+@pytest.mark.parametrize("months", [-13, -1, 1, 11, 1200])
+def test_month_and_year_methods(datetimes, months):
+    for dt in datetimes[:50]:
+        instant = YamTimes(dt=dt)
+        assert instant.add_months(months).datetime == dt + relativedelta(months=months)
+        assert instant.subtract_months(months).datetime == dt - relativedelta(months=months)
+        assert instant.add_years(months // 12).datetime == dt + relativedelta(years=months // 12)
+    assert YamTimesArray(datetimes).add_months(months).to_datetimes() == [dt + relativedelta(months=months) for dt in datetimes]
+    assert arithmetic.add_years([YamTimes(dt=dt) for dt in datetimes[:10]], 3) == [
+        YamTimes(dt=dt + relativedelta(years=3)) for dt in datetimes[:10]
+    ]
+
+
+def test_per_instant_months(datetimes):
+    steps = [index % 37 - 18 for index in range(len(datetimes))]
+    assert YamTimesArray(datetimes).add_months(steps).to_datetimes() == [
+        dt + relativedelta(months=step) for dt, step in zip(datetimes, steps)
+    ]
+    for wrong in (steps[:-1], steps + [1], [1]):
+        with pytest.raises(ValueError):
+            YamTimesArray(datetimes).add_months(wrong)
+
+
+def test_months_between(datetimes):
+    rng = random.Random(9)
+    for start in datetimes[:200]:
+        end = rng.choice(datetimes)
+        delta = relativedelta(end, start)
+        assert months_between(start, end) == delta.years * 12 + delta.months, (start, end)
+
+
+@pytest.mark.parametrize("months", [-13, -1, 1, 11, 12])
+def test_month_arithmetic_at_the_ends_of_the_range(boundary_datetimes, months):
+    # Results inside the datetime range are exact; results outside it raise instead of wrapping.
+    for dt in boundary_datetimes:
+        try:
+            expected = dt + relativedelta(months=months)
+        except ValueError:
+            with pytest.raises(ValueError):
+                YamTimes(dt=dt).add_months(months)
+            with pytest.raises((ValueError, OverflowError)):
+                YamTimesArray([dt]).add_months(months).to_datetimes()
+            continue
+        assert YamTimes(dt=dt).add_months(months).datetime == expected, dt
+        assert YamTimesArray([dt]).add_months(months).to_datetimes() == [expected], dt
+    assert YamTimes(dt=datetime(9999, 11, 30)).add_months(1).datetime == datetime(9999, 12, 30)
+    assert YamTimes(dt=datetime(1, 3, 31)).add_months(-1).datetime == datetime(1, 2, 28)
@@ -0,0 +1,145 @@
+import pickle
+import random
+import struct
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from dateutil import tz
+
+from yamtimes import YamTimes, YamTimesArray
+from yamtimes.binary import decode_many, encode_many, pack_datetime, unpack_datetime
+
+DATETIMES = [
+    datetime(2024, 3, 15, 12, 30, 5, 123456),
+    datetime(1, 1, 1),
+    datetime(9999, 12, 31, 23, 59, 59, 999999),
+    datetime(1969, 12, 31, 23, 59, 59, 999999),
+    datetime(2024, 11, 3, 1, 30, fold=1),
+    datetime(2024, 11, 3, 1, 30, tzinfo=ZoneInfo("America/New_York"), fold=1),
+    datetime(2024, 1, 1, tzinfo=timezone.utc),
+    datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=-3, minutes=-30))),
+    datetime(2024, 1, 1, tzinfo=timezone(timedelta(seconds=1, microseconds=5))),
+    datetime.max.replace(tzinfo=timezone(timedelta(hours=-1))),
+    datetime.min.replace(tzinfo=timezone(timedelta(hours=14))),
+]
+
+MIN_MICROS = (datetime(1, 1, 1) - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+MAX_MICROS = (datetime(9999, 12, 31, 23, 59, 59, 999999) - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+
+
+def _reference_encoding(micros):
+    # Version byte, varint count, then the zigzag-encoded varint of every delta.
+    def varint(value):
+        out = bytearray()
+        while True:
+            out.append(value & 0x7F | (0x80 if value > 0x7F else 0))
+            value >>= 7
+            if not value:
+                return out
+
+    out = bytearray([1]) + varint(len(micros))
+    previous = 0
+    for value in micros:
+        delta = value - previous
+        previous = value
+        out += varint(delta * 2 if delta >= 0 else -delta * 2 - 1)
+    return bytes(out)
+
+
+@pytest.mark.parametrize("dt", DATETIMES)
+def test_pack_round_trip(dt):
+    packed = pack_datetime(dt)
+    assert packed[:8] == struct.pack("<q", (dt.replace(tzinfo=None) - datetime(1970, 1, 1)) // timedelta(microseconds=1))
+    for data in (packed, bytearray(packed), memoryview(packed)):
+        back = unpack_datetime(data)
+        assert back.replace(tzinfo=None) == dt.replace(tzinfo=None)
+        assert back.fold == dt.fold
+        assert back.utcoffset() == dt.utcoffset()
+        assert back.tzname() == dt.tzname()
+    assert len(packed) == 8 if dt.tzinfo is None and not dt.fold else len(packed) > 8
+
+
+@pytest.mark.parametrize("dt", DATETIMES)
+def test_yamtimes_bytes_and_pickle(dt):
+    # Aware datetimes are compared by wall time and offset: an ambiguous wall time with fold=1 is never
+    # equal to one in another tzinfo object (PEP 495), a ZoneInfo comes back as the compiled zone of its
+    # key, and the ends of the range have no UTC equivalent.
+    def key(value):
+        return value.replace(tzinfo=None), value.utcoffset(), value.fold
+
+    instant = YamTimes(dt=dt)
+    assert key(YamTimes.from_bytes(instant.to_bytes()).datetime) == key(dt)
+    assert key(pickle.loads(pickle.dumps(instant)).datetime) == key(dt)
+
+
+def test_zone_keys_come_back_as_compiled_zones():
+    instant = YamTimes(dt=datetime(2024, 1, 1), tz="Europe/Lisbon")
+    assert YamTimes.from_bytes(instant.to_bytes()).datetime.tzinfo is instant.datetime.tzinfo
+
+
+def test_zones_without_keys_are_rejected():
+    with pytest.raises(ValueError):
+        pack_datetime(datetime(2024, 1, 1, tzinfo=tz.tzlocal()))
+
+
+@pytest.mark.parametrize("data", [b"", b"1234567", b"12345678\x05", b"12345678\x02abc", b"12345678\x01",
+                                  struct.pack("<q", 2 ** 63 - 1)])
+def test_unpack_invalid(data):
+    with pytest.raises(ValueError):
+        unpack_datetime(data)
+
+
+def _sequences():
+    rng = random.Random(3)
+    base = 1_700_000_000_000_000
+    return [
+        [],
+        [0],
+        [base],
+        [base + index * 37_000_000 for index in range(10000)],
+        sorted(rng.randrange(base, base + 10 ** 12) for _ in range(2000)),
+        [rng.randint(MIN_MICROS, MAX_MICROS) for _ in range(2000)],
+        [MIN_MICROS, MAX_MICROS, MIN_MICROS],
+    ]
+
+
+@pytest.mark.parametrize("micros", _sequences())
+def test_encode_many_matches_reference(micros):
+    encoded = encode_many(micros)
+    assert encoded == _reference_encoding(micros)
+    assert YamTimesArray.from_micros(micros).to_bytes() == encoded
+    assert list(decode_many(encoded).micros) == micros
+    assert list(YamTimesArray.from_bytes(memoryview(encoded)).micros) == micros
+
+
+def test_encode_many_round_trips_the_boundaries(boundary_datetimes):
+    assert decode_many(encode_many(boundary_datetimes)).to_datetimes() == boundary_datetimes
+
+
+def test_encode_many_accepts_instants():
+    instants = [YamTimes(dt=datetime(2024, 1, 1)), datetime(2024, 1, 2, 3), datetime(2023, 12, 31, 23, 59)]
+    assert decode_many(encode_many(instants)).to_datetimes() == [
+        datetime(2024, 1, 1), datetime(2024, 1, 2, 3), datetime(2023, 12, 31, 23, 59),
+    ]
+
+
+@pytest.mark.parametrize("zone", [timezone.utc, timezone(timedelta(hours=5))])
+def test_encode_many_rejects_aware_instants(zone):
+    with pytest.raises(ValueError):
+        encode_many([datetime(2024, 1, 1), datetime(2024, 1, 1, tzinfo=zone)])
+    with pytest.raises(ValueError):
+        encode_many([YamTimes(dt=datetime(2024, 1, 1, tzinfo=zone))])
+
+
+def test_sorted_columns_are_compact():
+    micros = [1_700_000_000_000_000 + index * 5_000_000 for index in range(10000)]
+    # Four bytes per delta, plus the header and the full first value.
+    assert len(encode_many(micros)) <= 4 * len(micros) + 16
+
+
+@pytest.mark.parametrize("mangle", [lambda data: data[:-1], lambda data: data + b"\x00",
+                                    lambda data: b"\x02" + data[1:], lambda data: b""])
+def test_decode_many_invalid(mangle):
+    with pytest.raises(ValueError):
+        decode_many(mangle(encode_many([1_700_000_000_000_000 + index for index in range(100)])))
@@ -0,0 +1,121 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from yamtimes import YamTimes
+from yamtimes.business import BusinessCalendar
+from yamtimes.holidays import holidays_between
+
+HOLIDAYS = [date(2024, 1, 1), date(2024, 1, 15), date(2024, 7, 4), date(2024, 7, 6), date(2024, 12, 25),
+            date(2025, 1, 1), date(1969, 12, 31), date(1969, 12, 29)]
+WEEKMASKS = ["1111100", "0111111", "Sun Mon Tue Wed Thu", "1010101", [1, 0, 0, 0, 0, 0, 0]]
+
+
+def _working(weekmask):
+    return BusinessCalendar(weekmask).weekmask
+
+
+def _is_business(day, weekmask, holidays):
+    return _working(weekmask)[day.weekday()] and day not in holidays
+
+
+def _step(day, weekmask, holidays, direction):
+    day += timedelta(days=direction)
+    while not _is_business(day, weekmask, holidays):
+        day += timedelta(days=direction)
+    return day
+
+
+@pytest.fixture(scope="module")
+def days(random_datetimes):
+    days = [date(2024, 1, 1) + timedelta(days=offset) for offset in range(-10, 380)]
+    days += [date(1969, 12, 20) + timedelta(days=offset) for offset in range(20)]
+    days += [dt.date() for dt in random_datetimes(7, 100, datetime(1900, 1, 1), datetime(2100, 1, 1), timedelta(days=1))]
+    return days
+
+
+@pytest.mark.parametrize("weekmask", WEEKMASKS)
+def test_single_steps_match_day_by_day_walk(days, weekmask):
+    holidays = set(HOLIDAYS)
+    calendar = BusinessCalendar(weekmask, HOLIDAYS)
+    for day in days:
+        business = _is_business(day, weekmask, holidays)
+        assert calendar.is_business_day(day) == business, day
+        following = _step(day, weekmask, holidays, 1)
+        preceding = _step(day, weekmask, holidays, -1)
+        assert calendar.next_business_day(day) == following, day
+        assert calendar.previous_business_day(day) == preceding, day
+        assert calendar.roll_forward(day) == (day if business else following), day
+        assert calendar.roll_backward(day) == (day if business else preceding), day
+
+
+@pytest.mark.parametrize("weekmask", WEEKMASKS)
+def test_offsets_and_counts_match_day_by_day_walk(weekmask):
+    holidays = set(HOLIDAYS)
+    calendar = BusinessCalendar(weekmask, HOLIDAYS)
+    start = date(2023, 12, 20)
+    for days in range(-30, 31):
+        for roll, direction in (("forward", 1), ("backward", -1)):
+            expected = start if _is_business(start, weekmask, holidays) else _step(start, weekmask, holidays, direction)
+            for _ in range(abs(days)):
+                expected = _step(expected, weekmask, holidays, 1 if days > 0 else -1)
+            assert calendar.add_business_days(start, days, roll=roll) == expected, (days, roll)
+    for end in (start + timedelta(days=offset) for offset in range(-40, 400, 3)):
+        low, high = min(start, end), max(start, end)
+        count = sum(_is_business(low + timedelta(days=offset), weekmask, holidays) for offset in range((high - low).days))
+        assert calendar.business_days_between(start, end) == (count if end >= start else -count), end
+
+
+def test_ends_of_the_range():
+    # date.min is a Monday and date.max a Friday.
+    calendar = BusinessCalendar()
+    assert calendar.next_business_day(date(9999, 12, 30)) == date.max
+    assert calendar.previous_business_day(date(1, 1, 2)) == date.min
+    assert calendar.roll_forward(date.max) == date.max and calendar.roll_backward(date.min) == date.min
+    assert calendar.add_business_days(date(9999, 12, 27), 4) == date.max
+    assert calendar.add_business_days(date(1, 1, 3), -2) == date.min
+    weeks, days = divmod((date.max - date.min).days, 7)
+    assert calendar.business_days_between(date.min, date.max) == weeks * 5 + days
+    assert calendar.business_days_between(datetime.max, datetime.min) == -(weeks * 5 + days)
+    for step in (lambda: calendar.next_business_day(date.max), lambda: calendar.previous_business_day(date.min),
+                 lambda: calendar.add_business_days(date(9999, 12, 27), 5),
+                 lambda: calendar.add_business_days(date(1, 1, 3), -3),
+                 lambda: calendar.next_business_day(datetime.max)):
+        with pytest.raises(ValueError):
+            step()
+    assert BusinessCalendar.for_country("US", 9998, 9999).is_business_day(date.max)
+    assert not BusinessCalendar.for_country("US", 1, 2).is_business_day(date.min)
+
+
+def test_types_and_time_of_day_are_kept():
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+    assert calendar.next_business_day(datetime(2024, 7, 3, 17, 45)) == datetime(2024, 7, 5, 17, 45)
+    assert calendar.next_business_day(date(2024, 7, 3)) == date(2024, 7, 5)
+    moved = calendar.add_business_days(YamTimes(2024, 7, 3, 9, 30), 2)
+    assert isinstance(moved, YamTimes)
+    assert moved.datetime.replace(second=0, microsecond=0) == datetime(2024, 7, 8, 9, 30)
+
+
+def test_for_country_uses_observed_holidays():
+    calendar = BusinessCalendar.for_country("US", 2020, 2030)
+    for holiday in holidays_between(date(2020, 1, 1), date(2030, 12, 31), "US"):
+        assert not calendar.is_business_day(holiday)
+
+
+def test_yamtimes_business_day_methods():
+    calendar = BusinessCalendar(holidays=[date(2024, 7, 5)])
+    thursday = YamTimes(2024, 7, 4, 12, 0)
+    assert thursday.next_business_day().datetime.date() == date(2024, 7, 5)
+    assert thursday.next_business_day(calendar).datetime.date() == date(2024, 7, 8)
+    assert thursday.business_days_until(YamTimes(2024, 7, 11, 12, 0), calendar) == 4
+
+
+@pytest.mark.parametrize("weekmask", ["1111111x", "0000000", "Mon Funday", [1, 1]])
+def test_invalid_weekmasks(weekmask):
+    with pytest.raises(ValueError):
+        BusinessCalendar(weekmask)
+
+
+def test_invalid_roll():
+    with pytest.raises(ValueError):
+        BusinessCalendar().add_business_days(date(2024, 1, 6), 1, roll="sideways")
@@ -0,0 +1,68 @@
+import calendar
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from yamtimes import YamTimes
+from yamtimes._civil import (
+    civil_from_days,
+    day_of_year_from_days,
+    days_from_civil,
+    iso_week_from_days,
+    iso_week_number,
+    iso_week_year,
+    ordinal_day,
+    weekday_from_days,
+    year_table,
+)
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@pytest.fixture(scope="module")
+def dates(random_datetimes):
+    # Every day around a few year ends, plus random days across the whole supported range.
+    dates = [date(year, 12, 20) + timedelta(days=days) for year in (1, 1999, 2004, 2015, 2020, 2026, 9998)
+             for days in range(20)]
+    dates += [date(1, 1, 1), date(9999, 12, 31), date(1600, 2, 29), date(1900, 2, 28), date(1900, 3, 1)]
+    dates += [dt.date() for dt in random_datetimes(12, 5000, step=timedelta(days=1))]
+    return dates
+
+
+def test_day_counts_match_date(dates):
+    for day in dates:
+        days = day.toordinal() - EPOCH_ORDINAL
+        assert days_from_civil(day.year, day.month, day.day) == days
+        assert civil_from_days(days) == (day.year, day.month, day.day)
+        assert weekday_from_days(days) == day.weekday()
+        assert day_of_year_from_days(days) == day.timetuple().tm_yday
+        assert iso_week_from_days(days) == tuple(day.isocalendar())[:2]
+
+
+def test_tables_match_date(dates):
+    for day in dates:
+        year, week, _ = day.isocalendar()
+        assert iso_week_number(day.year, day.month, day.day) == week, day
+        assert iso_week_year(day.year, day.month, day.day) == year, day
+        assert ordinal_day(day.year, day.month, day.day) == day.timetuple().tm_yday, day
+
+
+@pytest.mark.parametrize("year", list(range(1, 30)) + list(range(1890, 2110)) + [9997, 9998])
+def test_year_table_matches_calendar(year):
+    table = year_table(year)
+    assert table.leap == calendar.isleap(year)
+    assert table.month_lengths == tuple(calendar.monthrange(year, month)[1] for month in range(1, 13))
+    assert table.month_offsets == tuple(date(year, month, 1).timetuple().tm_yday - 1 for month in range(1, 13))
+    assert table.jan1_weekday == date(year, 1, 1).weekday()
+    assert table.iso_weeks == date(year, 12, 28).isocalendar()[1]
+
+
+def test_yamtimes_accessors_match_date(dates):
+    for day in dates[::5]:
+        instant = YamTimes(dt=datetime(day.year, day.month, day.day, 12))
+        year, week, _ = day.isocalendar()
+        assert (instant.week_number(), instant.iso_week_year()) == (week, year), day
+        assert instant.day_of_year() == day.timetuple().tm_yday
+        assert instant.days_in_month() == calendar.monthrange(day.year, day.month)[1]
+        assert instant.is_leap_year() == calendar.isleap(day.year)
+        assert instant.weeks_in_year() == date(day.year, 12, 28).isocalendar()[1]
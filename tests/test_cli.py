@@ -0,0 +1,104 @@
+import csv
+import json
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from yamtimes.cli import ConversionError, Converter, convert_csv_chunk, main
+
+INPUT_FORMAT = "%d/%m/%Y %H:%M:%S"
+
+
+@pytest.fixture(scope="module")
+def stamps(random_datetimes):
+    stamps = [datetime(2024, 3, 10, 1, 59, 59), datetime(2024, 11, 3, 1, 30), datetime(2023, 12, 31, 23, 59, 59)]
+    start = datetime(2015, 1, 1)
+    stamps += random_datetimes(20, 300, start, start + timedelta(seconds=4 * 10 ** 8), timedelta(seconds=1))
+    # Log files repeat timestamps.
+    return stamps + stamps[:50]
+
+
+def _expected(dt, truncate=None):
+    # The same conversion with datetime: the values are UTC, shown in New York.
+    local = dt.replace(tzinfo=ZoneInfo("UTC")).astimezone(ZoneInfo("America/New_York"))
+    if truncate == "hour":
+        local = local.replace(minute=0, second=0)
+    return local.isoformat()
+
+
+def test_converter_matches_datetime(stamps):
+    converter = Converter(INPUT_FORMAT, "iso", "UTC", "America/New_York")
+    hourly = Converter(INPUT_FORMAT, "iso", "UTC", "America/New_York", truncate="hour")
+    for dt in stamps:
+        text = dt.strftime(INPUT_FORMAT)
+        assert converter.convert(text) == _expected(dt)
+        assert hourly.convert(text) == _expected(dt, "hour")
+    formatted = Converter("iso", "%Y-%m-%d %H:%M")
+    assert [formatted.convert(dt.isoformat()) for dt in stamps] == [dt.strftime("%Y-%m-%d %H:%M") for dt in stamps]
+    with pytest.raises(ValueError):
+        Converter(to_zone="UTC").convert("2024-01-01T00:00:00")
+    with pytest.raises(ValueError):
+        Converter(truncate="fortnight")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_csv(tmp_path, stamps, jobs):
+    source = tmp_path / "events.csv"
+    with open(source, "w", newline="") as stream:
+        writer = csv.writer(stream)
+        writer.writerow(["id", "created_at", "note"])
+        writer.writerows([index, dt.strftime(INPUT_FORMAT), "a, b"] for index, dt in enumerate(stamps))
+    target = tmp_path / "converted.csv"
+    assert main(["convert", str(source), "-o", str(target), "-c", "created_at", "--input-format", INPUT_FORMAT,
+                 "--from-zone", "UTC", "--to-zone", "America/New_York", "--chunk-size", "17", "-j", str(jobs)]) == 0
+    with open(target, newline="") as stream:
+        rows = list(csv.reader(stream))
+    assert rows == [["id", "created_at", "note"]] + [[str(index), _expected(dt), "a, b"] for index, dt in enumerate(stamps)]
+
+
+@pytest.mark.parametrize("on_error, kept", [("skip", False), ("keep", True)])
+def test_jsonl(tmp_path, stamps, on_error, kept):
+    lines = [json.dumps({"id": index, "at": dt.strftime(INPUT_FORMAT)}) for index, dt in enumerate(stamps)]
+    lines[5] = json.dumps({"id": 5, "at": "not a date"})
+    lines[9] = "{broken"
+    source = tmp_path / "events.jsonl"
+    source.write_text("\n".join(lines) + "\n\n")
+    target = tmp_path / "converted.jsonl"
+    assert main(["convert", str(source), "-o", str(target), "-c", "at", "--input-format", INPUT_FORMAT,
+                 "--from-zone", "UTC", "--to-zone", "America/New_York", "--truncate", "hour",
+                 "--on-error", on_error, "--chunk-size", "7"]) == 0
+    expected = []
+    for index, dt in enumerate(stamps):
+        if index in (5, 9):
+            if kept:
+                expected.append(lines[index])
+            continue
+        expected.append(json.dumps({"id": index, "at": _expected(dt, "hour")}))
+    assert target.read_text().splitlines() == expected
+
+
+def test_ends_of_the_range():
+    converter = Converter("iso", "iso", "UTC", "America/New_York", truncate="day")
+    assert converter.convert("9999-12-31T23:59:59.999999") == "9999-12-31T00:00:00-05:00"
+    # Instants whose local time falls outside the datetime range are conversion errors.
+    rows = [["0001-01-01T00:00:00"], ["9999-12-31T23:59:59.999999"], ["0001-01-01T12:00:00"]]
+    options = ("iso", "iso", "UTC", "America/New_York", None, 1)
+    assert convert_csv_chunk(options, 0, "skip", rows, 2) == [
+        ["9999-12-31T18:59:59.999999-05:00"], ["0001-01-01T07:03:58-04:56:02"],
+    ]
+    with pytest.raises(ConversionError, match="record 2"):
+        convert_csv_chunk(options, 0, "raise", rows, 2)
+    with pytest.raises(ConversionError, match="record 3"):
+        convert_csv_chunk(("iso", "iso", "UTC", "Asia/Tokyo", None, 1), 0, "raise", rows, 2)
+
+
+def test_errors(tmp_path, capsys):
+    source = tmp_path / "events.csv"
+    source.write_text("at\n2024-01-01T00:00:00\nnot a date\n")
+    with pytest.raises(ConversionError, match="record 3"):
+        convert_csv_chunk(("iso", "iso", None, None, None, 1), 0, "raise", [["2024-01-01"], ["x"]], 2)
+    assert main(["convert", str(source), "-o", str(tmp_path / "out.csv"), "-c", "at"]) == 1
+    assert "record 3" in capsys.readouterr().err
+    assert main(["convert", str(source), "-c", "at", "--to-zone", "Nowhere/Land"]) == 1
+    assert main(["convert", str(source), "-c", "at", "--chunk-size", "0"]) == 2
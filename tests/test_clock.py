@@ -0,0 +1,123 @@
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from yamtimes import YamTimes
+from yamtimes.clock import (
+    Clock,
+    CoarseClock,
+    FrozenClock,
+    SystemClock,
+    current_datetime,
+    get_clock,
+    set_clock,
+    snapshot,
+    use_clock,
+)
+
+NOON = datetime(2024, 6, 15, 12, tzinfo=timezone.utc)
+
+
+def test_system_clock_matches_datetime_now():
+    assert isinstance(get_clock(), SystemClock)
+    before = datetime.now(timezone.utc)
+    now = current_datetime(timezone.utc)
+    assert before <= now <= datetime.now(timezone.utc)
+    assert abs(current_datetime() - datetime.now()) < timedelta(seconds=1)
+
+
+def test_frozen_clock():
+    clock = FrozenClock(NOON)
+    assert clock.now(timezone.utc) == NOON
+    zone = timezone(timedelta(hours=-5))
+    assert clock.now(zone) == NOON and clock.now(zone).tzinfo is zone
+    assert clock.now() == NOON.astimezone().replace(tzinfo=None)
+    clock.advance(hours=1, minutes=30)
+    assert clock.now(timezone.utc) == NOON + timedelta(hours=1, minutes=30)
+    clock.advance(timedelta(days=-1))
+    assert clock.now(timezone.utc) == NOON + timedelta(days=-1, hours=1, minutes=30)
+    clock.set(YamTimes(dt=NOON))
+    assert clock.now(timezone.utc) == NOON
+    with pytest.raises(TypeError):
+        clock.set("2024-06-15")
+
+
+def test_frozen_clock_at_the_ends_of_the_range_and_across_dst():
+    last = datetime.max.replace(tzinfo=timezone.utc)
+    clock = FrozenClock(last)
+    assert clock.now(timezone.utc) == last
+    with pytest.raises(OverflowError):
+        clock.now(ZoneInfo("Asia/Tokyo"))
+    with pytest.raises(OverflowError):
+        clock.advance(microseconds=1)
+    assert clock.now(timezone.utc) == last
+    first = datetime.min.replace(tzinfo=timezone.utc)
+    clock = FrozenClock(first)
+    with pytest.raises(OverflowError):
+        clock.advance(microseconds=-1)
+    assert clock.now(timezone.utc) == first
+    # Advancing through a fall-back night reads the repeated hour with its fold.
+    new_york = ZoneInfo("America/New_York")
+    clock = FrozenClock(datetime(2024, 11, 3, 5, 30, tzinfo=timezone.utc))
+    assert clock.now(new_york) == datetime(2024, 11, 3, 1, 30, tzinfo=new_york) and clock.now(new_york).fold == 0
+    clock.advance(hours=1)
+    assert clock.now(new_york).fold == 1 and clock.now(timezone.utc) == datetime(2024, 11, 3, 6, 30, tzinfo=timezone.utc)
+    assert FrozenClock(clock.now(new_york)).now(timezone.utc) == datetime(2024, 11, 3, 6, 30, tzinfo=timezone.utc)
+
+
+def test_use_clock_restores_the_previous_clock():
+    previous = get_clock()
+    with use_clock(FrozenClock(NOON)) as clock:
+        assert get_clock() is clock
+        assert YamTimes(dt=NOON - timedelta(seconds=1)).is_past()
+        assert YamTimes(dt=NOON + timedelta(seconds=1)).is_future()
+        assert YamTimes(dt=NOON).now().datetime == NOON
+        with pytest.raises(RuntimeError):
+            with use_clock(FrozenClock(NOON + timedelta(days=1))):
+                assert current_datetime(timezone.utc) == NOON + timedelta(days=1)
+                raise RuntimeError
+        assert current_datetime(timezone.utc) == NOON
+    assert get_clock() is previous
+
+
+def test_set_clock_none_restores_the_system_clock():
+    previous = set_clock(FrozenClock(NOON))
+    try:
+        assert set_clock(None).now(timezone.utc) == NOON
+        assert isinstance(get_clock(), SystemClock)
+    finally:
+        set_clock(previous)
+
+
+def test_snapshot_freezes_the_current_reading():
+    source = FrozenClock(NOON)
+    with use_clock(source):
+        with snapshot():
+            source.advance(hours=5)
+            assert current_datetime(timezone.utc) == NOON
+        assert current_datetime(timezone.utc) == NOON + timedelta(hours=5)
+
+
+def test_coarse_clock_reuses_readings():
+    class CountingClock(Clock):
+        def __init__(self):
+            self.reads = 0
+
+        def now(self, tz=None):
+            self.reads += 1
+            return NOON + timedelta(seconds=self.reads)
+
+    source = CountingClock()
+    clock = CoarseClock(granularity=60, source=source)
+    readings = {clock.now(timezone.utc) for _ in range(1000)}
+    assert readings == {NOON + timedelta(seconds=1)} and source.reads == 1
+    clock.refresh()
+    assert clock.now(timezone.utc) == NOON + timedelta(seconds=2)
+    expiring = CoarseClock(granularity=0.01, source=source)
+    first = expiring.now(timezone.utc)
+    time.sleep(0.02)
+    assert expiring.now(timezone.utc) > first
+    with pytest.raises(ValueError):
+        CoarseClock(granularity=-1)
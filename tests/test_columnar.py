@@ -0,0 +1,76 @@
+import calendar
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from yamtimes import YamTimes, YamTimesArray
+
+
+@pytest.fixture(scope="module")
+def datetimes(boundary_datetimes, random_datetimes):
+    return boundary_datetimes + random_datetimes(5, 2000)
+
+
+def test_round_trip(datetimes):
+    times = YamTimesArray(datetimes)
+    assert len(times) == len(datetimes)
+    assert times.to_datetimes() == datetimes
+    assert [instant.datetime for instant in times] == datetimes
+    assert times[3].datetime == datetimes[3]
+    assert times[10:20].to_datetimes() == datetimes[10:20]
+    assert YamTimesArray.from_micros(times.micros).to_datetimes() == datetimes
+
+
+def test_mixed_inputs():
+    values = [YamTimes(dt=datetime(2024, 5, 6, 7, 8)), datetime(2024, 5, 6), date(2024, 5, 7), 0]
+    assert YamTimesArray(values).to_datetimes() == [
+        datetime(2024, 5, 6, 7, 8), datetime(2024, 5, 6), datetime(2024, 5, 7), datetime(1970, 1, 1),
+    ]
+
+
+def test_calendar_fields(datetimes):
+    times = YamTimesArray(datetimes)
+    assert list(times.year()) == [dt.year for dt in datetimes]
+    assert list(times.month()) == [dt.month for dt in datetimes]
+    assert list(times.day_of_month()) == [dt.day for dt in datetimes]
+    assert list(times.weekday_number()) == [dt.weekday() for dt in datetimes]
+    assert [bool(flag) for flag in times.is_weekend()] == [dt.weekday() >= 5 for dt in datetimes]
+    assert [bool(flag) for flag in times.is_weekday()] == [dt.weekday() < 5 for dt in datetimes]
+    assert list(times.day_of_year()) == [dt.timetuple().tm_yday for dt in datetimes]
+    assert list(times.week_number()) == [dt.isocalendar()[1] for dt in datetimes]
+    assert list(times.current_quarter()) == [(dt.month - 1) // 3 + 1 for dt in datetimes]
+    assert times.quarter() == [f"Q{(dt.month - 1) // 3 + 1}" for dt in datetimes]
+    assert [bool(flag) for flag in times.is_leap_year()] == [calendar.isleap(dt.year) for dt in datetimes]
+    assert list(times.days_in_month()) == [calendar.monthrange(dt.year, dt.month)[1] for dt in datetimes]
+
+
+def test_relative_masks():
+    reference = datetime(2024, 5, 15, 12)
+    values = [reference + timedelta(hours=hours) for hours in range(-24 * 400, 24 * 400, 7)]
+    times = YamTimesArray(values)
+    assert [bool(flag) for flag in times.is_past(reference)] == [dt < reference for dt in values]
+    assert [bool(flag) for flag in times.is_future(reference)] == [dt > reference for dt in values]
+    assert [bool(flag) for flag in times.is_today(reference)] == [dt.date() == reference.date() for dt in values]
+    assert [bool(flag) for flag in times.is_in_current_month(reference)] == [
+        (dt.year, dt.month) == (reference.year, reference.month) for dt in values
+    ]
+    assert [bool(flag) for flag in times.is_in_current_week(reference)] == [
+        dt.isocalendar()[:2] == reference.isocalendar()[:2] for dt in values
+    ]
+
+
+@pytest.mark.parametrize("format", ["%Y-%m-%d %H:%M:%S", "%d %B %Y, %I:%M %p", "%Y%m%dT%H%M%S.%f"])
+def test_strings(format):
+    values = [datetime(2024, 1, 1) + timedelta(minutes=97 * index, microseconds=index) for index in range(500)]
+    strings = YamTimesArray(values).to_strings(format)
+    assert strings == [dt.strftime(format) for dt in values]
+    assert YamTimesArray.from_strings(strings, format).to_datetimes() == [
+        datetime.strptime(text, format) for text in strings
+    ]
+
+
+def test_from_iso_strings():
+    strings = ["2024-03-05T07:08:09", b"2024-03-05 07:08:09.250+02:00", "2024-03-05"]
+    assert YamTimesArray.from_iso_strings(strings).to_datetimes() == [
+        datetime(2024, 3, 5, 7, 8, 9), datetime(2024, 3, 5, 7, 8, 9, 250000), datetime(2024, 3, 5),
+    ]
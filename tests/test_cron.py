@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from yamtimes.cron import CronExpression, compile_cron
+
+MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+WEEKDAYS = ("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT")
+
+
+def _field_matches(field, value, low, high, names=()):
+    # A direct reading of one cron field, independent of the bitset compiler.
+    def number(text):
+        return names.index(text.upper()) + low if text.upper() in names else int(text)
+
+    for part in field.split(","):
+        expression, _, step = part.partition("/")
+        step = int(step) if step else 1
+        if expression in ("*", "?"):
+            first, last = low, high
+        elif "-" in expression:
+            first, last = map(number, expression.split("-"))
+        else:
+            first = number(expression)
+            last = high if "/" in part else first
+        if value in range(first, last + 1, step):
+            return True
+    return False
+
+
+def _matches(expression, dt):
+    minute, hour, day, month, weekday = expression.split()
+    if dt.second or dt.microsecond:
+        return False
+    if not (_field_matches(minute, dt.minute, 0, 59) and _field_matches(hour, dt.hour, 0, 23)
+            and _field_matches(month, dt.month, 1, 12, MONTHS)):
+        return False
+    cron_weekday = (dt.weekday() + 1) % 7
+    weekday_match = _field_matches(weekday, cron_weekday, 0, 7, WEEKDAYS) or (
+        cron_weekday == 0 and _field_matches(weekday, 7, 0, 7, WEEKDAYS))
+    day_match = _field_matches(day, dt.day, 1, 31)
+    if not day.startswith(("*", "?")) and not weekday.startswith(("*", "?")):
+        return day_match or weekday_match
+    return day_match and weekday_match
+
+
+EXPRESSIONS = [
+    "* * * * *",
+    "*/15 9-17 * * 1-5",
+    "30 4 1,15 * 5",
+    "0 12 * * SUN",
+    "5/20 */3 10-20/5 JAN-MAR,NOV *",
+    "59 23 * 12 7",
+    "0 0 31 * *",
+    "0 0 29 2 *",
+    "15 10 ? * mon-fri",
+    "0 12 * * */7",
+    "0 0 */16 * 1-5",
+    "0 6 */10 * */2",
+    "0 0 1-31/2 * */3",
+    "0 0 */5 2 *",
+]
+
+
+# Windows around the turn of the year and a leap day, scanned minute by minute.
+WINDOWS = [(datetime(2023, 12, 30, 22, 11), datetime(2024, 1, 3)), (datetime(2024, 2, 27), datetime(2024, 3, 2))]
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_next_and_previous_match_minute_walk(expression):
+    cron = compile_cron(expression)
+    expected = []
+    for minute, end in WINDOWS:
+        while minute < end:
+            if _matches(expression, minute):
+                expected.append(minute)
+            minute += timedelta(minutes=1)
+    fires = []
+    dt = datetime(2023, 12, 30, 22, 10, 17)
+    while dt < WINDOWS[-1][1]:
+        dt = cron.next_fire(dt).datetime
+        fires.append(dt)
+    assert [dt for dt in fires if any(low <= dt < high for low, high in WINDOWS)] == expected
+    for earlier, later in zip(fires, fires[1:]):
+        assert cron.previous_fire(later).datetime == earlier
+        assert cron.matches(later)
+        assert not cron.matches(later + timedelta(seconds=1))
+
+
+def test_sparse_expressions():
+    leap_days = [dt.datetime for dt in compile_cron("0 0 29 2 *").fires_between(datetime(2024, 1, 1), datetime(2033, 1, 1))]
+    assert leap_days == [datetime(2024, 2, 29), datetime(2028, 2, 29), datetime(2032, 2, 29)]
+    # Vixie cron: a restricted day of month and day of week match when either does, so February 30th
+    # does not stop the Mondays of February from firing.
+    mondays = compile_cron("0 0 30 2 1").fires_between(datetime(2024, 1, 1), datetime(2024, 12, 31))
+    assert [dt.datetime.day for dt in mondays] == [5, 12, 19, 26]
+    # A step on * still restricts its field; only the either/both rule looks at the star.
+    assert compile_cron("0 12 * * */7").next_fire(datetime(2023, 6, 23, 13)).datetime == datetime(2023, 6, 25, 12)
+    for expression in ["0 0 */16 * 1-5", "0 0 */10 * */2", "0 0 1-31/3 * */4"]:
+        window = compile_cron(expression).fires_between(datetime(2022, 12, 31), datetime(2024, 1, 1), inclusive=False)
+        fires = [dt.datetime for dt in window]
+        days = [datetime(2023, 1, 1) + timedelta(days=days) for days in range(365)]
+        assert fires == [day for day in days if _matches(expression, day)], expression
+    weekdays = compile_cron("0 0 */16 * 1-5")
+    assert weekdays.next_fire(datetime(2023, 10, 2)).datetime == datetime(2023, 10, 17)
+    assert weekdays.next_fire(datetime(2023, 10, 17)).datetime == datetime(2023, 11, 1)
+    assert compile_cron("0 0 1 1 *").next_fire(datetime(9999, 6, 1)) is None
+    assert compile_cron("0 0 1 1 *").previous_fire(datetime(1, 1, 1)) is None
+
+
+def test_fires_between():
+    daily = compile_cron("@daily")
+    assert len(list(daily.fires_between(datetime(2024, 1, 1), datetime(2024, 1, 3)))) == 3
+    assert len(list(daily.fires_between(datetime(2024, 1, 1), datetime(2024, 1, 3), inclusive=False))) == 1
+
+
+def test_six_fields_and_zones():
+    seconds = compile_cron("*/10 * * * * *")
+    assert seconds.next_fire(datetime(2024, 1, 1, 0, 0, 5, 5)).datetime == datetime(2024, 1, 1, 0, 0, 10)
+    assert seconds.previous_fire(datetime(2024, 1, 1, 0, 0, 10)).datetime == datetime(2024, 1, 1)
+    zone = timezone(timedelta(hours=2))
+    assert compile_cron("@hourly").next_fire(datetime(2024, 1, 1, 5, 30, tzinfo=zone)).datetime == datetime(
+        2024, 1, 1, 6, tzinfo=zone)
+
+
+def test_ends_of_the_range():
+    last_minute = compile_cron("59 23 31 12 *")
+    assert last_minute.next_fire(datetime(9999, 12, 31, 23, 58)).datetime == datetime(9999, 12, 31, 23, 59)
+    seconds = compile_cron("* * * * * *")
+    assert seconds.next_fire(datetime(9999, 12, 31, 23, 59, 58, 5)).datetime == datetime(9999, 12, 31, 23, 59, 59)
+    assert seconds.next_fire(datetime.max) is None
+    assert seconds.previous_fire(datetime(1, 1, 1, 0, 0, 1)).datetime == datetime.min
+    assert seconds.previous_fire(datetime.min) is None
+    assert seconds.matches(datetime.min) and not seconds.matches(datetime.max)
+    daily = compile_cron("@daily")
+    assert [dt.datetime.day for dt in daily.fires_between(datetime(9999, 12, 29), datetime.max)] == [29, 30, 31]
+    assert [dt.datetime.day for dt in daily.fires_between(datetime.min, datetime(1, 1, 3))] == [1, 2, 3]
+
+
+def test_fires_follow_the_wall_clock_across_dst():
+    zone = ZoneInfo("America/New_York")
+    # Fire times are wall-clock times: a repeated hour fires once, a skipped one keeps its wall-clock time.
+    fall_back = compile_cron("30 1 * * *").fires_between(datetime(2024, 11, 2, tzinfo=zone),
+                                                         datetime(2024, 11, 5, tzinfo=zone))
+    assert [dt.datetime for dt in fall_back] == [datetime(2024, 11, day, 1, 30, tzinfo=zone) for day in (2, 3, 4)]
+    spring_forward = compile_cron("30 2 * * *").next_fire(datetime(2024, 3, 10, tzinfo=zone)).datetime
+    assert spring_forward == datetime(2024, 3, 10, 2, 30, tzinfo=zone)
+    assert compile_cron("0 * * * *").next_fire(datetime(2024, 11, 3, 1, 30, fold=1, tzinfo=zone)).datetime == (
+        datetime(2024, 11, 3, 2, tzinfo=zone)
+    )
+
+
+def test_compile_cron_is_cached():
+    assert compile_cron("0 9 * * MON") is compile_cron("0 9 * * MON")
+
+
+@pytest.mark.parametrize("expression", ["0 0 30 2 *", "0 0 30 2 */2", "61 * * * *", "* * *", "*/0 * * * *", "5-1 * * * *", "0 0 * FOO *"])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronExpression(expression)
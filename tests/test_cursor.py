@@ -0,0 +1,125 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from yamtimes import YamTimes
+from yamtimes.cursor import YamCursor
+
+MOVES = [
+    ("add_seconds", 59), ("subtract_seconds", 3601), ("add_minutes", 61), ("subtract_minutes", 1439),
+    ("add_hours", 25), ("subtract_hours", 49), ("add_days", 31), ("subtract_days", 366), ("next_day",),
+    ("previous_day",), ("next_week",), ("last_week",), ("add_months", 1), ("add_months", 13),
+    ("subtract_months", 1), ("add_years", 1), ("subtract_years", 4), ("set_time", 9, 30, 15), ("set_to_midnight",),
+    ("set_to_noon",), ("start_of_week",), ("end_of_week",), ("start_of_month",), ("end_of_month",),
+    ("start_of_year",), ("end_of_year",),
+]
+QUERIES = ["year", "month", "day_of_month", "hour", "minute", "second", "weekday_number", "is_weekend",
+           "is_weekday", "day_of_year", "days_in_month", "is_leap_year"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_moves_match_yamtimes(seed):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 31, 10, 15, 30, 250)
+    cursor = YamCursor(start)
+    instant = YamTimes(dt=start)
+    for _ in range(400):
+        name, *args = rng.choice(MOVES)
+        assert getattr(cursor, name)(*args) is cursor
+        instant = getattr(instant, name)(*args)
+        assert cursor.to_datetime() == instant.datetime, (name, args)
+        for query in QUERIES:
+            assert getattr(cursor, query)() == getattr(instant, query)(), (name, args, query)
+
+
+def test_moves_at_the_ends_of_the_range(boundary_datetimes):
+    for dt in boundary_datetimes:
+        cursor = YamCursor(dt)
+        instant = YamTimes(dt=dt)
+        for query in QUERIES:
+            assert getattr(cursor, query)() == getattr(instant, query)(), (dt, query)
+        for name, *args in MOVES:
+            try:
+                expected = getattr(instant, name)(*args).datetime
+            except (ValueError, OverflowError):
+                # The cursor moves in microseconds and only finds out when it is read back.
+                with pytest.raises((ValueError, OverflowError)):
+                    getattr(YamCursor(dt), name)(*args).to_datetime()
+            else:
+                assert getattr(YamCursor(dt), name)(*args).to_datetime() == expected, (dt, name, args)
+
+
+def test_moves_match_datetime():
+    cursor = YamCursor(datetime(2024, 1, 31, 23, 59, 59))
+    assert cursor.add_months(1).to_datetime() == datetime(2024, 1, 31, 23, 59, 59) + relativedelta(months=1)
+    assert cursor.add_seconds(1).to_datetime() == datetime(2024, 3, 1)
+    assert cursor.end_of_week().to_datetime() == datetime(2024, 3, 3, 23, 59, 59, 999999)
+    assert cursor.start_of_week().to_datetime() == datetime(2024, 2, 26)
+    assert cursor.end_of_year().to_datetime() == datetime(2024, 12, 31, 23, 59, 59, 999999)
+    assert cursor.add_micros(1).to_datetime() == datetime(2025, 1, 1)
+
+
+def test_minute_walk():
+    start = datetime(2023, 12, 31, 22)
+    cursor = YamCursor(start)
+    for minutes in range(0, 3000):
+        expected = start + timedelta(minutes=minutes)
+        assert (cursor.year(), cursor.month(), cursor.day_of_month(), cursor.hour(), cursor.minute()) == (
+            expected.year, expected.month, expected.day, expected.hour, expected.minute)
+        cursor.add_minutes(1)
+
+
+def test_snapshots_and_delegation():
+    zone = timezone(timedelta(hours=-3))
+    cursor = YamCursor(YamTimes(dt=datetime(2024, 7, 4, 8, tzinfo=zone)))
+    snapshot = cursor.to_yamtimes()
+    twin = cursor.copy()
+    cursor.add_days(1)
+    assert snapshot.datetime == datetime(2024, 7, 4, 8, tzinfo=zone)
+    assert twin.to_datetime() == datetime(2024, 7, 4, 8, tzinfo=zone)
+    assert cursor.to_datetime() == datetime(2024, 7, 5, 8, tzinfo=zone)
+    # Methods the cursor does not implement are answered by a YamTimes at its position.
+    assert cursor.is_holiday("US") is False
+    assert cursor.move_to(datetime(2024, 7, 4, tzinfo=zone)).is_holiday("US") is True
+    assert cursor.to_datetime().tzinfo is zone
+
+
+def test_move_to_takes_the_zone_of_the_target():
+    utc, tokyo = timezone.utc, timezone(timedelta(hours=9))
+    cursor = YamCursor(datetime(2024, 1, 1, tzinfo=utc))
+    assert cursor.move_to(YamTimes(dt=datetime(2024, 1, 1, 12, tzinfo=tokyo))).to_datetime() == datetime(
+        2024, 1, 1, 12, tzinfo=tokyo)
+    assert cursor.to_datetime().tzinfo is tokyo
+    assert cursor.move_to(datetime(2024, 1, 2)).to_datetime().tzinfo is None
+    cursor = YamCursor(datetime(2024, 1, 1, tzinfo=utc))
+    assert cursor.move_to(cursor.micros + 1).to_datetime().tzinfo is utc
+
+
+def test_comparisons_work_both_ways():
+    instant = YamTimes(dt=datetime(2024, 5, 6, 7, 8))
+    cursor = YamCursor(instant)
+    assert cursor == instant and instant == cursor
+    assert not (cursor != instant) and not (instant != cursor)
+    later = YamTimes(dt=datetime(2024, 5, 6, 7, 9))
+    assert later != cursor and cursor < later and later > cursor and later >= cursor and cursor <= later
+    assert instant != datetime(2024, 5, 6, 7, 8)
+    with pytest.raises(TypeError):
+        instant < 5
+    assert cursor.__lt__("2024") is NotImplemented
+    with pytest.raises(TypeError):
+        cursor < "2024"
+
+
+def test_aware_comparisons_match_datetime():
+    utc = YamCursor(datetime(2024, 5, 6, 12, tzinfo=timezone.utc))
+    plus_five = datetime(2024, 5, 6, 12, tzinfo=timezone(timedelta(hours=5)))
+    assert utc != YamTimes(dt=plus_five) and utc > plus_five and YamCursor(plus_five) < utc
+    assert utc == YamTimes(dt=datetime(2024, 5, 6, 17, tzinfo=timezone(timedelta(hours=5))))
+    naive = datetime(2024, 5, 6, 12)
+    assert utc != naive and (utc == naive) == (utc.to_datetime() == naive)
+    with pytest.raises(TypeError):
+        utc < naive
+    with pytest.raises(TypeError):
+        YamCursor(naive) >= utc
@@ -0,0 +1,147 @@
+import random
+from datetime import MAXYEAR, MINYEAR, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from yamtimes import YamTimes, YamTimesArray, differences
+
+
+@pytest.fixture(scope="module")
+def pairs(boundary_datetimes, random_datetimes):
+    rng = random.Random(6)
+    pairs = [
+        (datetime(2024, 1, 31), datetime(2024, 2, 29)),
+        (datetime(2024, 1, 15), datetime(2024, 2, 14, 23, 59)),
+        (datetime(2024, 2, 29), datetime(2023, 2, 28)),
+        (datetime(2024, 3, 31, 12), datetime(2024, 2, 29, 12)),
+        (datetime(2020, 1, 1), datetime(2020, 1, 1)),
+        (datetime(1969, 12, 31, 23, 59, 59, 999999), datetime(1970, 1, 1)),
+    ]
+    pairs += zip(boundary_datetimes, reversed(boundary_datetimes))
+    pairs += zip(boundary_datetimes, boundary_datetimes[1:])
+    first = datetime(1800, 1, 1)
+    for start in random_datetimes(6, 1000, first, first + timedelta(microseconds=4 * 10 ** 15)):
+        end = start + timedelta(microseconds=rng.randrange(-10 ** 15, 10 ** 15)) if rng.random() < 0.8 else (
+            start + timedelta(days=rng.randrange(-70, 70), hours=rng.randrange(-30, 30)))
+        pairs.append((start, end))
+    return pairs
+
+
+def _total(delta, unit):
+    # Whole units, rounded toward zero.
+    whole = abs(delta) // unit
+    return whole if delta >= timedelta(0) else -whole
+
+
+REFERENCES = {
+    "seconds_until": lambda start, end: _total(end - start, timedelta(seconds=1)),
+    "minutes_until": lambda start, end: _total(end - start, timedelta(minutes=1)),
+    "hours_until": lambda start, end: _total(end - start, timedelta(hours=1)),
+    "days_until": lambda start, end: (end - start).days,
+    "weeks_between": lambda start, end: (start - end).days // 7,
+    "time_difference_in_seconds": lambda start, end: abs(end - start) // timedelta(seconds=1),
+    "time_difference_in_minutes": lambda start, end: abs(end - start) // timedelta(minutes=1),
+    "time_difference_in_hours": lambda start, end: abs(end - start) // timedelta(hours=1),
+    "time_difference_in_days": lambda start, end: abs(end - start) // timedelta(days=1),
+    "months_until": lambda start, end: (lambda delta: delta.years * 12 + delta.months)(relativedelta(end, start)),
+    "years_until": lambda start, end: relativedelta(end, start).years,
+    "years_difference": lambda start, end: abs(end.year - start.year),
+}
+
+
+@pytest.mark.parametrize("name", sorted(REFERENCES))
+def test_kernels_match_datetime(pairs, name):
+    reference = REFERENCES[name]
+    kernel = getattr(differences, name)
+    expected = [reference(start, end) for start, end in pairs]
+    starts = YamTimesArray([start for start, _ in pairs])
+    ends = YamTimesArray([end for _, end in pairs])
+    assert list(kernel(starts, ends)) == expected
+    assert [kernel(start, end) for start, end in pairs[:100]] == expected[:100]
+    # One reference broadcast against many instants, in both positions.
+    anchor = pairs[0][0]
+    assert list(kernel(anchor, ends)) == [reference(anchor, end) for _, end in pairs]
+    assert list(kernel(starts, anchor)) == [reference(start, anchor) for start, _ in pairs]
+
+
+@pytest.mark.parametrize("name", ["seconds_until", "days_until", "hours_until", "months_until", "years_until",
+                                  "time_difference_in_seconds", "time_difference_in_minutes",
+                                  "time_difference_in_hours", "time_difference_in_days"])
+def test_yamtimes_methods_agree(pairs, name):
+    for start, end in pairs[:200]:
+        assert getattr(YamTimes(dt=start), name)(YamTimes(dt=end)) == getattr(differences, name)(start, end)
+
+
+def test_extremes_are_exact():
+    first, last = datetime(MINYEAR, 1, 1), datetime(MAXYEAR, 12, 31, 23, 59, 59, 999999)
+    seconds = (last - first) // timedelta(seconds=1)
+    assert seconds == 315537897599
+    for start, end, sign in ((first, last, 1), (last, first, -1)):
+        assert YamTimes(dt=start).seconds_until(YamTimes(dt=end)) == differences.seconds_until(start, end) == sign * seconds
+        assert YamTimes(dt=start).time_difference_in_seconds(YamTimes(dt=end)) == seconds
+        assert YamTimes(dt=start).hours_until(YamTimes(dt=end)) == sign * (seconds // 3600)
+
+
+def test_rounding_of_scalar_methods():
+    # Whole hours round toward zero; whole days of the absolute difference round down.
+    start = YamTimes(dt=datetime(2024, 1, 2, 12))
+    assert start.hours_until(YamTimes(dt=datetime(2024, 1, 2, 10, 30))) == -1
+    assert start.hours_until(YamTimes(dt=datetime(2024, 1, 3, 13, 30))) == 25
+    assert start.seconds_until(YamTimes(dt=datetime(2024, 1, 2, 11, 59, 59, 500000))) == 0
+    assert start.time_difference_in_days(YamTimes(dt=datetime(2024, 1, 1))) == 1
+    assert start.time_difference_in_days(YamTimes(dt=datetime(2024, 1, 4))) == 1
+    assert start.days_until(YamTimes(dt=datetime(2024, 1, 1))) == -2
+
+
+def test_length_mismatch():
+    with pytest.raises(ValueError):
+        differences.days_until([datetime(2024, 1, 1)] * 2, [datetime(2024, 1, 2)] * 3)
+
+
+@pytest.fixture(scope="module")
+def aware_pairs():
+    rng = random.Random(15)
+    zones = [ZoneInfo("UTC"), ZoneInfo("Asia/Tokyo"), ZoneInfo("America/New_York"), ZoneInfo("Australia/Lord_Howe"),
+             timezone(timedelta(hours=-3, minutes=-30))]
+    pairs = [(datetime(2024, 1, 1, 12, tzinfo=ZoneInfo("UTC")), datetime(2024, 1, 1, 12, tzinfo=ZoneInfo("Asia/Tokyo")))]
+    for _ in range(500):
+        start = datetime(2000, 1, 1) + timedelta(minutes=rng.randrange(15 * 10 ** 6))
+        end = start + timedelta(minutes=rng.randrange(-10 ** 6, 10 ** 6))
+        pairs.append((start.replace(tzinfo=rng.choice(zones)), end.replace(tzinfo=rng.choice(zones))))
+    return pairs
+
+
+@pytest.mark.parametrize("name", sorted(name for name in REFERENCES if hasattr(YamTimes, name)))
+def test_aware_kernels_match_yamtimes(aware_pairs, name):
+    kernel = getattr(differences, name)
+    expected = [getattr(YamTimes(dt=start), name)(YamTimes(dt=end)) for start, end in aware_pairs]
+    assert list(kernel([start for start, _ in aware_pairs], [end for _, end in aware_pairs])) == expected
+    assert [kernel(start, end) for start, end in aware_pairs[:100]] == expected[:100]
+    anchor = aware_pairs[0][0]
+    assert list(kernel(anchor, [end for _, end in aware_pairs])) == [
+        getattr(YamTimes(dt=anchor), name)(YamTimes(dt=end)) for _, end in aware_pairs]
+
+
+def test_aware_across_zones():
+    noon_utc = datetime(2024, 1, 1, 12, tzinfo=ZoneInfo("UTC"))
+    noon_tokyo = datetime(2024, 1, 1, 12, tzinfo=ZoneInfo("Asia/Tokyo"))
+    assert differences.hours_until(noon_utc, noon_tokyo) == YamTimes(dt=noon_utc).hours_until(YamTimes(dt=noon_tokyo)) == -9
+    assert list(differences.hours_until([noon_utc], [noon_tokyo])) == [-9]
+    # Like datetime subtraction, instants in the same zone differ by wall-clock time, folds included.
+    new_york = ZoneInfo("America/New_York")
+    first = datetime(2024, 11, 3, 1, 30, tzinfo=new_york)
+    second = first.replace(fold=1)
+    assert differences.seconds_until(first, second) == list(differences.seconds_until([first], [second]))[0] == 0
+    before, after = datetime(2024, 3, 10, 1, 59, tzinfo=new_york), datetime(2024, 3, 10, 3, tzinfo=new_york)
+    assert differences.minutes_until(before, after) == (after - before) // timedelta(minutes=1) == 61
+    assert differences.minutes_until(before, after.astimezone(ZoneInfo("UTC"))) == 1
+    utc = ZoneInfo("UTC")
+    assert list(differences.days_until([datetime.min.replace(tzinfo=utc)], datetime.max.replace(tzinfo=utc))) == [
+        (datetime.max - datetime.min).days
+    ]
+    with pytest.raises(TypeError):
+        differences.hours_until(noon_utc, datetime(2024, 1, 1))
+    with pytest.raises(TypeError):
+        differences.hours_until([noon_utc, datetime(2024, 1, 1)], datetime(2024, 1, 2))
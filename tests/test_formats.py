@@ -0,0 +1,169 @@
+from datetime import datetime
+
+import pytest
+
+from yamtimes import YamTimes
+from yamtimes.formats import compile_format
+
+INSTANTS = [
+    datetime(2024, 3, 5, 7, 8, 9, 12),
+    datetime(2024, 12, 31, 23, 59, 59, 999999),
+    datetime(2023, 1, 1, 0, 0, 0),
+    datetime(1999, 7, 4, 12, 30, 0, 500000),
+    datetime(2024, 2, 29, 13, 0, 1),
+    datetime(987, 6, 15, 18, 45, 30),
+    datetime(1, 1, 1),
+]
+
+FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%d/%m/%Y",
+    "%m/%d/%y %I:%M %p",
+    "%A, %d %B %Y",
+    "%a %b %d %H:%M",
+    "%j %u %w",
+    "%Y%m%d%H%M%S",
+    "%-d/%-m/%Y",
+    "%-H:%M",
+    "%_d %b",
+    "%U %W %c",
+    "100%% %Y",
+    "plain text",
+    "",
+]
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_format_matches_strftime(format, boundary_datetimes):
+    compiled = compile_format(format)
+    for dt in INSTANTS + boundary_datetimes:
+        assert compiled.format(dt) == dt.strftime(format), dt
+
+
+@pytest.mark.parametrize("format", ["%-d/%-m/%Y", "%d.%m.%Y %H:%M"])
+def test_yamtimes_formatting_matches_strftime(format):
+    dt = datetime(2024, 3, 5, 7, 8)
+    instant = YamTimes(dt=dt)
+    assert instant.to_string(format) == dt.strftime(format)
+    assert f"{instant:{format}}" == dt.strftime(format)
+
+
+PARSE_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d",
+    "%d/%m/%Y %H:%M",
+    "%m/%d/%y %I:%M %p",
+    "%A, %d %B %Y",
+    "%b %d %Y",
+    "%Y %j",
+    "%Y%m%d%H%M%S",
+    "%d/%m/%Y %U",
+]
+
+
+@pytest.mark.parametrize("format", PARSE_FORMATS)
+def test_parse_matches_strptime(format):
+    compiled = compile_format(format)
+    for dt in INSTANTS[:5]:
+        text = dt.strftime(format)
+        assert compiled.parse(text) == datetime.strptime(text, format)
+
+
+@pytest.mark.parametrize("text, format", [
+    ("0001-01-01 00:00:00", "%Y-%m-%d %H:%M:%S"),
+    ("9999-12-31T23:59:59.999999", "%Y-%m-%dT%H:%M:%S.%f"),
+    ("9999 365", "%Y %j"),
+    ("31/12/9999 23:59", "%d/%m/%Y %H:%M"),
+    ("5/3/2024 7:08", "%d/%m/%Y %H:%M"),
+    ("2024-3-5", "%Y-%m-%d"),
+    ("05/03/24 7:08 pm", "%d/%m/%y %I:%M %p"),
+    ("2024-03-05 07:08:09.5", "%Y-%m-%d %H:%M:%S.%f"),
+])
+def test_parse_accepts_what_strptime_accepts(text, format):
+    assert compile_format(format).parse(text) == datetime.strptime(text, format)
+
+
+@pytest.mark.parametrize("text, format", [
+    ("2024-13-01", "%Y-%m-%d"),
+    ("2023-02-29", "%Y-%m-%d"),
+    ("2024-03-05x", "%Y-%m-%d"),
+    ("5 March", "%d %m"),
+    ("0000-01-01", "%Y-%m-%d"),
+    ("9999 366", "%Y %j"),
+])
+def test_parse_rejects_what_strptime_rejects(text, format):
+    with pytest.raises(ValueError):
+        datetime.strptime(text, format)
+    with pytest.raises(ValueError):
+        compile_format(format).parse(text)
+
+
+DIFFERENTIAL_FORMATS = PARSE_FORMATS + [
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M",
+    "%j %Y %m %d",
+    "%d %B %j %Y",
+    "%d  %m %Y",
+    "%d\t%m  %Y %H:%M",
+]
+
+
+def _variants(text):
+    # The text, and versions with one character changed, dropped, duplicated or appended.
+    yield text
+    for index, char in enumerate(text):
+        yield text[:index] + text[index + 1:]
+        yield text[:index] + char + text[index:]
+        for replacement in "0 9+Z-:.\t":
+            yield text[:index] + replacement + text[index + 1:]
+    for suffix in ("Z", "+00", "+00:00", "0", " "):
+        yield text + suffix
+
+
+def _outcome(parse, text, format):
+    try:
+        return parse(text, format)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize("format", DIFFERENTIAL_FORMATS)
+def test_parse_differential_against_strptime(format):
+    compiled = compile_format(format)
+    for dt in INSTANTS[:5]:
+        for text in _variants(dt.strftime(format)):
+            expected = _outcome(datetime.strptime, text, format)
+            assert _outcome(lambda text, _: compiled.parse(text), text, format) == expected, text
+
+
+@pytest.mark.parametrize("text, format", [
+    ("2024-01-01 10:00:00.123+00", "%Y-%m-%d %H:%M:%S.%f"),
+    ("2024-01-01 10:00:00.00000Z", "%Y-%m-%d %H:%M:%S.%f"),
+    ("2024-01-01T10:00+0000", "%Y-%m-%dT%H:%M"),
+])
+def test_iso_fast_path_rejects_offsets(text, format):
+    with pytest.raises(ValueError):
+        datetime.strptime(text, format)
+    with pytest.raises(ValueError):
+        compile_format(format).parse(text)
+    with pytest.raises(ValueError):
+        YamTimes().from_string(text, format)
+
+
+@pytest.mark.parametrize("text, format", [
+    ("032 2024 01 01", "%j %Y %m %d"),
+    ("01 02 2024", "%d  %m %Y"),
+    ("01 \t 02\n2024", "%d %m %Y"),
+])
+def test_parse_edge_cases_match_strptime(text, format):
+    assert compile_format(format).parse(text) == datetime.strptime(text, format)
+
+
+def test_names_are_only_looked_up_for_name_directives():
+    numeric = compile_format("%Y-%m-%d %H:%M", "xx_UNKNOWN")
+    assert numeric.format(datetime(2024, 3, 5, 7, 8)) == "2024-03-05 07:08"
+    assert numeric.parse("2024-03-05 07:08") == datetime(2024, 3, 5, 7, 8)
+    assert numeric._locale_names is None
+    assert compile_format("%A %B", "pt_BR").format(datetime(2024, 3, 5)) == "terça-feira março"
@@ -0,0 +1,111 @@
+import calendar
+from datetime import MAXYEAR, MINYEAR, date, datetime, timedelta
+
+import pytest
+from dateutil import easter as dateutil_easter
+
+from yamtimes import YamTimes, holidays
+from yamtimes.holidays import (
+    FixedDate,
+    NthWeekday,
+    easter,
+    holiday_name,
+    holidays_between,
+    holidays_for_year,
+    is_holiday,
+    nearest_weekday,
+    next_monday,
+    register_country,
+    supported_countries,
+)
+
+
+def _nth_weekday(year, month, weekday, n):
+    days = [day for day in calendar.Calendar().itermonthdates(year, month) if day.month == month and day.weekday() == weekday]
+    return days[n - 1] if n > 0 else days[n]
+
+
+def test_easter_matches_dateutil():
+    for year in range(1583, 4100):
+        assert easter(year) == dateutil_easter.easter(year), year
+
+
+def test_observed_shifts():
+    for offset in range(14):
+        day = date(2024, 6, 1) + timedelta(days=offset)
+        weekday = day.weekday()
+        assert nearest_weekday(day) == day + timedelta(days={5: -1, 6: 1}.get(weekday, 0))
+        assert next_monday(day) == day + timedelta(days={5: 2, 6: 1}.get(weekday, 0))
+
+
+@pytest.mark.parametrize("year", range(2015, 2031))
+def test_us_floating_holidays(year):
+    table = holidays_for_year("US", year)
+    expected = {
+        _nth_weekday(year, 1, calendar.MONDAY, 3),
+        _nth_weekday(year, 2, calendar.MONDAY, 3),
+        _nth_weekday(year, 5, calendar.MONDAY, -1),
+        _nth_weekday(year, 9, calendar.MONDAY, 1),
+        _nth_weekday(year, 10, calendar.MONDAY, 2),
+        _nth_weekday(year, 11, calendar.THURSDAY, 4),
+    }
+    assert expected <= set(table)
+    for day in (date(year, 1, 1), date(year, 7, 4), date(year, 11, 11), date(year, 12, 25)):
+        assert day in table
+        if day.weekday() >= 5:
+            assert nearest_weekday(day) in table or nearest_weekday(day).year != year
+    assert (date(year, 6, 19) in table) == (year >= 2021)
+
+
+def test_us_new_year_observed_in_previous_year():
+    # January 1st, 2022 was a Saturday: it is observed on Friday, December 31st, 2021.
+    assert holiday_name(date(2021, 12, 31), "US") == "New Year's Day (observed)"
+    assert is_holiday(YamTimes(2021, 12, 31, 10, 0), "US")
+    assert date(2021, 12, 31) not in holidays_for_year("US", 2022)
+
+
+@pytest.mark.parametrize("year", [2019, 2024, 2025, 2038])
+def test_easter_based_holidays(year):
+    sunday = dateutil_easter.easter(year)
+    assert holiday_name(sunday - timedelta(days=2), "BR") == "Sexta-feira Santa"
+    assert holiday_name(sunday + timedelta(days=1), "GB") == "Easter Monday"
+    assert holiday_name(sunday + timedelta(days=39), "DE") == "Christi Himmelfahrt"
+    assert holiday_name(sunday + timedelta(days=50), "FR") == "Lundi de Pentecôte"
+
+
+def test_gb_substitute_days_do_not_collide():
+    # Christmas 2021 fell on a Saturday and Boxing Day on a Sunday.
+    table = holidays_for_year("GB", 2021)
+    assert table[date(2021, 12, 27)] == "Christmas Day (observed)"
+    assert table[date(2021, 12, 28)] == "Boxing Day (observed)"
+
+
+def test_holidays_between_is_sorted_and_inclusive():
+    days = holidays_between(date(2023, 12, 25), date(2025, 1, 1), "US")
+    assert days == sorted(days)
+    assert days[0] == date(2023, 12, 25) and days[-1] == date(2025, 1, 1)
+    assert all(is_holiday(day, "us") for day in days)
+
+
+def test_register_country(monkeypatch, request):
+    monkeypatch.setattr(holidays, "_COUNTRY_RULES", dict(holidays._COUNTRY_RULES))
+    request.addfinalizer(holidays_for_year.cache_clear)
+    register_country("XX-TEST", [FixedDate("Founders Day", 3, 3, since=2000), NthWeekday("Odd Monday", 8, 0, 2)])
+    assert "XX-TEST" in supported_countries()
+    assert holiday_name(date(2024, 3, 3), "xx-test") == "Founders Day"
+    assert not is_holiday(date(1999, 3, 3), "XX-TEST")
+    assert is_holiday(_nth_weekday(2024, 8, calendar.MONDAY, 2), "XX-TEST")
+
+
+@pytest.mark.parametrize("year", [MINYEAR, MAXYEAR])
+def test_first_and_last_supported_years(year):
+    for country in supported_countries():
+        table = holidays_for_year(country, year)
+        assert date(year, 1, 1) in table and all(day.year == year for day in table)
+    assert not YamTimes(dt=datetime(year, 6, 1)).is_holiday()
+    assert is_holiday(date(year, 12, 25), "US")
+
+
+def test_unknown_country():
+    with pytest.raises(ValueError):
+        is_holiday(date(2024, 1, 1), "ZZ")
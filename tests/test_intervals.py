@@ -0,0 +1,138 @@
+import pickle
+import random
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from yamtimes import YamTimesArray
+from yamtimes.intervals import IntervalIndex, YamInterval
+
+BASE = datetime(2024, 1, 1)
+
+
+def _at(minutes):
+    return BASE + timedelta(minutes=minutes)
+
+
+@pytest.fixture(scope="module")
+def spans():
+    rng = random.Random(8)
+    spans = []
+    for _ in range(400):
+        start = rng.randrange(0, 10000)
+        spans.append((start, start + rng.choice([0, 1, 5, 60, 600, 3000])))
+    return spans
+
+
+@pytest.fixture(scope="module")
+def index(spans):
+    return IntervalIndex([YamInterval(_at(start), _at(end)) for start, end in spans])
+
+
+def test_queries_match_linear_scan(spans, index):
+    rng = random.Random(1)
+    for _ in range(300):
+        point = rng.randrange(-100, 13100)
+        expected = sorted((start, end) for start, end in spans if start <= point < end)
+        assert sorted((interval.start.datetime, interval.end.datetime) for interval in index.containing(_at(point))) == [
+            (_at(start), _at(end)) for start, end in expected
+        ]
+        low, high = sorted(rng.randrange(-100, 13100) for _ in range(2))
+        expected = sorted((start, end) for start, end in spans if max(start, low) < min(end, high))
+        found = index.overlapping(_at(low), _at(high))
+        assert [(interval.start.datetime, interval.end.datetime) for interval in found] == [
+            (_at(start), _at(end)) for start, end in expected
+        ]
+
+
+def test_bulk_queries(spans, index):
+    points = [_at(minutes) for minutes in range(-50, 13050, 7)]
+    counts = [sum(start <= (point - BASE) // timedelta(minutes=1) < end for start, end in spans) for point in points]
+    assert list(index.count_containing(YamTimesArray(points))) == counts
+    assert list(index.count_containing(points)) == counts
+    assert [bool(flag) for flag in index.contains_any(points)] == [count > 0 for count in counts]
+    assert [len(found) for found in index.containing_many(points)] == counts
+
+
+def test_set_operations():
+    first = YamInterval(_at(0), _at(60))
+    second = YamInterval(_at(30), _at(90))
+    third = YamInterval(_at(120), _at(180))
+    assert first.overlaps(second) and not first.overlaps(third)
+    assert first.intersection(second) == YamInterval(_at(30), _at(60))
+    assert first.intersection(third) is None
+    assert first.union(second) == YamInterval(_at(0), _at(90))
+    assert first.union(YamInterval(_at(60), _at(61))) == YamInterval(_at(0), _at(61))
+    with pytest.raises(ValueError):
+        first.union(third)
+    assert second.gap(third) == YamInterval(_at(90), _at(120))
+    assert third.gap(second) == YamInterval(_at(90), _at(120))
+    assert first.gap(second) is None
+    assert first.duration() == timedelta(hours=1)
+    assert _at(0) in first and _at(60) not in first
+    assert YamInterval(_at(10), _at(20)) in first
+    assert YamInterval(_at(5), _at(5)).is_empty() and not first.is_empty()
+
+
+def test_value_semantics():
+    interval = YamInterval(_at(0), _at(60))
+    assert interval == YamInterval(_at(0), _at(60))
+    assert len({interval, YamInterval(_at(0), _at(60))}) == 1
+    assert pickle.loads(pickle.dumps(interval)) == interval
+    with pytest.raises(AttributeError):
+        interval._start = 0
+    with pytest.raises(ValueError):
+        YamInterval(_at(1), _at(0))
+
+
+def test_aware_bounds_compare_in_utc():
+    utc, tokyo = ZoneInfo("UTC"), ZoneInfo("Asia/Tokyo")
+    interval = YamInterval(datetime(2024, 1, 1, 12, tzinfo=utc), datetime(2024, 1, 1, 13, tzinfo=utc))
+    assert datetime(2024, 1, 1, 12, tzinfo=tokyo) not in interval
+    assert datetime(2024, 1, 1, 21, 30, tzinfo=tokyo) in interval
+    assert interval.start.datetime == datetime(2024, 1, 1, 12, tzinfo=utc)
+    assert interval.start.datetime.tzinfo is utc and interval.end.datetime.tzinfo is utc
+    shifted = YamInterval(datetime(2024, 1, 1, 21, 30, tzinfo=tokyo), datetime(2024, 1, 1, 23, tzinfo=tokyo))
+    assert shifted.start.datetime.tzinfo is tokyo
+    assert interval.intersection(shifted) == YamInterval(datetime(2024, 1, 1, 12, 30, tzinfo=utc),
+                                                         datetime(2024, 1, 1, 13, tzinfo=utc))
+    assert interval.union(shifted).end.datetime == datetime(2024, 1, 1, 14, tzinfo=utc)
+    assert pickle.loads(pickle.dumps(shifted)).start.datetime.tzinfo is tokyo
+    index = IntervalIndex([interval, shifted])
+    assert index.containing(datetime(2024, 1, 1, 12, 45, tzinfo=utc)) == [interval, shifted]
+    assert index.containing(datetime(2024, 1, 1, 12, 45, tzinfo=tokyo)) == []
+    assert list(index.count_containing([datetime(2024, 1, 1, 7, 45, tzinfo=ZoneInfo("America/New_York"))])) == [2]
+
+
+def test_ends_of_the_range_and_folds():
+    everything = YamInterval(datetime.min, datetime.max)
+    assert everything.duration() == datetime.max - datetime.min
+    assert datetime.min in everything and datetime.max not in everything
+    index = IntervalIndex([everything, YamInterval(datetime(9999, 12, 31), datetime.max),
+                           YamInterval(datetime.min, datetime(1, 1, 2))])
+    assert list(index.count_containing([datetime.min, datetime(5000, 1, 1), datetime.max])) == [2, 1, 0]
+    assert len(index.containing(datetime.max - timedelta(microseconds=1))) == 2
+    # The two 01:30s of a fall-back night are an hour apart in UTC.
+    new_york = ZoneInfo("America/New_York")
+    first = datetime(2024, 11, 3, 1, 30, tzinfo=new_york)
+    repeated = YamInterval(first, first.replace(fold=1))
+    assert repeated.duration() == timedelta(hours=1) and not repeated.is_empty()
+    assert datetime(2024, 11, 3, 1, 45, tzinfo=new_york) in repeated
+    assert datetime(2024, 11, 3, 1, 45, fold=1, tzinfo=new_york) not in repeated
+
+
+def test_naive_and_aware_are_not_mixed():
+    aware = YamInterval(datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC")), datetime(2024, 1, 2, tzinfo=ZoneInfo("UTC")))
+    naive = YamInterval(datetime(2024, 1, 1), datetime(2024, 1, 2))
+    assert aware != naive
+    with pytest.raises(TypeError):
+        YamInterval(datetime(2024, 1, 1), datetime(2024, 1, 2, tzinfo=ZoneInfo("UTC")))
+    with pytest.raises(TypeError):
+        datetime(2024, 1, 1, 12) in aware
+    with pytest.raises(TypeError):
+        aware.overlaps(naive)
+    with pytest.raises(TypeError):
+        IntervalIndex([aware, naive])
+    with pytest.raises(TypeError):
+        IntervalIndex([aware]).count_containing(YamTimesArray([datetime(2024, 1, 1)]))
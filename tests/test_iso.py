@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from yamtimes.iso import _parse_iso_slow, format_iso, parse_iso, parse_iso_many
+
+VALID = [
+    "2024-03-05",
+    "2024-03-05T07:08:09",
+    "2024-03-05 07:08:09.123456",
+    "2024-03-05T07:08:09.5+02:00",
+    "2024-03-05T07:08:09Z",
+    "2024-03-05T07:08:09-03:30",
+    "20240305T070809",
+    "2024-W10-2",
+    "2024W102",
+    "2020-W53-7",
+    "2026-W53-1",
+    "2024-03-05T07:08",
+    "2024-03-05T07",
+    "0001-01-01T00:00:00",
+    "0001-W01-1",
+    "9999-W52-5",
+    "9999-12-31T23:59:59.999999-01:00",
+]
+
+INVALID = [
+    "2023-W53-1",
+    "2024-W53-1",
+    "2021-W53-7",
+    "2024-W54-1",
+    "2024-W00-1",
+    "2024-W10-8",
+    "2023-366",
+    "2024-13-01",
+    "2024-02-30",
+    "2024-03-05T25:00",
+    "2024-03-05T07:08:09+24:00",
+    "0000-12-31",
+    "10000-01-01",
+    "0000-W52-7",
+    "9999-W53-1",
+    "not a date",
+]
+
+
+@pytest.mark.parametrize("text", VALID)
+def test_parse_matches_fromisoformat(text):
+    expected = datetime.fromisoformat(text)
+    assert parse_iso(text) == expected
+    assert _parse_iso_slow(text) == expected
+
+
+@pytest.mark.parametrize("text", INVALID)
+def test_rejects_what_fromisoformat_rejects(text):
+    with pytest.raises(ValueError):
+        datetime.fromisoformat(text)
+    with pytest.raises(ValueError):
+        parse_iso(text)
+
+
+@pytest.mark.parametrize("text", ["2024-065", "2024065"])
+def test_ordinal_dates(text):
+    assert parse_iso(text) == datetime(2024, 3, 5)
+
+
+def test_week_dates_match_isocalendar():
+    day = datetime(2015, 1, 1)
+    while day.year < 2030:
+        year, week, weekday = day.isocalendar()
+        assert _parse_iso_slow(f"{year:04d}-W{week:02d}-{weekday}") == day
+        day += timedelta(days=1)
+
+
+def test_parse_accepts_bytes_and_end_of_day():
+    assert parse_iso(b"2024-03-05T07:08:09") == datetime(2024, 3, 5, 7, 8, 9)
+    assert _parse_iso_slow("2024-12-31T24:00:00") == datetime(2025, 1, 1)
+
+
+def test_parse_many_skips_invalid():
+    lines = ["2024-03-05\n", "garbage\n", "2024-03-05T07:08\u00e9\n".encode("utf-8"), b" 2024-03-06T10:00Z "]
+    assert list(parse_iso_many(lines, skip_invalid=True)) == [
+        datetime(2024, 3, 5),
+        datetime(2024, 3, 6, 10, tzinfo=timezone.utc),
+    ]
+    with pytest.raises(ValueError):
+        list(parse_iso_many(lines))
+
+
+@pytest.mark.parametrize("dt", [
+    datetime(2024, 3, 5, 7, 8, 9),
+    datetime(2024, 3, 5, 7, 8, 9, 120000, timezone.utc),
+    datetime(2024, 3, 5, tzinfo=timezone(timedelta(hours=-3))),
+])
+def test_format_round_trips(dt):
+    assert parse_iso(format_iso(dt)) == dt
+    assert format_iso(dt) == dt.isoformat()
+    if dt.tzinfo is timezone.utc:
+        assert format_iso(dt, use_z=True).endswith("Z")
+
+
+def test_boundaries_round_trip(boundary_datetimes):
+    for dt in boundary_datetimes:
+        assert format_iso(dt) == dt.isoformat()
+        assert parse_iso(format_iso(dt)) == dt
+        assert parse_iso(format_iso(dt, sep=" ").encode("ascii")) == dt
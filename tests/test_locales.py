@@ -0,0 +1,93 @@
+import locale
+import threading
+import warnings
+from datetime import datetime, timedelta
+
+import pytest
+
+from yamtimes import YamTimes, locales
+from yamtimes.locales import get_locale_names, localized_strftime
+
+# One instant on every weekday, in every month, in the morning and the afternoon.
+INSTANTS = [datetime(2024, 1, 1, 9, 5, 7) + timedelta(days=days, hours=days % 2 * 12) for days in range(0, 366, 5)]
+
+FORMATS = ["%A, %d %B %Y %I:%M:%S %p", "%a %b %d", "%B", "%%A %%B literal", "%Y-%m-%d %H:%M", "ends with %", "%j%p%"]
+
+
+@pytest.mark.parametrize("format", FORMATS)
+@pytest.mark.parametrize("language_code", ["en_US", "en-GB", "C", "POSIX", "en_US.UTF-8"])
+def test_english_matches_c_locale_strftime(format, language_code):
+    # The tests run in the C locale, where strftime uses the English names.
+    assert locale.setlocale(locale.LC_TIME) in ("C", "POSIX")
+    for dt in INSTANTS:
+        assert localized_strftime(dt, format, language_code) == dt.strftime(format), dt
+
+
+def test_names_at_the_ends_of_the_range(boundary_datetimes):
+    for dt in boundary_datetimes:
+        assert localized_strftime(dt, "%A %a %d %B %b %H %p", "en_US") == dt.strftime("%A %a %d %B %b %H %p"), dt
+        assert YamTimes(dt=dt).weekday_name("pt_BR") == get_locale_names("pt_BR").weekdays[dt.weekday()], dt
+
+
+@pytest.mark.parametrize("language_code, month, weekday, am_pm", [
+    # The casing of the glibc locales: only German capitalizes its month and weekday names.
+    ("pt_BR", "março", "sexta-feira", "PM"),
+    ("es-ES", "marzo", "viernes", "p. m."),
+    ("fr_FR.UTF-8", "mars", "vendredi", "PM"),
+    ("de_DE@euro", "März", "Freitag", "PM"),
+    ("it_IT", "marzo", "venerdì", "PM"),
+    ("NL_nl", "maart", "vrijdag", "p.m."),
+])
+def test_other_languages(language_code, month, weekday, am_pm):
+    dt = datetime(2024, 3, 15, 13, 30)
+    assert localized_strftime(dt, "%A %d %B %Y %p", language_code) == f"{weekday} 15 {month} 2024 {am_pm}"
+    instant = YamTimes(dt=dt)
+    assert (instant.month_name(language_code), instant.weekday_name(language_code)) == (month, weekday)
+    names = get_locale_names(language_code)
+    assert instant.short_month_name(language_code) == names.short_months[2]
+    assert instant.short_weekday_name(language_code) == names.short_weekdays[4]
+    assert len(set(names.months)) == 12 and len(set(names.weekdays)) == 7
+
+
+def test_process_locale_is_left_alone():
+    before = locale.setlocale(locale.LC_ALL)
+    for language_code in ["pt_BR", "es_ES", "fr_FR", "de_DE", "it_IT", "nl_NL"]:
+        YamTimes(dt=INSTANTS[0]).readable_format(language_code)
+    assert locale.setlocale(locale.LC_ALL) == before
+
+
+def test_unsupported_language_falls_back_to_english():
+    # The warning is repeated on every call, although the lookup itself is cached.
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="xx_XX"):
+            assert get_locale_names("xx_XX") == get_locale_names("en_US")
+    with pytest.warns(UserWarning, match="xx_XX"):
+        assert YamTimes(dt=INSTANTS[0]).month_name("xx_XX") == "January"
+
+
+@pytest.fixture
+def without_builtin_c(monkeypatch, request):
+    # Sends the C locale through the system locale path instead of the built-in English table.
+    monkeypatch.setattr(locales, "_BUILTIN_NAMES", {
+        language: names for language, names in locales._BUILTIN_NAMES.items() if language not in ("c", "posix")
+    })
+    locales._resolve_names.cache_clear()
+    request.addfinalizer(locales._resolve_names.cache_clear)
+
+
+@pytest.mark.skipif(locales._lc_time_mask() is None, reason="no per-thread locales on this platform")
+def test_installed_locales_are_read_per_thread(without_builtin_c):
+    before = locale.setlocale(locale.LC_ALL)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_locale_names("C.UTF-8"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    english = get_locale_names("en_US")
+    assert results == [english] * 8
+    assert get_locale_names("POSIX") == english
+    assert locale.setlocale(locale.LC_ALL) == before
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert localized_strftime(INSTANTS[0], "%A %B", "C.UTF-8") == INSTANTS[0].strftime("%A %B")
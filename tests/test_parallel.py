@@ -0,0 +1,90 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from yamtimes import YamTimesArray, parallel
+
+# Small chunks so that every call is split across the pool and goes through shared memory.
+CHUNK = 97
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="module")
+def datetimes(random_datetimes):
+    start = datetime(1990, 1, 1)
+    return random_datetimes(11, 1000, start, start + timedelta(days=60 * 365))
+
+
+@pytest.mark.parametrize("split", [dict(workers=1), dict(chunk_size=CHUNK)])
+def test_shift_and_truncate(executor, datetimes, split):
+    split.setdefault("executor", executor)
+    shifted = parallel.shift(datetimes, years=1, months=-14, days=3, hours=5, **split)
+    assert shifted.to_datetimes() == [dt + relativedelta(years=1, months=-14, days=3, hours=5) for dt in datetimes]
+    months = parallel.truncate(YamTimesArray(datetimes), "month", **split)
+    assert months.to_datetimes() == [dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0) for dt in datetimes]
+
+
+def test_evaluate(executor, datetimes):
+    weekend = parallel.evaluate(datetimes, "is_weekend", chunk_size=CHUNK, executor=executor)
+    assert [bool(flag) for flag in weekend] == [dt.weekday() >= 5 for dt in datetimes]
+    reference = datetime(2020, 6, 15, 12)
+    past = parallel.evaluate(datetimes, "is_past", reference=reference, chunk_size=CHUNK, executor=executor)
+    assert [bool(flag) for flag in past] == [dt < reference for dt in datetimes]
+    codes = parallel.evaluate(datetimes, "classify", reference=reference, chunk_size=CHUNK, executor=executor)
+    assert list(codes) == list(YamTimesArray(datetimes).classify(reference))
+
+
+def test_evaluate_rejects_unknown_predicates():
+    for predicate in ("_micros", "to_nothing", "micros"):
+        with pytest.raises(ValueError):
+            parallel.evaluate([datetime(2024, 1, 1)], predicate)
+
+
+@pytest.mark.parametrize("format", ["%Y-%m-%d %H:%M:%S", "%d/%m/%Y %H.%M.%S.%f", parallel.ISO])
+def test_format_and_parse_round_trip(executor, datetimes, format):
+    strings = parallel.format_many(datetimes, format, chunk_size=CHUNK, executor=executor)
+    if format == parallel.ISO:
+        assert strings == [dt.isoformat() for dt in datetimes]
+    else:
+        assert strings == [dt.strftime(format) for dt in datetimes]
+    parsed = parallel.parse_many(strings, format, chunk_size=CHUNK, executor=executor).to_datetimes()
+    if format == parallel.ISO:
+        assert parsed == [datetime.fromisoformat(text) for text in strings]
+    else:
+        assert parsed == [datetime.strptime(text, format) for text in strings]
+
+
+def test_ends_of_the_range(executor, boundary_datetimes):
+    strings = parallel.format_many(boundary_datetimes, parallel.ISO, chunk_size=3, executor=executor)
+    assert parallel.parse_many(strings, parallel.ISO, chunk_size=3, executor=executor).to_datetimes() == (
+        boundary_datetimes
+    )
+    months = parallel.truncate(boundary_datetimes, "month", chunk_size=3, executor=executor)
+    assert months.to_datetimes() == [dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+                                     for dt in boundary_datetimes]
+    # A chunk that leaves the range fails the whole call, as the serial shift does.
+    for shift in (dict(days=1), dict(months=1), dict(years=-1)):
+        with pytest.raises((ValueError, OverflowError)):
+            parallel.shift(boundary_datetimes, chunk_size=3, executor=executor, **shift).to_datetimes()
+
+
+def test_parse_non_ascii(executor):
+    strings = [f"{day:02d} März 2024" for day in range(1, 32)] * 10
+    parsed = parallel.parse_many(strings, "%d März %Y", chunk_size=7, executor=executor)
+    assert parsed.to_datetimes() == [datetime.strptime(text, "%d März %Y") for text in strings]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        parallel.shift([datetime(2024, 1, 1)], days=1, workers=-1)
+    with pytest.raises(ValueError):
+        parallel.shift([datetime(2024, 1, 1)], days=1, chunk_size=0)
+    with pytest.raises(ValueError):
+        parallel.truncate([datetime(2024, 1, 1)], "fortnight")
@@ -0,0 +1,105 @@
+from collections import Counter
+from datetime import MAXYEAR, datetime, timedelta
+
+import pytest
+
+from yamtimes import YamTimes, YamTimesArray
+from yamtimes._civil import PERIODS, datetime_to_micros, micros_to_datetime
+from yamtimes.periods import bucket_starts, bucketize, ceil_micros, floor_micros
+
+
+def _floor(dt, period, every=1):
+    # The start of the period with datetime arithmetic; groups only for units that divide their parent.
+    if period == "second":
+        return dt.replace(second=dt.second // every * every, microsecond=0)
+    if period == "minute":
+        return dt.replace(minute=dt.minute // every * every, second=0, microsecond=0)
+    if period == "hour":
+        return dt.replace(hour=dt.hour // every * every, minute=0, second=0, microsecond=0)
+    midnight = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "day":
+        return midnight
+    if period == "week":
+        return midnight - timedelta(days=dt.weekday())
+    if period == "month":
+        return midnight.replace(month=(dt.month - 1) // every * every + 1, day=1)
+    if period == "quarter":
+        return midnight.replace(month=(dt.month - 1) // (3 * every) * 3 * every + 1, day=1)
+    return midnight.replace(year=dt.year // every * every, month=1, day=1)
+
+
+GROUPS = [(period, 1) for period in PERIODS] + [
+    ("second", 15), ("minute", 15), ("minute", 20), ("hour", 6), ("month", 3), ("month", 6), ("quarter", 2),
+    ("year", 10),
+]
+
+
+@pytest.fixture(scope="module")
+def datetimes(random_datetimes):
+    values = [datetime(1969, 12, 29), datetime(1970, 1, 1), datetime(2024, 2, 29, 23, 59, 59, 999999),
+              datetime(1600, 1, 1), datetime(2024, 1, 1, 0, 0, 0, 1)]
+    values += random_datetimes(4, 1500, datetime(1500, 1, 1), datetime(1500, 1, 1) + timedelta(microseconds=10 ** 17))
+    values += [datetime(2024, 5, 6, 7) + timedelta(minutes=minutes) for minutes in range(0, 3000, 29)]
+    return values
+
+
+@pytest.mark.parametrize("period, every", GROUPS)
+def test_floor_and_ceil(datetimes, period, every):
+    for dt in datetimes:
+        expected = _floor(dt, period, every)
+        assert micros_to_datetime(floor_micros(datetime_to_micros(dt), period, every)) == expected, dt
+        ceil = micros_to_datetime(ceil_micros(datetime_to_micros(dt), period, every))
+        assert ceil == dt if expected == dt else (ceil > dt and _floor(ceil, period, every) == ceil), dt
+    times = YamTimesArray(datetimes)
+    assert times.truncate(period, every).to_datetimes() == [_floor(dt, period, every) for dt in datetimes]
+    assert times.ceil(period, every).to_datetimes() == [
+        micros_to_datetime(ceil_micros(datetime_to_micros(dt), period, every)) for dt in datetimes
+    ]
+
+
+@pytest.mark.parametrize("period, every", GROUPS)
+def test_bucketize(datetimes, period, every):
+    keys, counts = bucketize(datetimes, period, every)
+    expected = Counter(_floor(dt, period, every) for dt in datetimes)
+    starts = [micros_to_datetime(start) for start in bucket_starts(keys, period, every)]
+    assert starts == sorted(expected)
+    assert list(counts) == [expected[start] for start in starts]
+    assert all(earlier < later for earlier, later in zip(keys, keys[1:]))
+
+
+@pytest.mark.parametrize("period, every", GROUPS)
+def test_ends_of_the_range(boundary_datetimes, period, every):
+    # Starts before year 1 and ends after year 9999 do not exist; asking for one is an OverflowError.
+    for dt in boundary_datetimes:
+        floor = floor_micros(datetime_to_micros(dt), period, every)
+        if (period, every) == ("year", 10) and dt.year < 10:
+            with pytest.raises(OverflowError):
+                micros_to_datetime(floor)
+        else:
+            assert micros_to_datetime(floor) == _floor(dt, period, every), dt
+        ceil = ceil_micros(datetime_to_micros(dt), period, every)
+        if ceil == datetime_to_micros(dt):
+            continue
+        try:
+            assert micros_to_datetime(ceil) > dt
+        except OverflowError:
+            assert dt.year == MAXYEAR, dt
+    with pytest.raises(OverflowError):
+        YamTimes(dt=datetime.max).ceil(period, every)
+
+
+def test_yamtimes_methods():
+    instant = YamTimes(dt=datetime(2024, 3, 15, 10, 37, 12))
+    assert instant.truncate("minute", every=15).datetime == datetime(2024, 3, 15, 10, 30)
+    assert instant.floor("week").datetime == datetime(2024, 3, 11)
+    assert instant.ceil("day").datetime == datetime(2024, 3, 16)
+    assert YamTimes(dt=datetime(2024, 3, 15)).ceil("day").datetime == datetime(2024, 3, 15)
+    assert instant.ceil("quarter").datetime == datetime(2024, 4, 1)
+
+
+@pytest.mark.parametrize("period, every", [("fortnight", 1), ("day", 0), ("month", -1)])
+def test_invalid(period, every):
+    with pytest.raises(ValueError):
+        floor_micros(0, period, every)
+    with pytest.raises(ValueError):
+        bucketize([0], period, every)
@@ -0,0 +1,118 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from dateutil import rrule
+
+from yamtimes.recurrence import Recurrence, TimeRange
+
+START = datetime(2023, 11, 28, 9, 30)
+UNTIL = datetime(2026, 3, 1)
+
+# (Recurrence keyword arguments, rrule keyword arguments)
+CASES = [
+    (dict(frequency="daily"), dict(freq=rrule.DAILY)),
+    (dict(frequency="daily", interval=3), dict(freq=rrule.DAILY, interval=3)),
+    (dict(frequency="daily", by_weekday=[0, 2, 4]), dict(freq=rrule.DAILY, byweekday=(0, 2, 4))),
+    (dict(frequency="daily", by_month=2, by_monthday=29), dict(freq=rrule.DAILY, bymonth=2, bymonthday=29)),
+    (dict(frequency="weekly"), dict(freq=rrule.WEEKLY)),
+    (dict(frequency="weekly", interval=2, by_weekday=[1, 3]), dict(freq=rrule.WEEKLY, interval=2, byweekday=(1, 3))),
+    (dict(frequency="weekly", by_monthday=(1, 15)), dict(freq=rrule.WEEKLY, bymonthday=(1, 15))),
+    (dict(frequency="monthly"), dict(freq=rrule.MONTHLY)),
+    (dict(frequency="monthly", by_monthday=31), dict(freq=rrule.MONTHLY, bymonthday=31)),
+    (dict(frequency="monthly", by_monthday=(1, -1)), dict(freq=rrule.MONTHLY, bymonthday=(1, -1))),
+    (dict(frequency="monthly", by_weekday=(4, -1)), dict(freq=rrule.MONTHLY, byweekday=rrule.FR(-1))),
+    (dict(frequency="monthly", interval=2, by_weekday=[(0, 1), (0, 3)]),
+     dict(freq=rrule.MONTHLY, interval=2, byweekday=(rrule.MO(1), rrule.MO(3)))),
+    (dict(frequency="monthly", by_weekday=4, by_monthday=13), dict(freq=rrule.MONTHLY, byweekday=4, bymonthday=13)),
+    (dict(frequency="monthly", by_month=(3, 6, 9, 12)), dict(freq=rrule.MONTHLY, bymonth=(3, 6, 9, 12))),
+    (dict(frequency="yearly"), dict(freq=rrule.YEARLY)),
+    (dict(frequency="yearly", by_month=(1, 7), by_monthday=4), dict(freq=rrule.YEARLY, bymonth=(1, 7), bymonthday=4)),
+    (dict(frequency="yearly", by_month=11, by_weekday=(3, 4)), dict(freq=rrule.YEARLY, bymonth=11, byweekday=rrule.TH(4))),
+    (dict(frequency="yearly", by_weekday=(0, 20)), dict(freq=rrule.YEARLY, byweekday=rrule.MO(20))),
+    (dict(frequency="yearly", by_monthday=-1), dict(freq=rrule.YEARLY, bymonthday=-1)),
+]
+
+
+@pytest.mark.parametrize("ours, theirs", CASES)
+def test_until_matches_rrule(ours, theirs):
+    expected = list(rrule.rrule(dtstart=START, until=UNTIL, **theirs))
+    assert [instant.datetime for instant in Recurrence(start=START, until=UNTIL, **ours)] == expected
+
+
+@pytest.mark.parametrize("ours, theirs", CASES)
+def test_count_matches_rrule(ours, theirs):
+    expected = list(rrule.rrule(dtstart=START, count=25, **theirs))
+    assert [instant.datetime for instant in Recurrence(start=START, count=25, **ours)] == expected
+
+
+def test_to_array_and_between():
+    rule = Recurrence("weekly", START, by_weekday=[0, 3], until=UNTIL)
+    expected = list(rrule.rrule(rrule.WEEKLY, dtstart=START, byweekday=(0, 3), until=UNTIL))
+    assert list(rule.to_array().to_datetimes()) == expected
+    low, high = datetime(2024, 5, 2, 9, 30), datetime(2024, 6, 3, 9, 30)
+    assert [instant.datetime for instant in rule.between(low, high)] == [dt for dt in expected if low <= dt <= high]
+    assert [instant.datetime for instant in rule.between(low, high, inclusive=False)] == [
+        dt for dt in expected if low < dt < high
+    ]
+
+
+@pytest.mark.parametrize("ours, theirs", CASES)
+def test_rules_stop_at_the_end_of_the_range(ours, theirs):
+    # dateutil raises past year 9999 for some frequencies; the occurrences before that must agree.
+    start = datetime(9999, 10, 31, 9, 30)
+    expected = []
+    try:
+        expected.extend(rrule.rrule(dtstart=start, **theirs))
+    except ValueError:
+        pass
+    assert [instant.datetime for instant in Recurrence(start=start, **ours)] == expected
+
+
+def test_ends_of_the_range():
+    assert [instant.datetime for instant in Recurrence("daily", datetime.min, count=3)] == [
+        datetime(1, 1, day) for day in (1, 2, 3)
+    ]
+    assert len(Recurrence("daily", datetime(9999, 1, 1)).to_array(limit=1000)) == 365
+    days = TimeRange(datetime.min, datetime.max, timedelta(days=1))
+    assert len(days) == 3652059
+    assert days[-1].datetime == datetime(9999, 12, 31) and days[0].datetime == datetime.min
+    years = TimeRange(datetime.max, datetime.min, -timedelta(days=365))
+    assert [instant.datetime for instant in years[-2:]] == [datetime.max - 10004 * timedelta(days=365),
+                                                             datetime.max - 10005 * timedelta(days=365)]
+    micros = TimeRange(datetime.min, datetime.max, 1)
+    assert len(micros) == 315537897599999999
+    assert datetime.max not in micros and datetime.max - timedelta(microseconds=1) in micros
+
+
+def test_unbounded_to_array_needs_limit():
+    with pytest.raises(ValueError):
+        Recurrence("daily", START).to_array()
+    assert len(Recurrence("daily", START).to_array(limit=10)) == 10
+
+
+def test_until_stops_rules_that_never_match():
+    # Without stopping at `until`, such a rule scans every day up to year 9999.
+    started = time.perf_counter()
+    assert list(Recurrence("daily", START, by_month=2, by_monthday=31, until=datetime(2024, 12, 31))) == []
+    assert list(Recurrence("monthly", START, by_monthday=30, by_month=2, until=datetime(2030, 1, 1))) == []
+    assert time.perf_counter() - started < 0.5
+
+
+@pytest.mark.parametrize("step", [timedelta(hours=7), timedelta(days=1, minutes=5), 90_000_000, -timedelta(hours=5)])
+def test_time_range(step):
+    end = datetime(2024, 1, 20) if step != -timedelta(hours=5) else datetime(2023, 11, 1)
+    delta = step if isinstance(step, timedelta) else timedelta(microseconds=step)
+    expected = []
+    current = START
+    while (current < end) if delta > timedelta(0) else (current > end):
+        expected.append(current)
+        current += delta
+    times = TimeRange(START, end, step)
+    assert len(times) == len(expected)
+    assert [instant.datetime for instant in times] == expected
+    assert [instant.datetime for instant in times[3:40:4]] == expected[3:40:4]
+    assert [instant.datetime for instant in reversed(times)] == expected[::-1]
+    assert times[-1].datetime == expected[-1]
+    assert expected[5] in times
+    assert expected[5] + timedelta(microseconds=1) not in times
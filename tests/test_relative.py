@@ -0,0 +1,102 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from yamtimes import YamTimes, YamTimesArray
+from yamtimes._civil import datetime_to_micros
+from yamtimes.clock import FrozenClock, use_clock
+from yamtimes.relative import BUCKET_LABELS, reference_boundaries
+
+REFERENCES = [datetime(2024, 2, 29, 13, 45), datetime(2023, 12, 31, 23, 59, 59), datetime(2024, 1, 1),
+              datetime(2025, 3, 3, 0, 0, 0, 1), datetime(1969, 12, 31, 12)]
+
+
+def _checks(dt, now):
+    # The expected answer of every relative check with plain datetime arithmetic.
+    today = now.date()
+    monday = today - timedelta(days=today.weekday())
+    return {
+        "is_past": dt < now,
+        "is_future": dt > now,
+        "is_today": dt.date() == today,
+        "is_before_today": dt.date() < today,
+        "is_after_today": dt.date() > today,
+        "is_in_current_week": 0 <= (dt.date() - monday).days < 7,
+        "is_in_current_month": (dt.year, dt.month) == (now.year, now.month),
+        "is_in_current_year": dt.year == now.year,
+    }
+
+
+def _label(checks):
+    if checks["is_today"]:
+        return "today"
+    for period in ("week", "month", "year"):
+        if checks["is_in_current_" + period]:
+            return "this_" + period
+    return "past" if checks["is_past"] else "future"
+
+
+def _instants(now):
+    rng = random.Random(now.toordinal())
+    instants = [now, now - timedelta(microseconds=1), now + timedelta(microseconds=1)]
+    instants += [now + timedelta(days=days) for days in range(-40, 41)]
+    instants += [now + timedelta(seconds=rng.randrange(-2 * 10 ** 8, 2 * 10 ** 8)) for _ in range(500)]
+    return instants
+
+
+@pytest.mark.parametrize("now", REFERENCES)
+def test_boundaries_match_datetime(now):
+    boundaries = reference_boundaries(now)
+    midnight = datetime.combine(now.date(), datetime.min.time())
+    monday = midnight - timedelta(days=now.weekday())
+    month_start = midnight.replace(day=1)
+    expected = {
+        "now": now,
+        "today": midnight,
+        "tomorrow": midnight + timedelta(days=1),
+        "week_start": monday,
+        "next_week": monday + timedelta(days=7),
+        "month_start": month_start,
+        "next_month": (month_start + timedelta(days=31)).replace(day=1),
+        "year_start": month_start.replace(month=1),
+        "next_year": month_start.replace(year=now.year + 1, month=1),
+    }
+    assert boundaries._asdict() == {name: datetime_to_micros(value) for name, value in expected.items()}
+
+
+@pytest.mark.parametrize("now", REFERENCES)
+def test_array_checks_match_datetime(now):
+    instants = _instants(now)
+    times = YamTimesArray(instants)
+    expected = [_checks(dt, now) for dt in instants]
+    for name in expected[0]:
+        assert [bool(flag) for flag in getattr(times, name)(now)] == [checks[name] for checks in expected], name
+    assert [BUCKET_LABELS[code] for code in times.classify(now)] == [_label(checks) for checks in expected]
+    # Without a reference the installed clock supplies it.
+    with use_clock(FrozenClock(now.astimezone())):
+        assert list(times.classify()) == list(times.classify(now))
+
+
+@pytest.mark.parametrize("now", [datetime.min, datetime(1, 1, 2, 12), datetime(9999, 12, 30, 12), datetime.max])
+def test_checks_at_the_ends_of_the_range(boundary_datetimes, now):
+    # The next week, month and year of the last days are past year 9999, which only microseconds can hold.
+    boundaries = reference_boundaries(now)
+    assert boundaries.today == datetime_to_micros(datetime.combine(now.date(), datetime.min.time()))
+    if now.year == 9999:
+        assert boundaries.next_year == datetime_to_micros(datetime.max) + 1
+    times = YamTimesArray(boundary_datetimes)
+    expected = [_checks(dt, now) for dt in boundary_datetimes]
+    for name in expected[0]:
+        assert [bool(flag) for flag in getattr(times, name)(now)] == [checks[name] for checks in expected], name
+    assert [BUCKET_LABELS[code] for code in times.classify(now)] == [_label(checks) for checks in expected]
+
+
+@pytest.mark.parametrize("now", REFERENCES)
+def test_yamtimes_checks_follow_the_clock(now):
+    with use_clock(FrozenClock(now.astimezone())):
+        for dt in _instants(now)[:200]:
+            instant = YamTimes(dt=dt)
+            for name, value in _checks(dt, now).items():
+                if name != "is_today":
+                    assert getattr(instant, name)() == value, (dt, name)
@@ -0,0 +1,179 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from yamtimes.cron import CronExpression
+from yamtimes.scheduler import Every, Scheduler, as_rule
+
+STEP = timedelta(milliseconds=20)
+# Fire times of test_jobs_fire_in_time_order, in steps from now, scheduled out of order.
+OFFSETS = [7, 2, 9, 1, 5, 3, 8, 4, 6]
+
+
+def _run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=10))
+
+
+def test_every_next_fire():
+    start = datetime(2024, 1, 1, 9, 0)
+    rule = Every(timedelta(minutes=15), start=start)
+    assert rule.next_fire(datetime(2023, 12, 31)) == start
+    assert rule.next_fire(start) == start + timedelta(minutes=15)
+    assert rule.next_fire(datetime(2024, 1, 1, 9, 44, 59)) == datetime(2024, 1, 1, 9, 45)
+    assert Every(90, start=start).next_fire(datetime(2024, 1, 1, 9, 2)) == datetime(2024, 1, 1, 9, 3)
+    zone = timezone(timedelta(hours=2))
+    aware = Every(timedelta(hours=1), start=start).next_fire(datetime(2024, 1, 1, 10, 30, tzinfo=zone))
+    assert aware == datetime(2024, 1, 1, 11, tzinfo=zone)
+    new_york = ZoneInfo("America/New_York")
+    for day in (datetime(2024, 3, 10, tzinfo=new_york), datetime(2024, 11, 3, tzinfo=new_york)):
+        rule, fire = Every(timedelta(hours=1), start=day), day
+        for _ in range(6):
+            following = rule.next_fire(fire)
+            assert following.timestamp() - fire.timestamp() == 3600
+            fire = following
+    last = datetime(9999, 12, 31, 23)
+    assert Every(timedelta(minutes=30), start=last).next_fire(last) == datetime(9999, 12, 31, 23, 30)
+    assert Every(timedelta(hours=1), start=last).next_fire(last) is None
+    last = last.replace(tzinfo=timezone.utc)
+    assert Every(timedelta(minutes=30), start=last).next_fire(last) == last + timedelta(minutes=30)
+    assert Every(timedelta(hours=1), start=last).next_fire(last) is None
+    with pytest.raises(ValueError):
+        Every(0)
+
+
+def test_as_rule():
+    assert isinstance(as_rule("*/5 * * * *"), CronExpression)
+    after = datetime(2024, 1, 1, 12)
+    assert as_rule([after - STEP, after + STEP, after + 2 * STEP]).next_fire(after) == after + STEP
+    assert as_rule(lambda last: last.datetime + timedelta(days=1)).next_fire(after) == after + timedelta(days=1)
+    with pytest.raises(TypeError):
+        as_rule(42)
+
+
+def test_jobs_fire_in_time_order():
+    async def main():
+        fired = []
+        async with Scheduler() as scheduler:
+            now = datetime.now()
+            for offset in OFFSETS:
+                scheduler.schedule([now + offset * STEP], fired.append, offset, name=str(offset))
+            assert [job.name for job in scheduler.jobs] == [str(offset) for offset in sorted(OFFSETS)]
+            await scheduler.wait()
+        return fired, len(scheduler)
+
+    fired, pending = _run(main())
+    assert fired == sorted(OFFSETS)
+    assert pending == 0
+
+
+def test_max_runs_cancel_and_errors():
+    async def main():
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        runs = []
+
+        def fail():
+            runs.append("fail")
+            raise RuntimeError("boom")
+
+        async with Scheduler() as scheduler:
+            counted = scheduler.schedule(Every(STEP), runs.append, "every", max_runs=3)
+            failing = scheduler.schedule(Every(STEP), fail, name="failing", max_runs=2)
+            cancelled = scheduler.schedule(Every(STEP), runs.append, "cancelled")
+            cancelled.cancel()
+            assert not cancelled.active
+            await scheduler.wait()
+        return runs, errors, counted, failing
+
+    runs, errors, counted, failing = _run(main())
+    assert runs.count("every") == 3 and counted.runs == 3 and not counted.active
+    assert runs.count("fail") == 2 and failing.runs == 2
+    assert "cancelled" not in runs
+    assert [type(context["exception"]) for context in errors] == [RuntimeError, RuntimeError]
+    assert all(context["job"] is failing for context in errors)
+
+
+def test_failing_rules_end_only_their_job():
+    class Broken:
+        calls = 0
+
+        def next_fire(self, after):
+            self.calls += 1
+            if self.calls > 1:
+                raise ValueError("broken rule")
+            return after + STEP
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        runs = []
+        async with Scheduler() as scheduler:
+            broken = scheduler.schedule(Broken(), runs.append, "broken", name="broken")
+            steady = scheduler.schedule(Every(STEP), runs.append, "steady", max_runs=5)
+            await scheduler.wait()
+        return runs, errors, broken, steady, len(scheduler)
+
+    runs, errors, broken, steady, pending = _run(main())
+    assert runs.count("broken") == 1 and not broken.active
+    assert runs.count("steady") == 5 and steady.runs == 5
+    assert pending == 0
+    assert [type(context["exception"]) for context in errors] == [ValueError]
+    assert errors[0]["job"] is broken
+
+
+def test_callbacks_can_cancel_jobs():
+    async def main():
+        runs = []
+        async with Scheduler() as scheduler:
+            def once():
+                runs.append("once")
+                job.cancel()
+
+            job = scheduler.schedule(Every(STEP), once)
+            await scheduler.wait()
+        return runs
+
+    assert _run(main()) == ["once"]
+
+
+def test_coroutines_and_callable_rules():
+    async def main():
+        done = []
+
+        async def work(label):
+            await asyncio.sleep(0.01)
+            done.append(label)
+
+        async with Scheduler(tz="UTC") as scheduler:
+            seen = []
+
+            def rule(last):
+                seen.append(last.datetime)
+                return last.datetime + STEP
+
+            scheduler.schedule(rule, work, "callable", max_runs=2)
+            await scheduler.wait()
+        return done, seen
+
+    done, seen = _run(main())
+    assert done == ["callable", "callable"]
+    assert all(dt.tzinfo is not None and dt.utcoffset() == timedelta(0) for dt in seen)
+
+
+def test_exhausted_rules_are_inactive():
+    async def main():
+        async with Scheduler() as scheduler:
+            job = scheduler.schedule([datetime(2000, 1, 1)], print)
+            assert not job.active and job.next_fire is None
+            await scheduler.wait()
+
+    _run(main())
+
+
+def test_wait_requires_start():
+    with pytest.raises(RuntimeError):
+        _run(Scheduler().wait())
@@ -0,0 +1,73 @@
+import copy
+import pickle
+import random
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from yamtimes import YamTimes
+
+
+@pytest.fixture(scope="module")
+def datetimes(random_datetimes):
+    rng = random.Random(3)
+    zones = [timezone.utc, timezone(timedelta(hours=-3)), timezone(timedelta(hours=5, minutes=30))]
+    start = datetime(2000, 1, 1)
+    values = random_datetimes(3, 300, start, start + timedelta(minutes=10 ** 7), timedelta(minutes=1))
+    values += [value.replace(tzinfo=rng.choice(zones)) for value in values[:150]]
+    # The same instants again, seen from other zones.
+    values += [value.astimezone(rng.choice(zones)) for value in values[300:]]
+    return values
+
+
+def test_equality_and_hash_follow_datetime(datetimes):
+    instants = [YamTimes(dt=value) for value in datetimes]
+    for first, left in zip(datetimes[:100], instants[:100]):
+        for second, right in zip(datetimes, instants):
+            assert (left == right) == (first == second)
+            if first == second:
+                assert hash(left) == hash(right)
+    assert len(set(instants)) == len(set(datetimes))
+    assert {instant: None for instant in instants}.keys() == {YamTimes(dt=value): None for value in datetimes}.keys()
+    naive = [value for value in datetimes if value.tzinfo is None]
+    assert [instant.datetime for instant in sorted(YamTimes(dt=value) for value in naive)] == sorted(naive)
+    assert YamTimes(dt=datetimes[0]) != datetimes[0]
+
+
+def test_boundaries_and_folds_follow_datetime(boundary_datetimes):
+    new_york = ZoneInfo("America/New_York")
+    values = boundary_datetimes + [datetime.min.replace(tzinfo=timezone.utc), datetime.max.replace(tzinfo=timezone.utc)]
+    # The repeated hour of 2024-11-03 in New York, and the skipped one of 2024-03-10.
+    values += [datetime(2024, 11, 3, 1, 30, fold=fold, tzinfo=new_york) for fold in (0, 1)]
+    values += [datetime(2024, 11, 3, 5, 30, tzinfo=timezone.utc), datetime(2024, 11, 3, 6, 30, tzinfo=timezone.utc)]
+    values += [datetime(2024, 3, 10, 2, 30, fold=fold, tzinfo=new_york) for fold in (0, 1)]
+    instants = [YamTimes(dt=value) for value in values]
+    for first, left in zip(values, instants):
+        for second, right in zip(values, instants):
+            assert (left == right) == (first == second), (first, second)
+            if first == second:
+                assert hash(left) == hash(right), (first, second)
+            if (first.tzinfo is None) == (second.tzinfo is None):
+                assert (left < right) == (first < second), (first, second)
+
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda instant: pickle.loads(pickle.dumps(instant))])
+def test_copies_are_equal(datetimes, clone):
+    for value in datetimes[::10]:
+        instant = YamTimes(dt=value)
+        twin = clone(instant)
+        assert twin == instant and hash(twin) == hash(instant) and twin.datetime.tzinfo == value.tzinfo
+
+
+def test_immutable():
+    instant = YamTimes(dt=datetime(2024, 1, 1))
+    assert not hasattr(instant, "__dict__")
+    with pytest.raises(AttributeError):
+        instant._YamTimes__datetime = datetime(2025, 1, 1)
+    with pytest.raises(AttributeError):
+        instant.extra = 1
+    with pytest.raises(AttributeError):
+        del instant._YamTimes__datetime
+    assert instant.add_days(1).datetime == datetime(2024, 1, 2)
+    assert instant.datetime == datetime(2024, 1, 1)
@@ -0,0 +1,56 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from yamtimes import YamTimes, YamTimesArray
+from yamtimes.zodiac import ZODIAC_SIGNS, sign_code, zodiac_signs
+
+# Inclusive (start month, start day, end month, end day) of every sign.
+RANGES = {
+    "aries": (3, 21, 4, 19), "taurus": (4, 20, 5, 20), "gemini": (5, 21, 6, 20), "cancer": (6, 21, 7, 22),
+    "leo": (7, 23, 8, 22), "virgo": (8, 23, 9, 22), "libra": (9, 23, 10, 22), "scorpio": (10, 23, 11, 21),
+    "sagittarius": (11, 22, 12, 21), "capricorn": (12, 22, 1, 19), "aquarius": (1, 20, 2, 18),
+    "pisces": (2, 19, 3, 20),
+}
+
+
+def _sign(day):
+    matches = []
+    for name, (start_month, start_day, end_month, end_day) in RANGES.items():
+        start, end = (start_month, start_day), (end_month, end_day)
+        key = (day.month, day.day)
+        if start <= key <= end if start <= end else (key >= start or key <= end):
+            matches.append(name)
+    assert len(matches) == 1, day
+    return matches[0]
+
+
+# Every day of a leap year and the following common year.
+DAYS = [date(2024, 1, 1) + timedelta(days=offset) for offset in range(731)]
+
+
+def test_sign_code_matches_ranges():
+    for day in DAYS:
+        assert ZODIAC_SIGNS[sign_code(day.month, day.day)] == _sign(day), day
+
+
+def test_yamtimes_methods_match_ranges():
+    for day in DAYS:
+        instant = YamTimes(dt=datetime(day.year, day.month, day.day, 23, 59))
+        expected = _sign(day)
+        assert instant.zodiac_sign() == expected
+        assert [name for name in ZODIAC_SIGNS if getattr(instant, "is_%s_sign" % name)()] == [expected], day
+
+
+def test_ends_of_the_range(boundary_datetimes):
+    for dt in boundary_datetimes:
+        assert YamTimes(dt=dt).zodiac_sign() == _sign(dt.date()), dt
+
+
+@pytest.mark.parametrize("source", [list, YamTimesArray])
+def test_zodiac_signs_match_ranges(source, boundary_datetimes):
+    instants = [datetime(day.year, day.month, day.day, hour) for day in DAYS for hour in (0, 23)]
+    instants += [datetime(1969, 12, 31, 23), datetime(1900, 3, 1), datetime(1600, 2, 29)] + boundary_datetimes
+    assert [ZODIAC_SIGNS[code] for code in zodiac_signs(source(instants))] == [
+        _sign(instant.date()) for instant in instants
+    ]
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from dateutil import tz
+
+from yamtimes import YamTimes
+from yamtimes._civil import datetime_to_micros, micros_to_datetime
+from yamtimes.zones import CompiledZone, convert_zone_micros, get_zone
+
+KEYS = ["America/New_York", "Europe/Lisbon", "Australia/Lord_Howe", "Asia/Kolkata", "America/Sao_Paulo"]
+
+# Wall-clock instants around the 2024 transitions of the zones above, plus a few ordinary ones.
+INSTANTS = [
+    datetime(2024, 1, 15, 12, 0),
+    datetime(2024, 3, 10, 1, 59), datetime(2024, 3, 10, 2, 30), datetime(2024, 3, 10, 3, 0),
+    datetime(2024, 3, 31, 0, 30), datetime(2024, 3, 31, 1, 30), datetime(2024, 3, 31, 2, 30),
+    datetime(2024, 4, 7, 1, 45), datetime(2024, 4, 7, 2, 15),
+    datetime(2024, 10, 6, 2, 15),
+    datetime(2024, 10, 27, 1, 30),
+    datetime(2024, 11, 3, 0, 59), datetime(2024, 11, 3, 1, 30), datetime(2024, 11, 3, 2, 0),
+    datetime(1950, 6, 1), datetime(2070, 7, 4, 9, 30),
+]
+
+
+def test_get_zone_keys():
+    assert get_zone("UTC") is timezone.utc
+    zone = get_zone("Europe/Lisbon")
+    assert isinstance(zone, CompiledZone)
+    assert get_zone(ZoneInfo("Europe/Lisbon")) is zone
+    assert get_zone(zone) is zone
+
+
+@pytest.mark.parametrize("name", ["Nowhere/Zone", "", "../etc/passwd"])
+def test_get_zone_unknown(name):
+    with pytest.raises(ValueError):
+        get_zone(name)
+
+
+@pytest.mark.parametrize("zone", [
+    timezone(timedelta(hours=5, minutes=30)),
+    tz.UTC,
+    tz.tzoffset("EST", -5 * 3600),
+    tz.tzlocal(),
+    tz.gettz("America/New_York"),
+])
+def test_get_zone_keyless(zone):
+    assert get_zone(zone) is zone
+
+
+@pytest.mark.parametrize("key", KEYS)
+@pytest.mark.parametrize("fold", [0, 1])
+def test_compiled_offsets(key, fold):
+    compiled = get_zone(key)
+    reference = ZoneInfo(key)
+    for naive in INSTANTS:
+        expected = naive.replace(tzinfo=reference, fold=fold)
+        actual = naive.replace(tzinfo=compiled, fold=fold)
+        assert actual.utcoffset() == expected.utcoffset(), naive
+        assert actual.dst() == expected.dst(), naive
+        assert actual.tzname() == expected.tzname(), naive
+        utc = expected.astimezone(timezone.utc)
+        assert utc.astimezone(compiled).replace(tzinfo=None) == utc.astimezone(reference).replace(tzinfo=None)
+
+
+@pytest.mark.parametrize("key", KEYS)
+def test_first_and_last_days(key):
+    compiled = get_zone(key)
+    reference = ZoneInfo(key)
+    for naive in (datetime.min, datetime(1, 1, 2, 12), datetime(9999, 12, 30, 12), datetime.max):
+        expected = naive.replace(tzinfo=reference)
+        actual = naive.replace(tzinfo=compiled)
+        assert (actual.utcoffset(), actual.dst(), actual.tzname()) == (
+            expected.utcoffset(), expected.dst(), expected.tzname()), naive
+    assert YamTimes(dt=datetime.max, tz=key).is_dst() == bool(datetime.max.replace(tzinfo=reference).dst())
+
+
+@pytest.mark.parametrize("source, target", [
+    ("America/New_York", "Europe/Lisbon"),
+    ("Australia/Lord_Howe", "UTC"),
+    ("UTC", "America/Sao_Paulo"),
+    (tz.gettz("America/New_York"), "Asia/Kolkata"),
+    ("Europe/Lisbon", tz.tzoffset(None, 3600)),
+    (timezone(timedelta(hours=-3)), tz.gettz("Europe/Lisbon")),
+])
+def test_convert_zone_micros(source, target):
+    def reference(zone):
+        if isinstance(zone, str):
+            return timezone.utc if zone == "UTC" else ZoneInfo(zone)
+        return zone
+
+    micros = [datetime_to_micros(naive) + 123 for naive in INSTANTS]
+    expected = [
+        naive.replace(microsecond=123, tzinfo=reference(source)).astimezone(reference(target)).replace(tzinfo=None)
+        for naive in INSTANTS
+    ]
+    assert [micros_to_datetime(int(value)) for value in convert_zone_micros(micros, source, target)] == expected
+
+
+@pytest.mark.parametrize("zone", [tz.UTC, tz.tzoffset("X", 3600), tz.gettz("America/New_York")])
+def test_yamtimes_with_dateutil_zones(zone):
+    dt = datetime(2024, 7, 1, 12, tzinfo=zone)
+    instant = YamTimes(dt=datetime(2024, 7, 1, 12), tz=zone)
+    assert instant.datetime == dt
+    assert instant.to_zone("UTC").datetime == dt.astimezone(timezone.utc)
@@ -1,5 +1,40 @@
-from .yamtimes import YamTimes
+from importlib import import_module
 
 __version__ = '0.0.1'
 
-__all__ = ['YamTimes']
\ No newline at end of file
+__all__ = ['YamTimes', 'YamTimesArray', 'BusinessCalendar', 'TimeRange', 'Recurrence', 'YamInterval', 'IntervalIndex', 'YamCursor',
+           'SystemClock', 'FrozenClock', 'CoarseClock', 'use_clock',
+           'Scheduler', 'Every', 'compile_cron']
+
+# Public names and the submodule defining each one. Submodules are imported on first
+# attribute access, so `import yamtimes` stays cheap for short-lived processes.
+_LAZY_ATTRIBUTES = {
+    'YamTimes': '.yamtimes',
+    'YamTimesArray': '.columnar',
+    'BusinessCalendar': '.business',
+    'TimeRange': '.recurrence',
+    'Recurrence': '.recurrence',
+    'YamInterval': '.intervals',
+    'IntervalIndex': '.intervals',
+    'YamCursor': '.cursor',
+    'SystemClock': '.clock',
+    'FrozenClock': '.clock',
+    'CoarseClock': '.clock',
+    'use_clock': '.clock',
+    'Scheduler': '.scheduler',
+    'Every': '.scheduler',
+    'compile_cron': '.cron',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,293 @@
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+
+US_PER_SECOND = 1000000
+US_PER_MINUTE = 60 * US_PER_SECOND
+US_PER_HOUR = 60 * US_PER_MINUTE
+US_PER_DAY = 24 * US_PER_HOUR
+US_PER_WEEK = 7 * US_PER_DAY
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+PERIODS = ("second", "minute", "hour", "day", "week", "month", "quarter", "year")
+
+
+def is_leap(year):
+    """
+    Determines if the given year (or array of years) is a leap year.
+
+    Works element-wise when given a NumPy array.
+    """
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def days_in_month(year: int, month: int) -> int:
+    """
+    Returns the number of days in the given month of the given year.
+    """
+    if month == 2 and is_leap(year):
+        return 29
+    return MONTH_LENGTHS[month - 1]
+
+
+def shift_months(year: int, month: int, day: int, months: int) -> tuple:
+    """
+    Moves a civil date by a number of calendar months, clamping the day to the end of the target month.
+
+    Returns:
+    - tuple: The (year, month, day) of the shifted date.
+    """
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    month += 1
+    return year, month, min(day, days_in_month(year, month))
+
+
+def add_months_to_datetime(dt: datetime, months: int) -> datetime:
+    """
+    Returns the datetime moved by a number of calendar months, keeping the time of day and tzinfo.
+    """
+    if not months:
+        return dt
+    year, month, day = shift_months(dt.year, dt.month, dt.day, months)
+    return dt.replace(year=year, month=month, day=day)
+
+
+def months_between(start: datetime, end: datetime) -> int:
+    """
+    Returns the whole calendar months from start to end, with the semantics of dateutil's relativedelta:
+    adding the result to start with add_months_to_datetime never goes past end.
+    """
+    months = (end.year - start.year) * 12 + end.month - start.month
+    candidate = add_months_to_datetime(start, months)
+    if months > 0 and candidate > end:
+        months -= 1
+    elif months < 0 and candidate < end:
+        months += 1
+    return months
+
+
+def shift_datetime(dt: datetime, years=0, months=0, days=0, hours=0, minutes=0, seconds=0) -> datetime:
+    """
+    Shifts a single datetime by calendar years and months, then by a fixed duration,
+    the same way arithmetic.shift_micros shifts a buffer.
+    """
+    dt = add_months_to_datetime(dt, years * 12 + months)
+    if days or hours or minutes or seconds:
+        dt = dt + timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+    return dt
+
+
+def days_from_civil(year, month, day):
+    """
+    Converts a proleptic Gregorian date into the number of days since 1970-01-01.
+
+    The algorithm is branch-free, so the same code works on plain integers and
+    element-wise on NumPy integer arrays.
+    """
+    year = year - (month <= 2)
+    era = year // 400
+    yoe = year - era * 400
+    mp = (month + 9) % 12
+    doy = (153 * mp + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def civil_from_days(days):
+    """
+    Converts a number of days since 1970-01-01 into a (year, month, day) tuple.
+
+    Like days_from_civil, this works on plain integers and on NumPy integer arrays.
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 - 12 * (mp >= 10)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def weekday_from_days(days):
+    """
+    Returns the weekday (Monday is 0 and Sunday is 6) of a day count since 1970-01-01.
+    """
+    return (days + 3) % 7
+
+
+def day_of_year_from_days(days):
+    """
+    Returns the 1-based day of the year of a day count since 1970-01-01.
+    """
+    year = civil_from_days(days)[0]
+    return days - days_from_civil(year, 1, 1) + 1
+
+
+def iso_week_from_days(days):
+    """
+    Returns the ISO 8601 (week_year, week) pair of a day count since 1970-01-01.
+
+    The ISO week belongs to the year that contains its Thursday.
+    """
+    thursday = days - weekday_from_days(days) + 3
+    year = civil_from_days(thursday)[0]
+    return year, (thursday - days_from_civil(year, 1, 1)) // 7 + 1
+
+
+YearTable = namedtuple("YearTable", "leap month_lengths month_offsets jan1_weekday iso_weeks")
+YearTable.__doc__ = """
+Precomputed calendar facts of one year.
+
+- leap (bool): Whether the year is a leap year.
+- month_lengths (tuple): The number of days of each month, January first.
+- month_offsets (tuple): The number of days in the year before each month, January first.
+- jan1_weekday (int): The weekday of January 1st (Monday is 0 and Sunday is 6).
+- iso_weeks (int): The number of ISO 8601 weeks of the year (52 or 53).
+"""
+
+
+@lru_cache(maxsize=1024)
+def year_table(year: int) -> YearTable:
+    """
+    Returns the calendar table of a year, computed once and cached.
+    """
+    leap = bool(is_leap(year))
+    lengths = MONTH_LENGTHS[:1] + (29 if leap else 28,) + MONTH_LENGTHS[2:]
+    offsets = [0]
+    for length in lengths[:-1]:
+        offsets.append(offsets[-1] + length)
+    jan1_weekday = weekday_from_days(days_from_civil(year, 1, 1))
+    # A year has 53 ISO weeks when it starts on a Thursday, or on a Wednesday in a leap year.
+    iso_weeks = 53 if jan1_weekday == 3 or (leap and jan1_weekday == 2) else 52
+    return YearTable(leap, lengths, tuple(offsets), jan1_weekday, iso_weeks)
+
+
+def ordinal_day(year: int, month: int, day: int) -> int:
+    """
+    Returns the 1-based day of the year of a civil date.
+    """
+    return year_table(year).month_offsets[month - 1] + day
+
+
+def _iso_week_in_year(table: YearTable, month: int, day: int) -> int:
+    # The ISO week counted within the calendar year: 0 for days that belong to the
+    # last week of the previous year, iso_weeks + 1 for days in week 1 of the next one.
+    day_of_year = table.month_offsets[month - 1] + day
+    weekday = (table.jan1_weekday + day_of_year - 1) % 7
+    return (day_of_year - weekday + 9) // 7
+
+
+def iso_week_number(year: int, month: int, day: int) -> int:
+    """
+    Returns the ISO 8601 week number (1 to 53) of a civil date.
+    """
+    table = year_table(year)
+    week = _iso_week_in_year(table, month, day)
+    if week < 1:
+        return year_table(year - 1).iso_weeks
+    if week > table.iso_weeks:
+        return 1
+    return week
+
+
+def iso_week_year(year: int, month: int, day: int) -> int:
+    """
+    Returns the ISO 8601 week-numbering year of a civil date, which differs from the
+    calendar year for a few days around January 1st.
+    """
+    table = year_table(year)
+    week = _iso_week_in_year(table, month, day)
+    if week < 1:
+        return year - 1
+    if week > table.iso_weeks:
+        return year + 1
+    return year
+
+
+def datetime_to_micros(dt: datetime) -> int:
+    """
+    Returns the wall-clock time of a datetime as microseconds since 1970-01-01 00:00.
+
+    Any tzinfo is ignored: the value encodes the civil date and time as displayed.
+    """
+    days = dt.toordinal() - EPOCH_ORDINAL
+    seconds = days * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+    return seconds * US_PER_SECOND + dt.microsecond
+
+
+def micros_to_datetime(micros: int) -> datetime:
+    """
+    Returns the naive datetime encoded by a count of wall-clock microseconds since 1970-01-01 00:00.
+    """
+    return EPOCH + timedelta(microseconds=int(micros))
+
+
+def to_datetime(value) -> datetime:
+    """
+    Coerces a YamTimes instance, datetime or date into a datetime.
+
+    Raises:
+    - TypeError: If the value cannot be interpreted as a point in time.
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    to_dt = getattr(value, "to_datetime", None)
+    if to_dt is not None:
+        return to_dt()
+    raise TypeError("The argument must be a YamTimes, datetime or date instance")
+
+
+def to_micros(value) -> int:
+    """
+    Coerces a YamTimes instance, datetime, date or integer into wall-clock microseconds since the epoch.
+
+    Integers are assumed to already be microseconds since the epoch.
+    """
+    if isinstance(value, int):
+        return value
+    return datetime_to_micros(to_datetime(value))
+
+
+def check_period(period: str, every: int) -> None:
+    """
+    Validates a period name and a group size for truncation and bucketing.
+
+    Raises:
+    - ValueError: If the period is not one of PERIODS or every is not positive.
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period: {period!r}. Expected one of {', '.join(PERIODS)}")
+    if every < 1:
+        raise ValueError("every must be a positive integer")
+
+
+def micros_buffer(values) -> tuple:
+    """
+    Coerces a YamTimesArray, a buffer of epoch microseconds, or an iterable of instants into
+    wall-clock microseconds.
+
+    Returns:
+    - tuple: (numpy, a NumPy int64 array) with NumPy installed, otherwise (None, an `array('q')`).
+    """
+    # Imported here: array and NumPy are not needed to import YamTimes.
+    from array import array
+
+    from ._compat import np
+
+    if hasattr(values, "micros"):
+        values = values.micros
+    elif not isinstance(values, array) and not (np is not None and isinstance(values, np.ndarray)):
+        values = [to_micros(value) for value in values]
+    if np is not None:
+        return np, np.asarray(values, dtype=np.int64)
+    return None, values if isinstance(values, array) else array("q", values)
@@ -0,0 +1,146 @@
+from array import array
+from datetime import timedelta
+
+from ._civil import (
+    MONTH_LENGTHS,
+    US_PER_DAY,
+    US_PER_SECOND,
+    civil_from_days,
+    days_from_civil,
+    is_leap,
+    shift_datetime,
+    shift_months,
+)
+from ._compat import np
+
+
+def _delta_micros(days=0, hours=0, minutes=0, seconds=0) -> int:
+    delta = timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+    return (delta.days * 86400 + delta.seconds) * US_PER_SECOND + delta.microseconds
+
+
+def _check_steps(count: int, steps: int) -> None:
+    if steps != count:
+        raise ValueError(f"Expected one month count per instant ({count}), got {steps}")
+
+
+def add_months_micros(micros, months):
+    """
+    Adds calendar months to a buffer of epoch microseconds, clamping to the end of the month.
+
+    Parameters:
+    - micros: A NumPy int64 array, `array('q')` or iterable of epoch microseconds.
+    - months (int or sequence): The number of months to add, either one value for all instants or one per instant.
+
+    Returns:
+    - A NumPy int64 array when NumPy is available, otherwise an `array('q')`.
+
+    Raises:
+    - ValueError: If months is a sequence whose length differs from the number of instants.
+    """
+    if np is not None:
+        micros = np.asarray(micros, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        # A single instant may still be shifted by many month counts, as the difference kernels do.
+        if months.ndim and micros.ndim:
+            _check_steps(len(micros), len(months))
+        days = micros // US_PER_DAY
+        time_of_day = micros - days * US_PER_DAY
+        year, month, day = civil_from_days(days)
+        total = year * 12 + month - 1 + months
+        year = total // 12
+        month = total % 12 + 1
+        limit = np.array(MONTH_LENGTHS, dtype=np.int64)[month - 1] + ((month == 2) & is_leap(year))
+        day = np.minimum(day, limit)
+        return days_from_civil(year, month, day) * US_PER_DAY + time_of_day
+
+    if isinstance(months, int):
+        steps = [months] * len(micros)
+    else:
+        steps = months
+        _check_steps(len(micros), len(steps))
+    result = array("q")
+    for value, step in zip(micros, steps):
+        days, time_of_day = divmod(value, US_PER_DAY)
+        year, month, day = civil_from_days(days)
+        year, month, day = shift_months(year, month, day, step)
+        result.append(days_from_civil(year, month, day) * US_PER_DAY + time_of_day)
+    return result
+
+
+def shift_micros(micros, years=0, months=0, days=0, hours=0, minutes=0, seconds=0):
+    """
+    Shifts a buffer of epoch microseconds by calendar years and months, then by a fixed duration.
+
+    Years and months are applied first with end-of-month clamping, matching the
+    behaviour of YamTimes.after.
+
+    Returns:
+    - A NumPy int64 array when NumPy is available, otherwise an `array('q')`.
+    """
+    total_months = years * 12 + months
+    if np is not None:
+        micros = np.asarray(micros, dtype=np.int64)
+    elif not isinstance(micros, array):
+        micros = array("q", micros)
+    if total_months:
+        micros = add_months_micros(micros, total_months)
+    delta = _delta_micros(days, hours, minutes, seconds)
+    if not delta:
+        return micros
+    if np is not None:
+        return micros + delta
+    return array("q", [value + delta for value in micros])
+
+
+def shift(instants, years=0, months=0, days=0, hours=0, minutes=0, seconds=0):
+    """
+    Shifts every instant of a collection by the given calendar period.
+
+    Parameters:
+    - instants: A YamTimesArray, or a list of YamTimes instances or datetimes.
+    - years, months, days, hours, minutes, seconds (int): The period to add. Can be negative.
+
+    Returns:
+    - A YamTimesArray when given one, otherwise a list with the same element types as the input.
+    """
+    if hasattr(instants, "micros"):
+        return type(instants).from_micros(
+            shift_micros(instants.micros, years, months, days, hours, minutes, seconds)
+        )
+    shifted = []
+    for instant in instants:
+        if hasattr(instant, "to_datetime"):
+            dt = shift_datetime(instant.to_datetime(), years, months, days, hours, minutes, seconds)
+            shifted.append(type(instant)(dt=dt))
+        else:
+            shifted.append(shift_datetime(instant, years, months, days, hours, minutes, seconds))
+    return shifted
+
+
+def add_months(instants, months: int):
+    """
+    Adds calendar months to every instant of a collection, clamping to the end of the month.
+
+    Parameters:
+    - instants: A YamTimesArray, or a list of YamTimes instances or datetimes.
+    - months (int): The number of months to add. Can be positive or negative.
+
+    Returns:
+    - A YamTimesArray when given one, otherwise a list with the same element types as the input.
+    """
+    return shift(instants, months=months)
+
+
+def add_years(instants, years: int):
+    """
+    Adds calendar years to every instant of a collection. February 29th is clamped to February 28th.
+
+    Parameters:
+    - instants: A YamTimesArray, or a list of YamTimes instances or datetimes.
+    - years (int): The number of years to add. Can be positive or negative.
+
+    Returns:
+    - A YamTimesArray when given one, otherwise a list with the same element types as the input.
+    """
+    return shift(instants, years=years)
@@ -0,0 +1,231 @@
+"""
+Compact binary encodings of instants.
+
+A single instant is 8 bytes: its wall-clock microseconds since 1970-01-01 as a
+little-endian int64. Aware (or fold=1) instants append one flag byte and their
+zone: an IANA key in UTF-8, or a fixed UTC offset in microseconds.
+
+Collections hold naive instants only. They are written as a version byte, the
+count, and the differences between consecutive instants, zigzag- and
+varint-encoded, so sorted timestamps a few seconds apart take 4 bytes each
+instead of 8. With NumPy installed both directions run over whole buffers
+without creating a Python object per instant.
+"""
+from array import array
+from datetime import datetime, timedelta, timezone
+from struct import Struct
+
+from ._civil import datetime_to_micros, micros_to_datetime, to_datetime
+
+_INT64 = Struct("<q")
+
+# Flag byte of aware instants: the low bits give the kind of zone that follows.
+_NAIVE = 0
+_ZONE_KEY = 1
+_FIXED_OFFSET = 2
+_KIND_MASK = 0x03
+_FOLD = 0x80
+
+_VERSION = 1
+# An int64 takes at most 10 varint bytes.
+_MAX_VARINT = 10
+
+
+def pack_datetime(dt: datetime) -> bytes:
+    """
+    Encodes a datetime, including its fold and zone.
+
+    Raises:
+    - ValueError: If the tzinfo is neither a fixed offset nor a zone with an IANA key.
+    """
+    packed = _INT64.pack(datetime_to_micros(dt))
+    tz = dt.tzinfo
+    if tz is None:
+        return packed + bytes([_NAIVE | _FOLD]) if dt.fold else packed
+    fold = _FOLD if dt.fold else 0
+    if isinstance(tz, timezone):
+        offset = tz.utcoffset(None)
+        return packed + bytes([_FIXED_OFFSET | fold]) + _INT64.pack(offset // timedelta(microseconds=1))
+    key = getattr(tz, "key", None) or getattr(tz, "zone", None)
+    if not key:
+        raise ValueError(f"Cannot encode the time zone {tz!r}: it has no IANA key")
+    return packed + bytes([_ZONE_KEY | fold]) + key.encode("utf-8")
+
+
+def unpack_datetime(data) -> datetime:
+    """
+    Decodes a datetime written by pack_datetime. Zones come back as yamtimes.zones.get_zone returns them.
+
+    Parameters:
+    - data (bytes-like): The encoded instant.
+
+    Raises:
+    - ValueError: If the data is not a valid encoded instant.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < 8:
+        raise ValueError(f"An encoded instant has at least 8 bytes, got {len(view)}")
+    try:
+        dt = micros_to_datetime(_INT64.unpack_from(view)[0])
+    except OverflowError:
+        raise ValueError("The encoded instant is out of the datetime range") from None
+    if len(view) == 8:
+        return dt
+    flags = view[8]
+    kind = flags & _KIND_MASK
+    if kind == _NAIVE and len(view) == 9:
+        tz = None
+    elif kind == _FIXED_OFFSET and len(view) == 17:
+        tz = timezone(timedelta(microseconds=_INT64.unpack_from(view, 9)[0]))
+    elif kind == _ZONE_KEY and len(view) > 9:
+        from .zones import get_zone
+
+        tz = get_zone(bytes(view[9:]).decode("utf-8"))
+    else:
+        raise ValueError("Invalid encoded instant")
+    return dt.replace(tzinfo=tz, fold=1 if flags & _FOLD else 0)
+
+
+def _naive_micros(value) -> int:
+    # Collections hold wall-clock times only, so an aware instant would silently lose its zone.
+    dt = to_datetime(value)
+    if dt.tzinfo is not None:
+        raise ValueError(f"Cannot encode the aware instant {dt!r} in a collection; convert it to naive first")
+    return datetime_to_micros(dt)
+
+
+def _micros(instants):
+    from ._compat import np
+
+    if hasattr(instants, "micros"):
+        instants = instants.micros
+    elif not isinstance(instants, array) and not (np is not None and isinstance(instants, np.ndarray)):
+        instants = [value if isinstance(value, int) else _naive_micros(value) for value in instants]
+    if np is not None:
+        return np, np.asarray(instants, dtype=np.int64)
+    return None, instants
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(view, position: int) -> tuple:
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(view) or shift >= 7 * _MAX_VARINT:
+            raise ValueError("Truncated or invalid varint")
+        byte = view[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def encode_many(instants) -> bytes:
+    """
+    Encodes a collection of instants as zigzag/varint deltas, as wall-clock times.
+
+    Sorted or nearly sorted collections compress best, but any order round-trips.
+
+    Parameters:
+    - instants: A YamTimesArray, a buffer of epoch microseconds, or an iterable of naive YamTimes
+      instances, datetimes, dates or integers.
+
+    Returns:
+    - bytes: The encoded collection, for decode_many.
+
+    Raises:
+    - ValueError: If an instant is aware. Use pack_datetime to keep a zone.
+    """
+    np, micros = _micros(instants)
+    header = bytearray([_VERSION])
+    _write_varint(header, len(micros))
+    if np is None:
+        out = header
+        previous = 0
+        for value in micros:
+            delta = value - previous
+            previous = value
+            _write_varint(out, (delta << 1) ^ (delta >> 63))
+        return bytes(out)
+    deltas = np.diff(micros, prepend=np.int64(0))
+    zigzag = ((deltas << 1) ^ (deltas >> 63)).view(np.uint64)
+    lengths = np.ones(len(zigzag), dtype=np.int64)
+    for index in range(1, _MAX_VARINT):
+        lengths += zigzag >= np.uint64(1 << (7 * index))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    out = np.empty(int(ends[-1]) if len(ends) else 0, dtype=np.uint8)
+    # One pass per byte position: the index-th byte of every varint that long. Most
+    # deltas of a sorted column have the same length, so whole passes skip the masking.
+    for index in range(int(lengths.max()) if len(lengths) else 0):
+        selected = lengths > index
+        if selected.all():
+            values, positions, long = zigzag, starts, lengths > index + 1
+        else:
+            values, positions, long = zigzag[selected], starts[selected], lengths[selected] > index + 1
+        chunk = (values >> np.uint64(7 * index)).astype(np.uint8) & 0x7F
+        chunk |= long.astype(np.uint8) << 7
+        out[positions + index] = chunk
+    return bytes(header) + out.tobytes()
+
+
+def decode_many(data):
+    """
+    Decodes a collection written by encode_many, straight into a YamTimesArray.
+
+    Parameters:
+    - data (bytes-like): The encoded collection, e.g. bytes or a memoryview over shared memory.
+      It is read in place, without copying.
+
+    Returns:
+    - YamTimesArray: The instants, as wall-clock times.
+
+    Raises:
+    - ValueError: If the data is not a valid encoded collection.
+    """
+    from ._compat import np
+    from .columnar import YamTimesArray
+
+    view = memoryview(data).cast("B")
+    if not len(view) or view[0] != _VERSION:
+        raise ValueError("Not an encoded YamTimes collection")
+    count, position = _read_varint(view, 1)
+    if np is None:
+        micros = array("q")
+        previous = 0
+        for _ in range(count):
+            value, position = _read_varint(view, position)
+            previous += (value >> 1) ^ -(value & 1)
+            micros.append(previous)
+        if position != len(view):
+            raise ValueError("Trailing bytes after the encoded collection")
+        return YamTimesArray.from_micros(micros)
+    payload = np.frombuffer(view, dtype=np.uint8, offset=position)
+    ends = np.flatnonzero(payload < 0x80)
+    if len(ends) != count or (count and ends[-1] != len(payload) - 1):
+        raise ValueError("Truncated or invalid encoded collection")
+    if not count:
+        return YamTimesArray.from_micros(np.empty(0, dtype=np.int64))
+    starts = np.empty(count, dtype=np.int64)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts + 1
+    if lengths.max() > _MAX_VARINT:
+        raise ValueError("Truncated or invalid encoded collection")
+    zigzag = np.zeros(count, dtype=np.uint64)
+    for index in range(int(lengths.max())):
+        selected = lengths > index
+        if selected.all():
+            selected, positions = slice(None), starts
+        else:
+            positions = starts[selected]
+        zigzag[selected] |= (payload[positions + index] & 0x7F).astype(np.uint64) << np.uint64(7 * index)
+    deltas = (zigzag >> np.uint64(1)).view(np.int64) ^ -(zigzag & np.uint64(1)).view(np.int64)
+    return YamTimesArray.from_micros(np.cumsum(deltas))
@@ -0,0 +1,196 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+
+from ._civil import EPOCH_ORDINAL, to_datetime
+from .holidays import holidays_between
+
+
+_WEEKDAY_ABBREVIATIONS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def _parse_weekmask(weekmask) -> tuple:
+    if isinstance(weekmask, str):
+        if len(weekmask) == 7 and set(weekmask) <= {"0", "1"}:
+            return tuple(char == "1" for char in weekmask)
+        days = weekmask.split()
+        if not set(days) <= set(_WEEKDAY_ABBREVIATIONS):
+            raise ValueError(f"Invalid weekmask: {weekmask!r}")
+        return tuple(name in days for name in _WEEKDAY_ABBREVIATIONS)
+    mask = tuple(bool(flag) for flag in weekmask)
+    if len(mask) != 7:
+        raise ValueError("The weekmask must have exactly 7 entries, starting on Monday")
+    return mask
+
+
+def _day_number(value) -> int:
+    return to_datetime(value).toordinal() - EPOCH_ORDINAL
+
+
+def _with_day(value, days: int):
+    # Moves `value` to another day, keeping its type and time of day.
+    moved = date.fromordinal(days + EPOCH_ORDINAL)
+    if isinstance(value, datetime):
+        return value.replace(year=moved.year, month=moved.month, day=moved.day)
+    if isinstance(value, date):
+        return moved
+    dt = value.to_datetime()
+    return type(value)(dt=dt.replace(year=moved.year, month=moved.month, day=moved.day))
+
+
+class BusinessCalendar:
+    """
+    A business-day calendar made of a weekmask and a set of holidays.
+
+    Business-day positions are derived arithmetically from the weekmask and a
+    sorted holiday table, so offsets and counts take constant time for the
+    weekly part plus a binary search over the holidays, whatever the span.
+
+    Methods accept YamTimes instances, datetimes or dates and return values of
+    the same type, keeping the time of day.
+    """
+
+    def __init__(self, weekmask="1111100", holidays=()):
+        """
+        Initializes the calendar.
+
+        Parameters:
+        - weekmask (str or sequence): The working days of the week, starting on Monday. Either seven
+          "0"/"1" characters, weekday abbreviations such as "Mon Tue Wed", or seven booleans. Defaults to "1111100".
+        - holidays (iterable): Non-working YamTimes instances, datetimes or dates. Defaults to no holidays.
+        """
+        self.weekmask = _parse_weekmask(weekmask)
+        self._per_week = sum(self.weekmask)
+        if not self._per_week:
+            raise ValueError("The weekmask must contain at least one working day")
+        # _before[w]: working weekdays strictly before weekday w.
+        # _positions[r]: the weekday of the r-th working day of a week.
+        self._before = []
+        self._positions = []
+        for weekday, working in enumerate(self.weekmask):
+            self._before.append(len(self._positions))
+            if working:
+                self._positions.append(weekday)
+        # Only holidays falling on working days change any count.
+        self.holidays = sorted({
+            day for day in map(_day_number, holidays) if self.weekmask[(day + 3) % 7]
+        })
+        # _holiday_rank[i]: number of business days before the i-th holiday.
+        self._holiday_rank = [
+            self._mask_count(day) - index for index, day in enumerate(self.holidays)
+        ]
+
+    @classmethod
+    def for_country(cls, country_code: str, start_year: int, end_year: int, weekmask="1111100") -> "BusinessCalendar":
+        """
+        Creates a calendar with the holidays of a country over a range of years.
+
+        Parameters:
+        - country_code (str): The country or region code, e.g. "US" or "BR".
+        - start_year (int): The first year whose holidays are included.
+        - end_year (int): The last year whose holidays are included.
+        - weekmask (str or sequence): The working days of the week. Defaults to "1111100".
+
+        Returns:
+        - BusinessCalendar: The new calendar.
+        """
+        holidays = holidays_between(date(start_year, 1, 1), date(end_year, 12, 31), country_code)
+        return cls(weekmask, holidays)
+
+    def __repr__(self):
+        mask = "".join("1" if working else "0" for working in self.weekmask)
+        return f"BusinessCalendar(weekmask={mask!r}, holidays={len(self.holidays)})"
+
+    def _mask_count(self, days: int) -> int:
+        # Working weekdays in [1969-12-29, days); that Monday anchors the week arithmetic.
+        weeks, weekday = divmod(days + 3, 7)
+        return weeks * self._per_week + self._before[weekday]
+
+    def _count(self, days: int) -> int:
+        # Business-day index of the first business day on or after `days`.
+        return self._mask_count(days) - bisect_left(self.holidays, days)
+
+    def _nth(self, index: int) -> int:
+        # Day number of the business day with the given index.
+        index += bisect_right(self._holiday_rank, index)
+        weeks, position = divmod(index, self._per_week)
+        return weeks * 7 + self._positions[position] - 3
+
+    def _is_business(self, days: int) -> bool:
+        if not self.weekmask[(days + 3) % 7]:
+            return False
+        position = bisect_left(self.holidays, days)
+        return position == len(self.holidays) or self.holidays[position] != days
+
+    def is_business_day(self, when) -> bool:
+        """
+        Checks if the given day is a business day.
+
+        Parameters:
+        - when (YamTimes, datetime or date): The day to check.
+
+        Returns:
+        - bool: True if the day is a working weekday and not a holiday, False otherwise.
+        """
+        return self._is_business(_day_number(when))
+
+    def roll_forward(self, when):
+        """
+        Returns the given day if it is a business day, otherwise the next business day.
+        """
+        return _with_day(when, self._nth(self._count(_day_number(when))))
+
+    def roll_backward(self, when):
+        """
+        Returns the given day if it is a business day, otherwise the previous business day.
+        """
+        return _with_day(when, self._nth(self._count(_day_number(when) + 1) - 1))
+
+    def next_business_day(self, when):
+        """
+        Returns the first business day strictly after the given day.
+        """
+        return _with_day(when, self._nth(self._count(_day_number(when) + 1)))
+
+    def previous_business_day(self, when):
+        """
+        Returns the last business day strictly before the given day.
+        """
+        return _with_day(when, self._nth(self._count(_day_number(when)) - 1))
+
+    def add_business_days(self, when, days: int, roll: str = "forward"):
+        """
+        Moves a day by a number of business days.
+
+        Parameters:
+        - when (YamTimes, datetime or date): The starting day.
+        - days (int): The number of business days to move. Can be positive or negative.
+        - roll (str): How to treat a starting day that is not a business day: "forward" counts from the
+          next business day and "backward" from the previous one. Defaults to "forward".
+
+        Returns:
+        - The shifted day, with the same type and time of day as `when`.
+        """
+        day = _day_number(when)
+        if roll == "forward":
+            index = self._count(day)
+        elif roll == "backward":
+            index = self._count(day + 1) - 1
+        else:
+            raise ValueError("roll must be 'forward' or 'backward'")
+        return _with_day(when, self._nth(index + days))
+
+    def business_days_between(self, start, end) -> int:
+        """
+        Counts the business days in the half-open range [start, end).
+
+        Parameters:
+        - start (YamTimes, datetime or date): The first day of the range.
+        - end (YamTimes, datetime or date): The day after the last day of the range.
+
+        Returns:
+        - int: The number of business days. Negative if end is before start.
+        """
+        return self._count(_day_number(end)) - self._count(_day_number(start))
+
+
+DEFAULT_CALENDAR = BusinessCalendar()
@@ -0,0 +1,287 @@
+"""
+Command-line interface of yamtimes.
+
+    yamtimes convert events.csv --column created_at --input-format "%d/%m/%Y %H:%M" \\
+        --to-zone America/Sao_Paulo --output-format iso -o converted.csv
+
+The input is streamed in chunks of rows, so memory stays bounded by the chunk
+size whatever the size of the file. With --jobs, chunks are converted by a
+pool of worker processes while the main process reads and writes in order.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+from functools import lru_cache, partial
+
+from ._civil import PERIODS, datetime_to_micros, micros_to_datetime
+from .formats import compile_format
+from .iso import format_iso, parse_iso
+from .periods import floor_micros
+
+ISO = "iso"
+ON_ERROR = ("raise", "skip", "keep")
+
+
+class ConversionError(ValueError):
+    """
+    Raised when a value cannot be converted and --on-error is "raise".
+    """
+
+
+class Converter:
+    """
+    Converts timestamp strings: parse with the input format, move to the output zone,
+    truncate, then format with the output format.
+
+    Instances are built from hashable options, so every worker process compiles the
+    formats and zones once and reuses them for all its chunks.
+    """
+
+    def __init__(self, input_format=ISO, output_format=ISO, from_zone=None, to_zone=None, truncate=None, every=1):
+        self._parse = parse_iso if input_format == ISO else compile_format(input_format).parse
+        self._format = format_iso if output_format == ISO else compile_format(output_format).format
+        from .zones import get_zone
+
+        self._from_zone = get_zone(from_zone) if from_zone else None
+        self._to_zone = get_zone(to_zone) if to_zone else None
+        self._truncate = truncate
+        self._every = every
+        if truncate is not None:
+            floor_micros(0, truncate, every)
+
+    def convert(self, text: str) -> str:
+        """
+        Converts one value.
+
+        Raises:
+        - ValueError: If the value cannot be parsed with the input format.
+        """
+        dt = self._parse(text.strip())
+        if self._from_zone is not None and dt.tzinfo is None:
+            dt = dt.replace(tzinfo=self._from_zone)
+        if self._to_zone is not None:
+            if dt.tzinfo is None:
+                raise ValueError(f"{text!r} has no UTC offset; pass --from-zone to say which zone it is in")
+            dt = dt.astimezone(self._to_zone)
+        if self._truncate is not None:
+            micros = floor_micros(datetime_to_micros(dt), self._truncate, self._every)
+            dt = micros_to_datetime(micros).replace(tzinfo=dt.tzinfo)
+        return self._format(dt)
+
+
+@lru_cache(maxsize=8)
+def _converter(options: tuple) -> Converter:
+    return Converter(*options)
+
+
+def _convert_values(converter: Converter, values, on_error: str, first_line: int) -> list:
+    # Converted values, or None for the rows to drop. Log files repeat timestamps a lot,
+    # so each distinct string of the chunk is converted once.
+    cache = {}
+    result = []
+    for offset, value in enumerate(values):
+        converted = cache.get(value)
+        if converted is None:
+            try:
+                converted = converter.convert(value)
+            except (ValueError, TypeError, OverflowError) as error:
+                if on_error == "raise":
+                    raise ConversionError(f"record {first_line + offset}: {error}") from None
+                converted = None if on_error == "skip" else value
+            else:
+                cache[value] = converted
+        result.append(converted)
+    return result
+
+
+def convert_csv_chunk(options: tuple, column: int, on_error: str, rows: list, first_line: int) -> list:
+    """
+    Converts one column of a chunk of CSV rows, returning the rows to write.
+    """
+    values = [row[column] if column < len(row) else "" for row in rows]
+    converted = _convert_values(_converter(options), values, on_error, first_line)
+    output = []
+    for row, value in zip(rows, converted):
+        if value is None:
+            continue
+        if column < len(row):
+            row[column] = value
+        output.append(row)
+    return output
+
+
+def convert_jsonl_chunk(options: tuple, key: str, on_error: str, lines: list, first_line: int) -> list:
+    """
+    Converts one field of a chunk of JSON Lines, returning the lines to write.
+    """
+    records = []
+    values = []
+    for offset, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            value = record[key]
+        except (ValueError, KeyError, TypeError) as error:
+            if on_error == "raise":
+                raise ConversionError(f"record {first_line + offset}: cannot read field {key!r}: {error}") from None
+            if on_error == "keep":
+                records.append((line.rstrip("\r\n"), None))
+            continue
+        records.append((record, len(values)))
+        values.append(value if isinstance(value, str) else str(value))
+    converted = _convert_values(_converter(options), values, on_error, first_line)
+    output = []
+    for record, index in records:
+        if index is None:
+            output.append(record)
+            continue
+        value = converted[index]
+        if value is None:
+            continue
+        record[key] = value
+        output.append(json.dumps(record, ensure_ascii=False))
+    return output
+
+
+def _chunks(iterable, size: int):
+    chunk = []
+    first = 1
+    for line, item in enumerate(iterable, 1):
+        if not chunk:
+            first = line
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk, first
+            chunk = []
+    if chunk:
+        yield chunk, first
+
+
+def _run_chunks(function, chunks, jobs: int):
+    # Yields the converted chunks in input order, keeping at most two chunks per worker in flight.
+    if jobs <= 1:
+        for chunk, first in chunks:
+            yield function(chunk, first)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for chunk, first in chunks:
+            pending.append(executor.submit(function, chunk, first))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _detect_type(path: str) -> str:
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def _open(path: str, mode: str):
+    if path == "-":
+        stream = sys.stdin if "r" in mode else sys.stdout
+        return io.TextIOWrapper(stream.buffer, encoding="utf-8", newline="", write_through=False), False
+    return open(path, mode, encoding="utf-8", newline="", buffering=1 << 20), True
+
+
+def convert(args) -> int:
+    options = (args.input_format, args.output_format, args.from_zone, args.to_zone, args.truncate, args.every)
+    # Fails early, in the main process, on unknown zones, formats or periods.
+    _converter(options)
+    kind = args.type or _detect_type(args.input)
+    source, close_source = _open(args.input, "r")
+    target, close_target = _open(args.output, "w")
+    try:
+        if kind == "csv":
+            reader = csv.reader(source, delimiter=args.delimiter)
+            writer = csv.writer(target, delimiter=args.delimiter, lineterminator="\n")
+            column = args.column
+            first_line = 1
+            if not args.no_header:
+                header = next(reader, None)
+                if header is None:
+                    return 0
+                writer.writerow(header)
+                first_line = 2
+                column = header.index(column) if column in header else _column_index(column)
+            else:
+                column = _column_index(column)
+            function = partial(convert_csv_chunk, options, column, args.on_error)
+            chunks = ((chunk, first + first_line - 1) for chunk, first in _chunks(reader, args.chunk_size))
+            for rows in _run_chunks(function, chunks, args.jobs):
+                writer.writerows(rows)
+        else:
+            function = partial(convert_jsonl_chunk, options, args.column, args.on_error)
+            for lines in _run_chunks(function, _chunks(source, args.chunk_size), args.jobs):
+                if lines:
+                    target.write("\n".join(lines))
+                    target.write("\n")
+    finally:
+        if close_source:
+            source.close()
+        else:
+            source.detach()
+        if close_target:
+            target.close()
+        else:
+            target.flush()
+            target.detach()
+    return 0
+
+
+def _column_index(column: str) -> int:
+    try:
+        index = int(column)
+    except ValueError:
+        raise ConversionError(f"unknown column {column!r}") from None
+    if index < 0:
+        raise ConversionError("column indexes start at 0")
+    return index
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="yamtimes", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("convert", help="reformat, re-zone or truncate a timestamp column of a CSV or JSONL file")
+    command.add_argument("input", nargs="?", default="-", help="the input file, or - for standard input (the default)")
+    command.add_argument("-o", "--output", default="-", help="the output file, or - for standard output (the default)")
+    command.add_argument("-c", "--column", required=True, help="the CSV column name or 0-based index, or the JSONL field")
+    command.add_argument("--type", choices=("csv", "jsonl"), help="the input type (default: from the file extension, else csv)")
+    command.add_argument("--input-format", default=ISO, help='a strptime format, or "iso" for ISO 8601 (the default)')
+    command.add_argument("--output-format", default=ISO, help='a strftime format, or "iso" for ISO 8601 (the default)')
+    command.add_argument("--from-zone", help="the time zone of values without a UTC offset, e.g. UTC or Europe/Lisbon")
+    command.add_argument("--to-zone", help="the time zone to convert the values to")
+    command.add_argument("--truncate", choices=PERIODS, help="truncate the values to the start of this period")
+    command.add_argument("--every", type=int, default=1, help="with --truncate, the number of periods per bucket (default: 1)")
+    command.add_argument("--delimiter", default=",", help="the CSV delimiter (default: ,)")
+    command.add_argument("--no-header", action="store_true", help="the CSV input has no header row")
+    command.add_argument("--on-error", choices=ON_ERROR, default="raise",
+                         help="what to do with values that cannot be converted: stop (raise, the default), drop the row (skip) or leave it unchanged (keep)")
+    command.add_argument("--chunk-size", type=int, default=20000, help="rows per chunk (default: 20000)")
+    command.add_argument("-j", "--jobs", type=int, default=1, help="worker processes; 0 uses every CPU (default: 1)")
+    command.set_defaults(handler=convert)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "jobs", 1) == 0:
+        args.jobs = os.cpu_count() or 1
+    if getattr(args, "chunk_size", 1) < 1:
+        print("yamtimes: error: --chunk-size must be positive", file=sys.stderr)
+        return 2
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        return 1
+    except (ValueError, OSError) as error:
+        print(f"yamtimes: error: {error}", file=sys.stderr)
+        return 1
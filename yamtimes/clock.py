@@ -0,0 +1,192 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+
+class Clock:
+    """
+    The source of the current time for every YamTimes method that depends on "now".
+
+    Subclasses implement `now`, with the same meaning as `datetime.now(tz)`:
+    a naive local datetime when tz is None, otherwise an aware datetime in tz.
+    """
+
+    def now(self, tz=None) -> datetime:
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """
+    Reads the system clock on every call. This is the default clock.
+    """
+
+    def now(self, tz=None) -> datetime:
+        return datetime.now(tz)
+
+    def __repr__(self):
+        return "SystemClock()"
+
+
+class FrozenClock(Clock):
+    """
+    A clock that always returns the same instant until it is moved explicitly.
+
+    Useful in tests, and to evaluate many time-relative predicates against one snapshot.
+    """
+
+    def __init__(self, instant=None):
+        """
+        Initializes the clock.
+
+        Parameters:
+        - instant (YamTimes or datetime, optional): The frozen instant. Naive values are local
+          times, like the result of `datetime.now()`. Defaults to the current time of the system clock.
+        """
+        self.set(datetime.now(timezone.utc) if instant is None else instant)
+
+    def set(self, instant) -> None:
+        """
+        Moves the clock to another instant.
+
+        Parameters:
+        - instant (YamTimes or datetime): The new frozen instant.
+        """
+        if not isinstance(instant, datetime):
+            to_datetime = getattr(instant, "to_datetime", None)
+            if to_datetime is None:
+                raise TypeError("The instant must be a YamTimes or datetime instance")
+            instant = to_datetime()
+        # Kept as UTC, so that every time zone sees the same instant.
+        self._utc = instant.astimezone(timezone.utc)
+        self._local = self._utc.astimezone().replace(tzinfo=None)
+
+    def advance(self, delta=None, **units) -> None:
+        """
+        Moves the clock forward.
+
+        Parameters:
+        - delta (timedelta, optional): The amount of time to move.
+        - **units: Keyword arguments for timedelta (days, hours, minutes, seconds, ...), used when delta is omitted.
+        """
+        self.set(self._utc + (delta if delta is not None else timedelta(**units)))
+
+    def now(self, tz=None) -> datetime:
+        if tz is None:
+            return self._local
+        return self._utc.astimezone(tz)
+
+    def __repr__(self):
+        return f"FrozenClock({self._utc!r})"
+
+
+class CoarseClock(Clock):
+    """
+    A clock that reads another clock at most once per granularity and returns the cached reading in between.
+
+    Calls within the same window see exactly the same instant, and the cost of a call is a
+    monotonic clock check instead of a system clock read and datetime construction.
+    """
+
+    def __init__(self, granularity: float = 1.0, source: Clock = None):
+        """
+        Initializes the clock.
+
+        Parameters:
+        - granularity (float, optional): How long, in seconds, a reading is reused. Defaults to 1 second.
+        - source (Clock, optional): The clock to read. Defaults to a SystemClock.
+
+        Raises:
+        - ValueError: If the granularity is negative.
+        """
+        if granularity < 0:
+            raise ValueError("The granularity cannot be negative")
+        self.granularity = granularity
+        self.source = source if source is not None else SystemClock()
+        self._expires = float("-inf")
+        self._utc = None
+        self._local = None
+
+    def refresh(self) -> None:
+        """
+        Reads the source clock now, starting a new window.
+        """
+        utc = self.source.now(timezone.utc)
+        self._utc, self._local = utc, utc.astimezone().replace(tzinfo=None)
+        self._expires = time.monotonic() + self.granularity
+
+    def now(self, tz=None) -> datetime:
+        if time.monotonic() >= self._expires:
+            self.refresh()
+        if tz is None:
+            return self._local
+        if tz is timezone.utc:
+            return self._utc
+        return self._utc.astimezone(tz)
+
+    def __repr__(self):
+        return f"CoarseClock(granularity={self.granularity!r}, source={self.source!r})"
+
+
+_clock = SystemClock()
+
+
+def get_clock() -> Clock:
+    """
+    Returns the clock currently used by YamTimes.
+    """
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """
+    Replaces the clock used by YamTimes, for the whole process.
+
+    Parameters:
+    - clock (Clock): The new clock, or None to restore the system clock.
+
+    Returns:
+    - Clock: The previous clock, so that it can be restored.
+    """
+    global _clock
+    previous = _clock
+    _clock = clock if clock is not None else SystemClock()
+    return previous
+
+
+class use_clock:
+    """
+    A context manager that installs a clock and restores the previous one on exit.
+
+        with use_clock(FrozenClock(datetime(2024, 1, 1, 12))):
+            assert YamTimes(dt=datetime(2023, 12, 31)).is_past()
+    """
+
+    def __init__(self, clock: Clock):
+        self.clock = clock
+        self._previous = None
+
+    def __enter__(self) -> Clock:
+        self._previous = set_clock(self.clock)
+        return self.clock
+
+    def __exit__(self, *exc_info):
+        set_clock(self._previous)
+        return False
+
+
+def snapshot() -> use_clock:
+    """
+    Returns a context manager that freezes the current clock at its present reading.
+
+    Every "now"-relative method called inside the block sees the same instant:
+
+        with snapshot():
+            recent = [event for event in events if event.is_in_current_week()]
+    """
+    return use_clock(FrozenClock(_clock.now(timezone.utc)))
+
+
+def current_datetime(tz=None) -> datetime:
+    """
+    Returns the current time from the installed clock, like `datetime.now(tz)`.
+    """
+    return _clock.now(tz)
@@ -0,0 +1,443 @@
+from array import array
+
+from ._civil import (
+    MONTH_LENGTHS,
+    US_PER_DAY,
+    civil_from_days,
+    day_of_year_from_days,
+    is_leap,
+    iso_week_from_days,
+    micros_to_datetime,
+    to_micros,
+    weekday_from_days,
+)
+from ._compat import np
+from .arithmetic import add_months_micros, shift_micros
+from .binary import decode_many, encode_many
+from .formats import DEFAULT_FORMAT, compile_format
+from .iso import parse_iso_many
+from .periods import bucket_keys, bucketize, ceil_many, floor_many
+from .relative import at_or_after, before, between, classify, reference_boundaries
+from .yamtimes import YamTimes
+from .zodiac import zodiac_signs
+from .zones import convert_zone_micros
+
+
+_QUARTER_NAMES = ("Q1", "Q2", "Q3", "Q4")
+
+
+class YamTimesArray:
+    """
+    A columnar container of instants stored as a contiguous int64 buffer of
+    wall-clock microseconds since 1970-01-01 00:00.
+
+    Calendar queries run in bulk over the whole buffer: with NumPy installed
+    they are vectorized, otherwise they fall back to a single pass over an
+    `array('q')`. Query results are NumPy arrays, or `array` instances
+    (with 0/1 values for boolean masks) in the fallback mode.
+    """
+
+    def __init__(self, values=()):
+        """
+        Initializes the YamTimesArray from an iterable of instants.
+
+        Parameters:
+        - values (iterable): YamTimes instances, datetimes, dates or integer microseconds since the epoch.
+        """
+        micros = [to_micros(value) for value in values]
+        if np is not None:
+            self._micros = np.array(micros, dtype=np.int64)
+        else:
+            self._micros = array("q", micros)
+
+    @classmethod
+    def from_micros(cls, micros) -> "YamTimesArray":
+        """
+        Creates a YamTimesArray that wraps an existing buffer of epoch microseconds.
+
+        The buffer is used without copying when it already has the native storage type
+        (a NumPy int64 array, or an `array('q')` when NumPy is not available).
+
+        Parameters:
+        - micros: A buffer or iterable of integer microseconds since the epoch.
+
+        Returns:
+        - YamTimesArray: A new YamTimesArray backed by the given values.
+        """
+        self = cls.__new__(cls)
+        if np is not None:
+            self._micros = np.asarray(micros, dtype=np.int64)
+        elif isinstance(micros, array) and micros.typecode == "q":
+            self._micros = micros
+        else:
+            self._micros = array("q", micros)
+        return self
+
+    @classmethod
+    def from_bytes(cls, data) -> "YamTimesArray":
+        """
+        Decodes a YamTimesArray written by to_bytes, reading the data in place.
+
+        Parameters:
+        - data (bytes-like): The encoded instants, e.g. bytes or a memoryview.
+
+        Returns:
+        - YamTimesArray: The decoded instants.
+        """
+        return decode_many(data)
+
+    @classmethod
+    def from_strings(cls, strings, format: str = DEFAULT_FORMAT) -> "YamTimesArray":
+        """
+        Creates a YamTimesArray by parsing an iterable of strings with a single compiled format.
+
+        Parameters:
+        - strings (iterable): The strings to parse.
+        - format (str): The format the strings are in. Defaults to "%Y-%m-%d %H:%M:%S".
+
+        Returns:
+        - YamTimesArray: A new YamTimesArray with the parsed instants.
+        """
+        return cls(compile_format(format).parse_many(strings))
+
+    @classmethod
+    def from_iso_strings(cls, items) -> "YamTimesArray":
+        """
+        Creates a YamTimesArray by parsing an iterable of ISO 8601 strings or bytes.
+
+        Instants keep the wall-clock time written in the string; UTC offsets are not applied.
+
+        Parameters:
+        - items (iterable): The ISO 8601 strings or bytes, e.g. the lines of a file.
+
+        Returns:
+        - YamTimesArray: A new YamTimesArray with the parsed instants.
+        """
+        return cls(parse_iso_many(items))
+
+    @property
+    def micros(self):
+        """
+        Returns the underlying buffer of wall-clock microseconds since the epoch.
+        """
+        return self._micros
+
+    def __len__(self) -> int:
+        return len(self._micros)
+
+    def __iter__(self):
+        for micros in self._micros:
+            yield YamTimes(dt=micros_to_datetime(micros))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return YamTimesArray.from_micros(self._micros[index])
+        return YamTimes(dt=micros_to_datetime(self._micros[index]))
+
+    def __repr__(self):
+        return f"YamTimesArray(len={len(self)})"
+
+    def to_datetimes(self) -> list:
+        """
+        Materializes the instants as a list of naive datetime objects.
+        """
+        return [micros_to_datetime(micros) for micros in self._micros]
+
+    def to_strings(self, format: str = DEFAULT_FORMAT) -> list:
+        """
+        Formats every instant with a single compiled format.
+
+        Parameters:
+        - format (str): The format to use. Defaults to "%Y-%m-%d %H:%M:%S".
+
+        Returns:
+        - list: The formatted strings, in order.
+        """
+        return compile_format(format).format_many(self.to_datetimes())
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the instants as delta- and varint-packed bytes (see yamtimes.binary), which
+        take about half the space of the raw buffer for sorted timestamps.
+        """
+        return encode_many(self._micros)
+
+    def to_list(self) -> list:
+        """
+        Materializes the instants as a list of YamTimes instances.
+        """
+        return list(self)
+
+    def _days(self):
+        if np is not None:
+            return self._micros // US_PER_DAY
+        return [micros // US_PER_DAY for micros in self._micros]
+
+    def _apply(self, kernel, typecode: str = "q"):
+        days = self._days()
+        if np is not None:
+            return kernel(days)
+        return array(typecode, [kernel(day) for day in days])
+
+    def year(self):
+        """
+        Returns the year of every instant.
+        """
+        return self._apply(lambda days: civil_from_days(days)[0])
+
+    def month(self):
+        """
+        Returns the month (1-12) of every instant.
+        """
+        return self._apply(lambda days: civil_from_days(days)[1])
+
+    def day_of_month(self):
+        """
+        Returns the day of the month of every instant.
+        """
+        return self._apply(lambda days: civil_from_days(days)[2])
+
+    def weekday_number(self):
+        """
+        Returns the day of the week of every instant, where Monday is 0 and Sunday is 6.
+        """
+        return self._apply(weekday_from_days)
+
+    def is_weekend(self):
+        """
+        Returns a mask that is true for instants falling on a Saturday or Sunday.
+        """
+        return self._apply(lambda days: weekday_from_days(days) >= 5, "B")
+
+    def is_weekday(self):
+        """
+        Returns a mask that is true for instants falling between Monday and Friday.
+        """
+        return self._apply(lambda days: weekday_from_days(days) < 5, "B")
+
+    def is_past(self, reference=None):
+        """
+        Returns a mask that is true for instants before the reference.
+
+        Parameters:
+        - reference (YamTimes, datetime, date or int, optional): The instant taken as "now". Defaults to
+          the current time of the installed clock, read once for the whole batch.
+        """
+        return before(self._micros, reference_boundaries(reference).now)
+
+    def is_future(self, reference=None):
+        """
+        Returns a mask that is true for instants after the reference.
+        """
+        return at_or_after(self._micros, reference_boundaries(reference).now + 1)
+
+    def is_today(self, reference=None):
+        """
+        Returns a mask that is true for instants on the same day as the reference.
+        """
+        boundaries = reference_boundaries(reference)
+        return between(self._micros, boundaries.today, boundaries.tomorrow)
+
+    def is_before_today(self, reference=None):
+        """
+        Returns a mask that is true for instants on a day before the day of the reference.
+        """
+        return before(self._micros, reference_boundaries(reference).today)
+
+    def is_after_today(self, reference=None):
+        """
+        Returns a mask that is true for instants on a day after the day of the reference.
+        """
+        return at_or_after(self._micros, reference_boundaries(reference).tomorrow)
+
+    def is_in_current_week(self, reference=None):
+        """
+        Returns a mask that is true for instants in the week (Monday to Sunday) of the reference.
+        """
+        boundaries = reference_boundaries(reference)
+        return between(self._micros, boundaries.week_start, boundaries.next_week)
+
+    def is_same_week(self, other):
+        """
+        Returns a mask that is true for instants in the same week (Monday to Sunday) as another instant.
+
+        Parameters:
+        - other (YamTimes, datetime, date or int): The instant to compare against.
+        """
+        return self.is_in_current_week(other)
+
+    def is_in_current_month(self, reference=None):
+        """
+        Returns a mask that is true for instants in the month of the reference.
+        """
+        boundaries = reference_boundaries(reference)
+        return between(self._micros, boundaries.month_start, boundaries.next_month)
+
+    def is_in_current_year(self, reference=None):
+        """
+        Returns a mask that is true for instants in the year of the reference.
+        """
+        boundaries = reference_boundaries(reference)
+        return between(self._micros, boundaries.year_start, boundaries.next_year)
+
+    def classify(self, reference=None):
+        """
+        Buckets every instant relative to the reference in a single pass.
+
+        Each instant gets the code of the most specific period that contains it: relative.TODAY,
+        THIS_WEEK, THIS_MONTH or THIS_YEAR, otherwise PAST or FUTURE. relative.BUCKET_LABELS names the
+        codes, and `numpy.bincount(codes, minlength=6)` counts them.
+
+        Parameters:
+        - reference (YamTimes, datetime, date or int, optional): The instant taken as "now". Defaults to
+          the current time of the installed clock.
+
+        Returns:
+        - A NumPy int8 array when NumPy is available, otherwise an `array('b')`.
+        """
+        return classify(self._micros, reference_boundaries(reference))
+
+    def zodiac_signs(self):
+        """
+        Returns the zodiac sign code of every instant, from a single table lookup per instant.
+
+        Returns:
+        - A NumPy uint8 array, or an `array('B')` without NumPy. yamtimes.zodiac.ZODIAC_SIGNS[code] names each code.
+        """
+        return zodiac_signs(self._micros)
+
+    def current_quarter(self):
+        """
+        Returns the quarter of the year (1-4) of every instant.
+        """
+        return self._apply(lambda days: (civil_from_days(days)[1] - 1) // 3 + 1)
+
+    def quarter(self) -> list:
+        """
+        Returns the quarter of every instant as a string ("Q1", "Q2", "Q3", or "Q4").
+        """
+        return [_QUARTER_NAMES[quarter - 1] for quarter in self.current_quarter()]
+
+    def day_of_year(self):
+        """
+        Returns the day of the year of every instant.
+        """
+        return self._apply(day_of_year_from_days)
+
+    def week_number(self):
+        """
+        Returns the ISO 8601 week number of every instant.
+        """
+        return self._apply(lambda days: iso_week_from_days(days)[1])
+
+    def is_leap_year(self):
+        """
+        Returns a mask that is true for instants falling in a leap year.
+        """
+        return self._apply(lambda days: is_leap(civil_from_days(days)[0]), "B")
+
+    def days_in_month(self):
+        """
+        Returns the number of days in the month of every instant.
+        """
+        if np is not None:
+            year, month, _ = civil_from_days(self._days())
+            lengths = np.array(MONTH_LENGTHS, dtype=np.int64)[month - 1]
+            return lengths + ((month == 2) & is_leap(year))
+        result = array("q")
+        for days in self._days():
+            year, month, _ = civil_from_days(days)
+            result.append(MONTH_LENGTHS[month - 1] + (month == 2 and is_leap(year)))
+        return result
+
+    def add_months(self, months) -> "YamTimesArray":
+        """
+        Adds calendar months to every instant, clamping to the end of the month.
+
+        Parameters:
+        - months (int or sequence): The number of months to add, either one value for all instants or one per instant.
+
+        Returns:
+        - YamTimesArray: A new YamTimesArray with the shifted instants.
+        """
+        return YamTimesArray.from_micros(add_months_micros(self._micros, months))
+
+    def add_years(self, years: int) -> "YamTimesArray":
+        """
+        Adds calendar years to every instant. February 29th is clamped to February 28th.
+
+        Parameters:
+        - years (int): The number of years to add. Can be positive or negative.
+
+        Returns:
+        - YamTimesArray: A new YamTimesArray with the shifted instants.
+        """
+        return YamTimesArray.from_micros(shift_micros(self._micros, years=years))
+
+    def shift(self, years=0, months=0, days=0, hours=0, minutes=0, seconds=0) -> "YamTimesArray":
+        """
+        Shifts every instant by calendar years and months, then by a fixed duration.
+
+        Returns:
+        - YamTimesArray: A new YamTimesArray with the shifted instants.
+        """
+        return YamTimesArray.from_micros(shift_micros(self._micros, years, months, days, hours, minutes, seconds))
+
+    def truncate(self, period: str, every: int = 1) -> "YamTimesArray":
+        """
+        Moves every instant to the start of its period, like YamTimes.truncate.
+
+        Parameters:
+        - period (str): One of "second", "minute", "hour", "day", "week", "month", "quarter" or "year".
+        - every (int, optional): Groups that many consecutive periods into one. Defaults to 1.
+
+        Returns:
+        - YamTimesArray: A new YamTimesArray with the truncated instants.
+        """
+        return YamTimesArray.from_micros(floor_many(self._micros, period, every))
+
+    def floor(self, period: str, every: int = 1) -> "YamTimesArray":
+        """
+        Moves every instant to the start of its period. This is the same as truncate.
+        """
+        return self.truncate(period, every)
+
+    def ceil(self, period: str, every: int = 1) -> "YamTimesArray":
+        """
+        Moves every instant to the first period boundary at or after it, like YamTimes.ceil.
+        """
+        return YamTimesArray.from_micros(ceil_many(self._micros, period, every))
+
+    def bucket_keys(self, period: str, every: int = 1):
+        """
+        Returns the integer key of the period containing every instant, for grouping.
+
+        See periods.bucket_keys; periods.bucket_starts turns keys back into instants.
+        """
+        return bucket_keys(self._micros, period, every)
+
+    def bucketize(self, period: str, every: int = 1) -> tuple:
+        """
+        Counts the instants in every period.
+
+        Returns:
+        - tuple: (keys, counts), the sorted distinct bucket keys and the number of instants in each.
+        """
+        return bucketize(self._micros, period, every)
+
+    def convert_zone(self, from_zone, to_zone) -> "YamTimesArray":
+        """
+        Converts every wall-clock instant from one time zone to another in a single pass.
+
+        Offsets come from the compiled transition table of each zone, so the cost per instant is a
+        binary search rather than a tzinfo call. Ambiguous or skipped wall-clock times in the source
+        zone are resolved like datetime does with fold=0.
+
+        Parameters:
+        - from_zone (str or tzinfo): The zone the stored wall-clock times are expressed in, e.g. "UTC".
+        - to_zone (str or tzinfo): The zone to express them in, e.g. "America/New_York".
+
+        Returns:
+        - YamTimesArray: A new YamTimesArray with the wall-clock times in the target zone.
+        """
+        return YamTimesArray.from_micros(convert_zone_micros(self._micros, from_zone, to_zone))
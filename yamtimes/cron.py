@@ -0,0 +1,344 @@
+from functools import lru_cache
+
+from ._civil import (
+    US_PER_SECOND,
+    civil_from_days,
+    datetime_to_micros,
+    days_from_civil,
+    days_in_month,
+    micros_to_datetime,
+    to_datetime,
+)
+from .yamtimes import YamTimes
+
+SECONDS_PER_DAY = 86400
+
+_MONTH_NAMES = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+_WEEKDAY_NAMES = ("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT")
+
+_MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+# (name, lowest value, highest value, names of the values from the lowest one)
+_SECOND = ("second", 0, 59, ())
+_MINUTE = ("minute", 0, 59, ())
+_HOUR = ("hour", 0, 23, ())
+_DAY = ("day of month", 1, 31, ())
+_MONTH = ("month", 1, 12, _MONTH_NAMES)
+_WEEKDAY = ("day of week", 0, 7, _WEEKDAY_NAMES)
+
+
+def _next_bit(mask: int, value: int) -> int:
+    # The smallest set bit at or above `value`, or -1.
+    rest = mask >> value
+    if not rest:
+        return -1
+    return value + (rest & -rest).bit_length() - 1
+
+
+def _previous_bit(mask: int, value: int) -> int:
+    # The largest set bit at or below `value`, or -1.
+    if value < 0:
+        return -1
+    return (mask & ((2 << value) - 1)).bit_length() - 1
+
+
+def _value(text: str, field: tuple) -> int:
+    name, low, high, names = field
+    upper = text.upper()
+    if upper in names:
+        return low + names.index(upper)
+    try:
+        value = int(text)
+    except ValueError:
+        raise ValueError(f"Invalid {name} value: {text!r}") from None
+    if not low <= value <= high:
+        raise ValueError(f"The {name} value {value} is out of range ({low}-{high})")
+    return value
+
+
+def _parse_field(text: str, field: tuple) -> int:
+    # The bitset of the values selected by one field: bit n is set when value n matches.
+    name, low, high, _ = field
+    mask = 0
+    for part in text.split(","):
+        expression, _, step = part.partition("/")
+        if step:
+            try:
+                step = int(step)
+            except ValueError:
+                raise ValueError(f"Invalid {name} step: {part!r}") from None
+            if step < 1:
+                raise ValueError(f"The {name} step must be positive: {part!r}")
+        else:
+            step = 1
+        if expression in ("*", "?"):
+            start, end = low, high
+        elif "-" in expression:
+            first, _, last = expression.partition("-")
+            start, end = _value(first, field), _value(last, field)
+            if start > end:
+                raise ValueError(f"Invalid {name} range: {part!r}")
+        else:
+            start = _value(expression, field)
+            # "5/15" means from 5 to the end of the range, every 15.
+            end = high if part != expression else start
+        for value in range(start, end + 1, step):
+            mask |= 1 << value
+    return mask
+
+
+class CronExpression:
+    """
+    A cron expression compiled into one bitset per field.
+
+    Fire times are found by jumping field by field (month, then day, hour, minute and
+    second) to the next set bit, so a lookup takes a handful of steps however sparse the
+    schedule is. Expressions have five fields (minute hour day-of-month month day-of-week)
+    or six, with seconds first. Fields accept *, values, names (JAN, MON), ranges, lists
+    and /steps; Sunday is 0 or 7, and @yearly, @monthly, @weekly, @daily and @hourly are
+    understood. As in Vixie cron, when both the day of month and the day of week are
+    restricted, a day matches when either does; otherwise it must match both. A field
+    counts as unrestricted when it starts with * or ?, even with a step such as */7.
+
+    Instances are obtained through compile_cron, which caches them. They also work as rules
+    for yamtimes.scheduler.Scheduler.
+    """
+
+    def __init__(self, expression: str):
+        """
+        Compiles the given expression.
+
+        Raises:
+        - ValueError: If the expression is malformed or can never fire, e.g. "0 0 30 2 *".
+        """
+        self.expression = expression
+        fields = _MACROS.get(expression.strip().lower(), expression).split()
+        if len(fields) == 5:
+            fields.insert(0, "0")
+        elif len(fields) != 6:
+            raise ValueError(f"A cron expression has 5 or 6 fields, got {len(fields)}: {expression!r}")
+        second, minute, hour, day, month, weekday = fields
+        self._seconds = _parse_field(second, _SECOND)
+        self._minutes = _parse_field(minute, _MINUTE)
+        self._hours = _parse_field(hour, _HOUR)
+        self._days = _parse_field(day, _DAY)
+        self._months = _parse_field(month, _MONTH)
+        weekdays = _parse_field(weekday, _WEEKDAY)
+        # Sunday is both 0 and 7.
+        weekdays = (weekdays | weekdays >> 7) & 0x7F
+        # A field starting with * or ? only decides how the day and weekday masks combine:
+        # either, when both are restricted, otherwise both. Its values still apply, so
+        # "*/7" in the day of week field still means Sundays only.
+        self._day_restricted = not day.startswith(("*", "?"))
+        self._weekday_restricted = not weekday.startswith(("*", "?"))
+        # For every weekday of the 1st of a month (0 is Sunday), the days of the month whose
+        # weekday is selected, as a bitset over days 1-31.
+        self._weekday_days = tuple(
+            sum(1 << day for day in range(1, 32) if weekdays >> ((first + day - 1) % 7) & 1)
+            for first in range(7)
+        )
+        if not (self._day_restricted and self._weekday_restricted):
+            longest = [29 if month == 2 else days_in_month(2000, month) for month in range(1, 13)]
+            if not any(self._months >> month & 1 and self._days & ((2 << longest[month - 1]) - 1)
+                       for month in range(1, 13)):
+                raise ValueError(f"The cron expression {expression!r} never fires")
+
+    def __repr__(self):
+        return f"CronExpression({self.expression!r})"
+
+    def _month_days(self, year: int, month: int) -> int:
+        # The bitset of the matching days of one month.
+        length = days_in_month(year, month)
+        first = (days_from_civil(year, month, 1) + 4) % 7
+        if self._day_restricted and self._weekday_restricted:
+            days = self._days | self._weekday_days[first]
+        else:
+            days = self._days & self._weekday_days[first]
+        return days & ((2 << length) - 2)
+
+    def next_micros(self, micros: int):
+        """
+        Returns the first fire time strictly after an instant, in wall-clock microseconds since the epoch,
+        or None past year 9999.
+        """
+        seconds = micros // US_PER_SECOND + 1
+        year, month, day = civil_from_days(seconds // SECONDS_PER_DAY)
+        seconds %= SECONDS_PER_DAY
+        hour, minute, second = seconds // 3600, seconds // 60 % 60, seconds % 60
+        while year <= 9999:
+            found = _next_bit(self._months, month)
+            if found < 0:
+                year, month, day, hour, minute, second = year + 1, 1, 1, 0, 0, 0
+                continue
+            if found != month:
+                month, day, hour, minute, second = found, 1, 0, 0, 0
+            found = _next_bit(self._month_days(year, month), day)
+            if found < 0:
+                if month == 12:
+                    year, month = year + 1, 1
+                else:
+                    month += 1
+                day, hour, minute, second = 1, 0, 0, 0
+                continue
+            if found != day:
+                day, hour, minute, second = found, 0, 0, 0
+            found = _next_bit(self._hours, hour)
+            if found < 0:
+                day, hour, minute, second = day + 1, 0, 0, 0
+                continue
+            if found != hour:
+                hour, minute, second = found, 0, 0
+            found = _next_bit(self._minutes, minute)
+            if found < 0:
+                hour, minute, second = hour + 1, 0, 0
+                continue
+            if found != minute:
+                minute, second = found, 0
+            found = _next_bit(self._seconds, second)
+            if found < 0:
+                minute, second = minute + 1, 0
+                continue
+            days = days_from_civil(year, month, day)
+            return ((days * 24 + hour) * 60 + minute) * 60 * US_PER_SECOND + found * US_PER_SECOND
+        return None
+
+    def previous_micros(self, micros: int):
+        """
+        Returns the last fire time strictly before an instant, in wall-clock microseconds since the epoch,
+        or None before year 1.
+        """
+        seconds = -(-micros // US_PER_SECOND) - 1
+        year, month, day = civil_from_days(seconds // SECONDS_PER_DAY)
+        seconds %= SECONDS_PER_DAY
+        hour, minute, second = seconds // 3600, seconds // 60 % 60, seconds % 60
+        while year >= 1:
+            found = _previous_bit(self._months, month)
+            if found < 0:
+                year, month, day, hour, minute, second = year - 1, 12, 31, 23, 59, 59
+                continue
+            if found != month:
+                month, day, hour, minute, second = found, 31, 23, 59, 59
+            found = _previous_bit(self._month_days(year, month), day)
+            if found < 0:
+                if month == 1:
+                    year, month = year - 1, 12
+                else:
+                    month -= 1
+                day, hour, minute, second = 31, 23, 59, 59
+                continue
+            if found != day:
+                day, hour, minute, second = found, 23, 59, 59
+            found = _previous_bit(self._hours, hour)
+            if found < 0:
+                day, hour, minute, second = day - 1, 23, 59, 59
+                continue
+            if found != hour:
+                hour, minute, second = found, 59, 59
+            found = _previous_bit(self._minutes, minute)
+            if found < 0:
+                hour, minute, second = hour - 1, 59, 59
+                continue
+            if found != minute:
+                minute, second = found, 59
+            found = _previous_bit(self._seconds, second)
+            if found < 0:
+                minute, second = minute - 1, 59
+                continue
+            days = days_from_civil(year, month, day)
+            return ((days * 24 + hour) * 60 + minute) * 60 * US_PER_SECOND + found * US_PER_SECOND
+        return None
+
+    def matches(self, instant) -> bool:
+        """
+        Checks whether the cron expression fires at an instant (to the second).
+        """
+        micros = datetime_to_micros(to_datetime(instant))
+        return self.next_micros(micros - 1) == micros
+
+    def next_fire(self, after):
+        """
+        Returns the first fire time strictly after an instant.
+
+        Parameters:
+        - after (YamTimes, datetime or date): The reference instant, in the wall-clock time of its zone.
+
+        Returns:
+        - YamTimes: The next fire time, with the tzinfo of `after`, or None past year 9999.
+        """
+        dt = to_datetime(after)
+        micros = self.next_micros(datetime_to_micros(dt))
+        return None if micros is None else _instant(micros, dt.tzinfo)
+
+    def previous_fire(self, before):
+        """
+        Returns the last fire time strictly before an instant.
+
+        Parameters:
+        - before (YamTimes, datetime or date): The reference instant, in the wall-clock time of its zone.
+
+        Returns:
+        - YamTimes: The previous fire time, with the tzinfo of `before`, or None before year 1.
+        """
+        dt = to_datetime(before)
+        micros = self.previous_micros(datetime_to_micros(dt))
+        return None if micros is None else _instant(micros, dt.tzinfo)
+
+    def iter_micros(self, start: int, end: int = None):
+        """
+        Lazily yields the fire times after `start` and up to `end` (both excluded), as wall-clock
+        microseconds since the epoch.
+        """
+        micros = self.next_micros(start)
+        while micros is not None and (end is None or micros < end):
+            yield micros
+            micros = self.next_micros(micros)
+
+    def fires_between(self, start, end, inclusive: bool = True):
+        """
+        Lazily yields the fire times between two instants.
+
+        Parameters:
+        - start (YamTimes, datetime or date): The beginning of the window.
+        - end (YamTimes, datetime or date): The end of the window.
+        - inclusive (bool): Whether fire times equal to start or end are included. Defaults to True.
+
+        Returns:
+        - generator: The YamTimes fire times in the window, in order, with the tzinfo of `start`.
+        """
+        first = to_datetime(start)
+        low = datetime_to_micros(first)
+        high = datetime_to_micros(to_datetime(end))
+        if inclusive:
+            low, high = low - 1, high + 1
+        for micros in self.iter_micros(low, high):
+            yield _instant(micros, first.tzinfo)
+
+
+def _instant(micros: int, tzinfo) -> YamTimes:
+    dt = micros_to_datetime(micros)
+    if tzinfo is not None:
+        dt = dt.replace(tzinfo=tzinfo)
+    return YamTimes(dt=dt)
+
+
+@lru_cache(maxsize=256)
+def compile_cron(expression: str) -> CronExpression:
+    """
+    Returns the compiled form of a cron expression, reusing it from an LRU cache when possible.
+
+    Parameters:
+    - expression (str): A five-field (minute hour day month weekday) or six-field (with seconds first)
+      cron expression, or a macro such as "@daily".
+
+    Returns:
+    - CronExpression: The compiled expression.
+    """
+    return CronExpression(expression)
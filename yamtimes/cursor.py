@@ -0,0 +1,455 @@
+import operator
+from datetime import datetime
+
+from ._civil import (
+    US_PER_DAY,
+    US_PER_HOUR,
+    US_PER_MINUTE,
+    US_PER_SECOND,
+    US_PER_WEEK,
+    civil_from_days,
+    datetime_to_micros,
+    days_from_civil,
+    iso_week_number,
+    micros_to_datetime,
+    ordinal_day,
+    shift_months,
+    to_datetime,
+    to_micros,
+    year_table,
+)
+from .clock import current_datetime
+from .yamtimes import YamTimes
+
+
+class YamCursor:
+    """
+    A mutable instant for tight loops.
+
+    A cursor keeps the wall-clock time as an integer count of microseconds
+    since 1970-01-01 00:00 (plus its tzinfo), and its
+    arithmetic methods move it in place and return the cursor itself, so
+    stepping through a year minute by minute allocates no YamTimes or
+    datetime objects. The calendar fields of the current day are cached
+    until the cursor crosses midnight.
+
+    The common queries (`year`, `hour`, `weekday_number`, `is_weekend`, ...)
+    are answered from the integer. Any other YamTimes method is looked up on
+    a YamTimes materialized from the current position, so it returns the
+    same values (and new YamTimes instances rather than the cursor).
+    Use `to_yamtimes()` to take a snapshot explicitly.
+
+    Cursors compare with YamTimes instances, datetimes and dates the way
+    datetimes do: aware instants in different zones are compared in UTC.
+    """
+
+    __slots__ = ("_micros", "_tzinfo", "_days", "_fields")
+
+    def __init__(self, start=None):
+        """
+        Initializes the cursor.
+
+        Parameters:
+        - start (YamTimes, datetime, date or int, optional): The starting instant. Defaults to the current time.
+        """
+        if start is None:
+            start = current_datetime()
+        if isinstance(start, YamTimes):
+            start = start.datetime
+        self._tzinfo = getattr(start, "tzinfo", None)
+        self._micros = to_micros(start)
+        self._days = None
+        self._fields = None
+
+    def _date(self) -> tuple:
+        # (year, month, day) of the current position, recomputed only after crossing a day boundary.
+        days = self._micros // US_PER_DAY
+        if days != self._days:
+            self._days = days
+            self._fields = civil_from_days(days)
+        return self._fields
+
+    def _set_date(self, year: int, month: int, day: int, time_of_day: int) -> "YamCursor":
+        self._micros = days_from_civil(year, month, day) * US_PER_DAY + time_of_day
+        return self
+
+    @property
+    def micros(self) -> int:
+        """
+        Returns the position as wall-clock microseconds since the epoch.
+        """
+        return self._micros
+
+    def __getattr__(self, name):
+        # Only called for names the cursor does not implement itself.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.to_yamtimes(), name)
+
+    def to_datetime(self) -> datetime:
+        """
+        Returns the current position as a datetime, with the tzinfo of the cursor.
+        """
+        dt = micros_to_datetime(self._micros)
+        if self._tzinfo is not None:
+            dt = dt.replace(tzinfo=self._tzinfo)
+        return dt
+
+    def to_yamtimes(self) -> YamTimes:
+        """
+        Returns a YamTimes instance for the current position. Later moves of the cursor do not affect it.
+        """
+        return YamTimes(dt=self.to_datetime())
+
+    def copy(self) -> "YamCursor":
+        """
+        Returns an independent cursor at the same position.
+        """
+        other = YamCursor.__new__(YamCursor)
+        other._micros = self._micros
+        other._tzinfo = self._tzinfo
+        other._days = self._days
+        other._fields = self._fields
+        return other
+
+    def move_to(self, instant) -> "YamCursor":
+        """
+        Moves the cursor to another instant, taking its tzinfo. An integer is a wall-clock
+        position in the cursor's current zone.
+
+        Parameters:
+        - instant (YamTimes, datetime, date or int): The new position.
+
+        Returns:
+        - YamCursor: The cursor itself.
+        """
+        if isinstance(instant, YamTimes):
+            instant = instant.datetime
+        if not isinstance(instant, int):
+            self._tzinfo = getattr(instant, "tzinfo", None)
+        self._micros = to_micros(instant)
+        return self
+
+    def add_micros(self, micros: int) -> "YamCursor":
+        """
+        Moves the cursor by a number of microseconds.
+
+        Returns:
+        - YamCursor: The cursor itself.
+        """
+        self._micros += micros
+        return self
+
+    def add_seconds(self, seconds: int) -> "YamCursor":
+        """
+        Moves the cursor by a number of seconds, like YamTimes.add_seconds.
+
+        Returns:
+        - YamCursor: The cursor itself.
+        """
+        self._micros += round(seconds * US_PER_SECOND)
+        return self
+
+    def subtract_seconds(self, seconds: int) -> "YamCursor":
+        """
+        Moves the cursor back by a number of seconds.
+        """
+        return self.add_seconds(-seconds)
+
+    def add_minutes(self, minutes: int) -> "YamCursor":
+        """
+        Moves the cursor by a number of minutes, like YamTimes.add_minutes.
+
+        Returns:
+        - YamCursor: The cursor itself.
+        """
+        self._micros += round(minutes * US_PER_MINUTE)
+        return self
+
+    def subtract_minutes(self, minutes: int) -> "YamCursor":
+        """
+        Moves the cursor back by a number of minutes.
+        """
+        return self.add_minutes(-minutes)
+
+    def add_hours(self, hours: int) -> "YamCursor":
+        """
+        Moves the cursor by a number of hours, like YamTimes.add_hours.
+
+        Returns:
+        - YamCursor: The cursor itself.
+        """
+        self._micros += round(hours * US_PER_HOUR)
+        return self
+
+    def subtract_hours(self, hours: int) -> "YamCursor":
+        """
+        Moves the cursor back by a number of hours.
+        """
+        return self.add_hours(-hours)
+
+    def add_days(self, days: int) -> "YamCursor":
+        """
+        Moves the cursor by a number of days, like YamTimes.add_days.
+
+        Returns:
+        - YamCursor: The cursor itself.
+        """
+        self._micros += round(days * US_PER_DAY)
+        return self
+
+    def subtract_days(self, days: int) -> "YamCursor":
+        """
+        Moves the cursor back by a number of days.
+        """
+        return self.add_days(-days)
+
+    def next_day(self) -> "YamCursor":
+        """
+        Moves the cursor one day forward.
+        """
+        self._micros += US_PER_DAY
+        return self
+
+    def previous_day(self) -> "YamCursor":
+        """
+        Moves the cursor one day back.
+        """
+        self._micros -= US_PER_DAY
+        return self
+
+    def next_week(self) -> "YamCursor":
+        """
+        Moves the cursor one week forward.
+        """
+        self._micros += US_PER_WEEK
+        return self
+
+    def last_week(self) -> "YamCursor":
+        """
+        Moves the cursor one week back.
+        """
+        self._micros -= US_PER_WEEK
+        return self
+
+    def add_months(self, months: int) -> "YamCursor":
+        """
+        Moves the cursor by calendar months, clamping the day to the end of the month like YamTimes.add_months.
+
+        Returns:
+        - YamCursor: The cursor itself.
+        """
+        if months:
+            year, month, day = self._date()
+            self._set_date(*shift_months(year, month, day, months), self._micros % US_PER_DAY)
+        return self
+
+    def subtract_months(self, months: int) -> "YamCursor":
+        """
+        Moves the cursor back by calendar months.
+        """
+        return self.add_months(-months)
+
+    def add_years(self, years: int) -> "YamCursor":
+        """
+        Moves the cursor by calendar years, clamping February 29 like YamTimes.add_years.
+        """
+        return self.add_months(years * 12)
+
+    def subtract_years(self, years: int) -> "YamCursor":
+        """
+        Moves the cursor back by calendar years.
+        """
+        return self.add_months(-years * 12)
+
+    def set_time(self, hour: int = 0, minute: int = 0, second: int = 0) -> "YamCursor":
+        """
+        Sets the time of day, like YamTimes.set_time.
+
+        Raises:
+        - ValueError: If a field is out of range.
+
+        Returns:
+        - YamCursor: The cursor itself.
+        """
+        if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60):
+            raise ValueError(f"Invalid time: {hour:02d}:{minute:02d}:{second:02d}")
+        days = self._micros // US_PER_DAY
+        self._micros = days * US_PER_DAY + hour * US_PER_HOUR + minute * US_PER_MINUTE + second * US_PER_SECOND
+        return self
+
+    def set_to_midnight(self) -> "YamCursor":
+        """
+        Sets the time of day to 00:00:00.
+        """
+        self._micros -= self._micros % US_PER_DAY
+        return self
+
+    def set_to_noon(self) -> "YamCursor":
+        """
+        Sets the time of day to 12:00:00.
+        """
+        return self.set_time(12)
+
+    def start_of_week(self) -> "YamCursor":
+        """
+        Moves the cursor to Monday 00:00:00 of the current week.
+        """
+        days = self._micros // US_PER_DAY
+        self._micros = (days - (days + 3) % 7) * US_PER_DAY
+        return self
+
+    def end_of_week(self) -> "YamCursor":
+        """
+        Moves the cursor to Sunday 23:59:59.999999 of the current week.
+        """
+        days = self._micros // US_PER_DAY
+        self._micros = (days + 6 - (days + 3) % 7 + 1) * US_PER_DAY - 1
+        return self
+
+    def start_of_month(self) -> "YamCursor":
+        """
+        Moves the cursor to the first day of the month at 00:00:00.
+        """
+        year, month, _ = self._date()
+        return self._set_date(year, month, 1, 0)
+
+    def end_of_month(self) -> "YamCursor":
+        """
+        Moves the cursor to the last day of the month at 23:59:59.999999.
+        """
+        year, month, _ = self._date()
+        return self._set_date(year, month, year_table(year).month_lengths[month - 1], US_PER_DAY - 1)
+
+    def start_of_year(self) -> "YamCursor":
+        """
+        Moves the cursor to January 1st at 00:00:00.
+        """
+        return self._set_date(self._date()[0], 1, 1, 0)
+
+    def end_of_year(self) -> "YamCursor":
+        """
+        Moves the cursor to December 31st at 23:59:59.999999.
+        """
+        return self._set_date(self._date()[0], 12, 31, US_PER_DAY - 1)
+
+    def year(self) -> int:
+        """
+        Returns the year of the current position.
+        """
+        return self._date()[0]
+
+    def month(self) -> int:
+        """
+        Returns the month of the current position.
+        """
+        return self._date()[1]
+
+    def day_of_month(self) -> int:
+        """
+        Returns the day of the month of the current position.
+        """
+        return self._date()[2]
+
+    def hour(self) -> int:
+        """
+        Returns the hour of the current position.
+        """
+        return self._micros % US_PER_DAY // US_PER_HOUR
+
+    def minute(self) -> int:
+        """
+        Returns the minute of the current position.
+        """
+        return self._micros % US_PER_HOUR // US_PER_MINUTE
+
+    def second(self) -> int:
+        """
+        Returns the second of the current position.
+        """
+        return self._micros % US_PER_MINUTE // US_PER_SECOND
+
+    def weekday_number(self) -> int:
+        """
+        Returns the day of the week, where Monday is 0 and Sunday is 6.
+        """
+        return (self._micros // US_PER_DAY + 3) % 7
+
+    def is_weekend(self) -> bool:
+        """
+        Checks if the current position is on a Saturday or Sunday.
+        """
+        return self.weekday_number() >= 5
+
+    def is_weekday(self) -> bool:
+        """
+        Checks if the current position is on a day from Monday to Friday.
+        """
+        return self.weekday_number() < 5
+
+    def day_of_year(self) -> int:
+        """
+        Returns the day of the year of the current position.
+        """
+        return ordinal_day(*self._date())
+
+    def days_in_month(self) -> int:
+        """
+        Returns the number of days in the month of the current position.
+        """
+        year, month, _ = self._date()
+        return year_table(year).month_lengths[month - 1]
+
+    def is_leap_year(self) -> bool:
+        """
+        Checks if the year of the current position is a leap year.
+        """
+        return year_table(self._date()[0]).leap
+
+    def week_number(self) -> int:
+        """
+        Returns the ISO 8601 week number of the current position.
+        """
+        return iso_week_number(*self._date())
+
+    def _compare(self, other, op):
+        # Same zone (or both naive): wall-clock micros, like datetime. Otherwise defer to datetime, which
+        # compares aware instants in UTC and refuses to order aware against naive ones.
+        if isinstance(other, int):
+            return op(self._micros, other)
+        if isinstance(other, YamCursor):
+            if other._tzinfo is self._tzinfo:
+                return op(self._micros, other._micros)
+            other = other.to_datetime()
+        else:
+            try:
+                other = to_datetime(other)
+            except TypeError:
+                return NotImplemented
+            if other.tzinfo is self._tzinfo:
+                return op(self._micros, datetime_to_micros(other))
+        return op(self.to_datetime(), other)
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    # Mutable, so not hashable.
+    __hash__ = None
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __str__(self):
+        return str(self.to_datetime())
+
+    def __repr__(self):
+        return f"YamCursor({self.to_datetime()!r})"
@@ -0,0 +1,260 @@
+from array import array
+from datetime import datetime, timedelta
+
+from ._civil import (
+    US_PER_DAY,
+    US_PER_HOUR,
+    US_PER_MINUTE,
+    US_PER_SECOND,
+    civil_from_days,
+    datetime_to_micros,
+    micros_to_datetime,
+    months_between,
+    to_datetime,
+)
+from ._compat import np
+from .arithmetic import add_months_micros
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+# How aware operands are read. Elapsed-time kernels subtract instants, so aware values are
+# taken in UTC, as datetime subtraction does. Calendar kernels compare the end on the wall
+# clock of the start's zone, like YamTimes.months_until. Raw kernels read the displayed wall
+# clock and ignore zones, like YamTimes.years_difference.
+_UTC = "utc"
+_ALIGNED = "aligned"
+_WALL = "wall"
+
+
+def _instant(value):
+    # Integers are already microseconds; anything else becomes a datetime.
+    if hasattr(value, "__index__"):
+        return value.__index__()
+    return to_datetime(value)
+
+
+def _split(value):
+    # Returns (True, instant) for a single instant, otherwise (False, instants) where the
+    # instants are a list, or the buffer of a YamTimesArray or of raw microseconds.
+    if hasattr(value, "micros"):
+        return False, value.micros
+    if hasattr(value, "__index__") or hasattr(value, "to_datetime") or not hasattr(value, "__iter__"):
+        return True, _instant(value)
+    if isinstance(value, array) or (np is not None and isinstance(value, np.ndarray)):
+        return False, value
+    return False, [_instant(item) for item in value]
+
+
+def _is_aware(value) -> bool:
+    return isinstance(value, datetime) and value.tzinfo is not None
+
+
+def _has_aware(value, single: bool) -> bool:
+    # Buffers of microseconds are always wall-clock values.
+    if single:
+        return _is_aware(value)
+    return isinstance(value, list) and any(_is_aware(item) for item in value)
+
+
+def _buffer(values):
+    if np is not None:
+        return np.asarray(values, dtype=np.int64)
+    return values if isinstance(values, array) else array("q", values)
+
+
+def _micros(value, single: bool):
+    if single:
+        return value if isinstance(value, int) else datetime_to_micros(value)
+    if isinstance(value, list):
+        value = [item if isinstance(item, int) else datetime_to_micros(item) for item in value]
+    return _buffer(value)
+
+
+def _aware_micros(start, end, mode: str):
+    # Reads one pair of a collection holding aware datetimes; like datetime subtraction,
+    # a naive and an aware instant cannot be paired.
+    if _is_aware(start) != _is_aware(end):
+        raise TypeError("Cannot compare offset-naive and offset-aware instants")
+    if start.tzinfo is end.tzinfo or not _is_aware(start):
+        # Also like datetime subtraction, instants sharing a tzinfo compare on the wall clock.
+        return datetime_to_micros(start), datetime_to_micros(end)
+    if mode == _ALIGNED:
+        return datetime_to_micros(start), datetime_to_micros(end.astimezone(start.tzinfo))
+    return (datetime_to_micros(start) - start.utcoffset() // _MICROSECOND,
+            datetime_to_micros(end) - end.utcoffset() // _MICROSECOND)
+
+
+def _pair(start, end, mode: str = _UTC):
+    # Broadcasts one reference against many instants, or pairs two equally long collections.
+    start_single, start = _split(start)
+    end_single, end = _split(end)
+    if not start_single and not end_single and len(start) != len(end):
+        raise ValueError(f"Cannot pair {len(start)} instants with {len(end)} instants")
+    if mode != _WALL and (_has_aware(start, start_single) or _has_aware(end, end_single)):
+        return _pair_aware(start, end, start_single, end_single, mode)
+    start = _micros(start, start_single)
+    end = _micros(end, end_single)
+    if np is not None or (start_single and end_single):
+        return start, end
+    if start_single:
+        start = array("q", [start]) * len(end)
+    elif end_single:
+        end = array("q", [end]) * len(start)
+    return start, end
+
+
+def _pair_aware(start, end, start_single: bool, end_single: bool, mode: str):
+    # The slow path for aware instants, which are read pair by pair.
+    if start_single and end_single:
+        return _aware_micros(start, end, mode)
+    if start_single:
+        start = [start] * len(end)
+    elif end_single:
+        end = [end] * len(start)
+    pairs = [_aware_micros(low, high, mode) for low, high in zip(start, end)]
+    return _buffer([low for low, _ in pairs]), _buffer([high for _, high in pairs])
+
+
+def _result(values):
+    if isinstance(values, int):
+        return values
+    return array("q", values)
+
+
+def _map(function, start, end, mode: str = _UTC):
+    # Applies an integer kernel to the paired operands, in one pass.
+    start, end = _pair(start, end, mode)
+    if np is not None or isinstance(start, int):
+        return function(start, end)
+    return _result([function(low, high) for low, high in zip(start, end)])
+
+
+def _truncate(micros, unit: int):
+    # Division rounding toward zero, like int() on a float number of units.
+    if np is not None and not isinstance(micros, int):
+        return np.where(micros < 0, -(-micros // unit), micros // unit)
+    return -(-micros // unit) if micros < 0 else micros // unit
+
+
+def seconds_until(start, end):
+    """
+    Returns the whole seconds from start to end, rounded toward zero, like YamTimes.seconds_until.
+
+    Parameters:
+    - start: A YamTimes, datetime, date or integer microseconds, or a collection of them (including a YamTimesArray).
+    - end: A single instant or a collection of the same length as start.
+
+    Returns:
+    - int for two single instants, otherwise a NumPy int64 array (or an `array('q')` without NumPy).
+    """
+    return _map(lambda low, high: _truncate(high - low, US_PER_SECOND), start, end)
+
+
+def minutes_until(start, end):
+    """
+    Returns the whole minutes from start to end, rounded toward zero.
+    """
+    return _map(lambda low, high: _truncate(high - low, US_PER_MINUTE), start, end)
+
+
+def hours_until(start, end):
+    """
+    Returns the whole hours from start to end, rounded toward zero, like YamTimes.hours_until.
+    """
+    return _map(lambda low, high: _truncate(high - low, US_PER_HOUR), start, end)
+
+
+def days_until(start, end):
+    """
+    Returns the days from start to end, rounded down like timedelta.days, as YamTimes.days_until does.
+    """
+    return _map(lambda low, high: (high - low) // US_PER_DAY, start, end)
+
+
+def weeks_between(start, end):
+    """
+    Returns the whole weeks from end to start, as YamTimes.weeks_between does (start.weeks_between(end)).
+    """
+    return _map(lambda low, high: (low - high) // US_PER_DAY // 7, start, end)
+
+
+def _absolute(unit: int):
+    def kernel(low, high):
+        difference = high - low
+        if np is not None and not isinstance(difference, int):
+            return np.abs(difference) // unit
+        return abs(difference) // unit
+    return kernel
+
+
+def time_difference_in_seconds(start, end):
+    """
+    Returns the absolute difference in whole seconds, like YamTimes.time_difference_in_seconds.
+    """
+    return _map(_absolute(US_PER_SECOND), start, end)
+
+
+def time_difference_in_minutes(start, end):
+    """
+    Returns the absolute difference in whole minutes, like YamTimes.time_difference_in_minutes.
+    """
+    return _map(_absolute(US_PER_MINUTE), start, end)
+
+
+def time_difference_in_hours(start, end):
+    """
+    Returns the absolute difference in whole hours, like YamTimes.time_difference_in_hours.
+    """
+    return _map(_absolute(US_PER_HOUR), start, end)
+
+
+def time_difference_in_days(start, end):
+    """
+    Returns the absolute difference in whole days, like YamTimes.time_difference_in_days.
+    """
+    return _map(_absolute(US_PER_DAY), start, end)
+
+
+def _months_kernel(low, high):
+    # Whole calendar months from low to high: the candidate count from the year and month
+    # fields is reduced by one when adding it to low (with end-of-month clamping) overshoots.
+    if np is None or isinstance(low, int) and isinstance(high, int):
+        return months_between(micros_to_datetime(low), micros_to_datetime(high))
+    low_year, low_month, _ = civil_from_days(low // US_PER_DAY)
+    high_year, high_month, _ = civil_from_days(high // US_PER_DAY)
+    months = (high_year - low_year) * 12 + high_month - low_month
+    candidate = add_months_micros(low, months)
+    return months - ((months > 0) & (candidate > high)) + ((months < 0) & (candidate < high))
+
+
+def months_until(start, end):
+    """
+    Returns the whole calendar months from start to end, with the semantics of dateutil's relativedelta.
+
+    Adding the result to start (clamping to the end of the month) never goes past end, so
+    2024-01-31 to 2024-02-29 is one month and 2024-01-15 to 2024-02-14 is zero.
+
+    Returns:
+    - int for two single instants, otherwise a NumPy int64 array (or an `array('q')` without NumPy).
+    """
+    return _map(_months_kernel, start, end, _ALIGNED)
+
+
+def years_until(start, end):
+    """
+    Returns the whole calendar years from start to end (months_until divided by 12, rounded toward zero).
+    """
+    return _map(lambda low, high: _truncate(_months_kernel(low, high), 12), start, end, _ALIGNED)
+
+
+def years_difference(start, end):
+    """
+    Returns the absolute difference between the year numbers, like YamTimes.years_difference.
+    """
+    def kernel(low, high):
+        difference = civil_from_days(high // US_PER_DAY)[0] - civil_from_days(low // US_PER_DAY)[0]
+        if np is not None and not isinstance(difference, int):
+            return np.abs(difference)
+        return abs(difference)
+    return _map(kernel, start, end, _WALL)
@@ -0,0 +1,426 @@
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+
+
+DEFAULT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Expressions emitted into the generated formatting function, keyed by directive.
+_EMITTERS = {
+    "Y": "{dt.year}",
+    "y": "{dt.year % 100:02d}",
+    "m": "{dt.month:02d}",
+    "d": "{dt.day:02d}",
+    "H": "{dt.hour:02d}",
+    "I": "{dt.hour % 12 or 12:02d}",
+    "M": "{dt.minute:02d}",
+    "S": "{dt.second:02d}",
+    "f": "{dt.microsecond:06d}",
+    "j": "{dt.toordinal() - _date(dt.year, 1, 1).toordinal() + 1:03d}",
+    "u": "{dt.isoweekday()}",
+    "w": "{dt.isoweekday() % 7}",
+    "A": "{_names.weekdays[dt.weekday()]}",
+    "a": "{_names.short_weekdays[dt.weekday()]}",
+    "B": "{_names.months[dt.month - 1]}",
+    "b": "{_names.short_months[dt.month - 1]}",
+    "p": "{_names.am_pm[dt.hour >= 12]}",
+}
+_NAME_DIRECTIVES = frozenset("AaBbp")
+
+# Numeric directives with a fixed width, usable by the slicing fast path of the parser.
+_FIXED_WIDTHS = {"Y": 4, "y": 2, "m": 2, "d": 2, "H": 2, "I": 2, "M": 2, "S": 2, "f": 6, "j": 3}
+
+# Fixed-width formats whose matching inputs are always valid ISO 8601 strings.
+_ISO_SHAPED = frozenset(
+    date + separator + time
+    for date in ("%Y-%m-%d",)
+    for separator in (" ", "T")
+    for time in ("%H:%M", "%H:%M:%S", "%H:%M:%S.%f")
+) | {"%Y-%m-%d"}
+
+_PATTERNS = {
+    "Y": r"(\d{4})",
+    "y": r"(\d\d)",
+    "m": r"(1[0-2]|0[1-9]|[1-9])",
+    "d": r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(2[0-3]|[0-1]\d|\d)",
+    "I": r"(1[0-2]|0[1-9]|[1-9])",
+    "M": r"([0-5]\d|\d)",
+    "S": r"(6[0-1]|[0-5]\d|\d)",
+    "f": r"(\d{1,6})",
+    "j": r"(36[0-6]|3[0-5]\d|[12]\d\d|0[1-9]\d|00[1-9]|[1-9]\d|0[1-9]|[1-9])",
+    "z": r"([+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?|Z)",
+}
+
+
+# Flags (glibc "%-d", "%_H", ...) and modifiers ("%Ey", "%Od") prefixing a directive. A
+# prefixed directive is kept as one token and always handed to strftime/strptime whole.
+_DIRECTIVE_PREFIXES = frozenset("-_0^#EO")
+
+
+def _tokenize(format: str) -> list:
+    # Splits a format into ("literal", text) and ("directive", text) tokens, where a
+    # directive is one character, or a prefix and a character.
+    tokens = []
+    literal = []
+    index = 0
+    length = len(format)
+    while index < length:
+        char = format[index]
+        if char == "%" and index + 1 < length:
+            directive = format[index + 1]
+            if directive in _DIRECTIVE_PREFIXES and index + 2 < length:
+                directive = format[index + 1:index + 3]
+            if directive == "%":
+                literal.append("%")
+            else:
+                if literal:
+                    tokens.append(("literal", "".join(literal)))
+                    literal = []
+                tokens.append(("directive", directive))
+            index += 1 + len(directive)
+        else:
+            literal.append(char)
+            index += 1
+    if literal:
+        tokens.append(("literal", "".join(literal)))
+    return tokens
+
+
+def _names_pattern(names) -> str:
+    import re
+
+    # Longest names first so that "Mar" does not shadow "March".
+    ordered = sorted(set(names), key=len, reverse=True)
+    return "(" + "|".join(re.escape(name) for name in ordered) + ")"
+
+
+def _parse_offset(text: str):
+    if text == "Z":
+        return timezone.utc
+    sign = -1 if text[0] == "-" else 1
+    digits = text[1:].replace(":", "")
+    seconds = int(digits[0:2]) * 3600 + int(digits[2:4]) * 60
+    microseconds = 0
+    if len(digits) > 4:
+        seconds += int(digits[4:6])
+        if len(digits) > 7:
+            microseconds = int(digits[7:].ljust(6, "0"))
+    return timezone(sign * timedelta(seconds=seconds, microseconds=microseconds))
+
+
+class CompiledFormat:
+    """
+    A strftime/strptime format string compiled once into a formatting function
+    and a parser, so repeated calls do not re-interpret the directives.
+
+    Instances are obtained through compile_format, which caches them.
+    """
+
+    def __init__(self, format: str, language_code: str = "en_US"):
+        """
+        Compiles the given format.
+
+        Parameters:
+        - format (str): A strftime/strptime format string.
+        - language_code (str): The language used for %A, %a, %B, %b and %p. Defaults to "en_US".
+        """
+        self.format_string = format
+        self.language_code = language_code
+        self._locale_names = None
+        self._tokens = _tokenize(format)
+        self._emit = self._compile_emitter(self._tokens)
+        # The parsers (and the re module) are only built the first time a string is parsed,
+        # since most formats are only ever used for output.
+        self._parser_compiled = False
+
+    @property
+    def _names(self):
+        # Looked up on first use, so formats without names never load the locale tables.
+        if self._locale_names is None:
+            from .locales import get_locale_names
+
+            self._locale_names = get_locale_names(self.language_code)
+        return self._locale_names
+
+    def _compile_parsers(self):
+        self._fast_parse = self._compile_fast_parser(self._tokens)
+        self._regex, self._fields = self._compile_regex(self._tokens)
+        self._parser_compiled = True
+
+    def _compile_emitter(self, tokens):
+        namespace = {"_date": datetime}
+        if any(kind == "directive" and value in _NAME_DIRECTIVES for kind, value in tokens):
+            namespace["_names"] = self._names
+        pieces = []
+        for kind, value in tokens:
+            if kind == "directive" and value in _EMITTERS:
+                pieces.append(_EMITTERS[value])
+                continue
+            # Literal text and directives without a dedicated emitter are kept out of the
+            # generated source: they are bound as variables of the function's namespace.
+            name = f"_v{len(namespace)}"
+            if kind == "literal":
+                namespace[name] = value
+                pieces.append("{" + name + "}")
+            else:
+                namespace[name] = "%" + value
+                pieces.append("{dt.strftime(" + name + ")}")
+        source = 'def _emit(dt):\n    return f"' + "".join(pieces) + '"\n'
+        exec(source, namespace)
+        return namespace["_emit"]
+
+    def _compile_fast_parser(self, tokens):
+        # Only formats made exclusively of fixed-width numeric fields and literals
+        # qualify. The generated function returns None whenever the input does not
+        # have the exact expected shape, so the regex parser can take over.
+        import re
+
+        fields = {}
+        shape = []
+        position = 0
+        for kind, value in tokens:
+            if kind == "literal":
+                shape.append(re.escape(value))
+                position += len(value)
+            elif value in _FIXED_WIDTHS and value not in fields:
+                width = _FIXED_WIDTHS[value]
+                fields[value] = f"int(text[{position}:{position + width}])"
+                shape.append(r"\d{%d}" % width)
+                position += width
+            else:
+                return None
+        if not fields or "I" in fields or "j" in fields:
+            return None
+        namespace = {"_datetime": datetime, "_century": _century}
+        if self.format_string in _ISO_SHAPED and hasattr(datetime, "fromisoformat"):
+            # Inputs of this exact shape are valid ISO 8601, which the C parser handles
+            # much faster than any Python-level field extraction. The shape is checked
+            # first, since fromisoformat also accepts UTC offsets and shorter fractions.
+            namespace["_fromiso"] = datetime.fromisoformat
+            namespace["_shape"] = re.compile("".join(shape), re.ASCII).fullmatch
+            source = (
+                "def _parse(text):\n"
+                f"    if len(text) == {position} and _shape(text) is not None:\n"
+                "        try:\n"
+                "            return _fromiso(text)\n"
+                "        except ValueError:\n"
+                "            return None\n"
+                "    return None\n"
+            )
+            exec(source, namespace)
+            return namespace["_parse"]
+        if "Y" in fields:
+            year = fields["Y"]
+        elif "y" in fields:
+            year = f"_century({fields['y']})"
+        else:
+            year = "1900"
+        arguments = ", ".join([
+            year,
+            fields.get("m", "1"),
+            fields.get("d", "1"),
+            fields.get("H", "0"),
+            fields.get("M", "0"),
+            fields.get("S", "0"),
+            fields.get("f", "0"),
+        ])
+        namespace["_shape"] = re.compile("".join(shape)).fullmatch
+        source = (
+            "def _parse(text):\n"
+            "    if _shape(text) is not None:\n"
+            "        return _datetime(" + arguments + ")\n"
+            "    return None\n"
+        )
+        exec(source, namespace)
+        return namespace["_parse"]
+
+    def _compile_regex(self, tokens):
+        import re
+
+        parts = []
+        fields = []
+        for kind, value in tokens:
+            if kind == "literal":
+                # Like strptime, a run of whitespace matches any run of whitespace.
+                parts.append(r"\s+".join(re.escape(piece) for piece in re.split(r"\s+", value)))
+                continue
+            if value in _PATTERNS:
+                parts.append(_PATTERNS[value])
+            elif value == "A":
+                parts.append(_names_pattern(self._names.weekdays))
+            elif value == "a":
+                parts.append(_names_pattern(self._names.short_weekdays))
+            elif value == "B":
+                parts.append(_names_pattern(self._names.months))
+            elif value == "b":
+                parts.append(_names_pattern(self._names.short_months))
+            elif value == "p":
+                parts.append(_names_pattern(self._names.am_pm))
+            else:
+                # Directives such as %U, %W, %c or %Z are left to datetime.strptime.
+                return None, None
+            fields.append(value)
+        if "j" in fields and {"m", "d", "B", "b"} & set(fields):
+            # strptime lets the day of the year override the month and day; leave that to it.
+            return None, None
+        return re.compile("".join(parts), re.IGNORECASE), fields
+
+    def format(self, dt: datetime) -> str:
+        """
+        Formats a datetime with the compiled format.
+        """
+        return self._emit(dt)
+
+    def parse(self, text: str) -> datetime:
+        """
+        Parses a string with the compiled format.
+
+        Raises:
+        - ValueError: If the string does not match the format or describes an invalid date.
+        """
+        if not self._parser_compiled:
+            self._compile_parsers()
+        if self._fast_parse is not None:
+            result = self._fast_parse(text)
+            if result is not None:
+                return result
+        if self._regex is None:
+            return datetime.strptime(text, self.format_string)
+        match = self._regex.fullmatch(text)
+        if match is None:
+            raise ValueError(f"time data {text!r} does not match format {self.format_string!r}")
+        return self._build(match.groups())
+
+    def _build(self, groups) -> datetime:
+        year, month, day, hour, minute, second, microsecond = 1900, 1, 1, 0, 0, 0, 0
+        day_of_year = None
+        pm = None
+        tzinfo = None
+        for field, text in zip(self._fields, groups):
+            if field == "Y":
+                year = int(text)
+            elif field == "y":
+                year = _century(int(text))
+            elif field == "m":
+                month = int(text)
+            elif field == "d":
+                day = int(text)
+            elif field == "H" or field == "I":
+                hour = int(text)
+            elif field == "M":
+                minute = int(text)
+            elif field == "S":
+                second = int(text)
+            elif field == "f":
+                microsecond = int(text.ljust(6, "0"))
+            elif field == "j":
+                day_of_year = int(text)
+            elif field == "z":
+                tzinfo = _parse_offset(text)
+            elif field == "B":
+                month = _index_of(self._names.months, text) + 1
+            elif field == "b":
+                month = _index_of(self._names.short_months, text) + 1
+            elif field == "p":
+                pm = _index_of(self._names.am_pm, text) == 1
+        if "I" in self._fields:
+            hour %= 12
+            if pm:
+                hour += 12
+        if day_of_year is not None:
+            # Like strptime, a day of year past the end of the year rolls into the next one.
+            ordinal = date(year, 1, 1).toordinal() + day_of_year - 1
+            if ordinal > date.max.toordinal():
+                raise ValueError(f"year {year + 1} is out of range")
+            start = date.fromordinal(ordinal)
+            year, month, day = start.year, start.month, start.day
+        return datetime(year, month, day, hour, minute, second, microsecond, tzinfo)
+
+    def format_many(self, instants) -> list:
+        """
+        Formats an iterable of YamTimes instances or datetimes.
+
+        Returns:
+        - list: The formatted strings, in input order.
+        """
+        emit = self._emit
+        return [emit(_as_datetime(instant)) for instant in instants]
+
+    def parse_many(self, strings):
+        """
+        Lazily parses an iterable of strings.
+
+        Returns:
+        - generator: The parsed datetimes, in input order.
+        """
+        parse = self.parse
+        for text in strings:
+            yield parse(text)
+
+
+def _century(two_digit_year: int) -> int:
+    # Same pivot as time.strptime: 69-99 map to the 1900s, 00-68 to the 2000s.
+    return two_digit_year + (1900 if two_digit_year >= 69 else 2000)
+
+
+def _index_of(names, text: str) -> int:
+    lowered = text.lower()
+    for index, name in enumerate(names):
+        if name.lower() == lowered:
+            return index
+    raise ValueError(f"unknown name {text!r}")
+
+
+def _as_datetime(instant) -> datetime:
+    if isinstance(instant, datetime):
+        return instant
+    return instant.to_datetime()
+
+
+@lru_cache(maxsize=256)
+def compile_format(format: str = DEFAULT_FORMAT, language_code: str = "en_US") -> CompiledFormat:
+    """
+    Returns the compiled form of a format string, reusing it from an LRU cache when possible.
+
+    Parameters:
+    - format (str): A strftime/strptime format string. Defaults to "%Y-%m-%d %H:%M:%S".
+    - language_code (str): The language used for %A, %a, %B, %b and %p. Defaults to "en_US".
+
+    Returns:
+    - CompiledFormat: The compiled format.
+    """
+    return CompiledFormat(format, language_code)
+
+
+def format_many(instants, format: str = DEFAULT_FORMAT, language_code: str = "en_US") -> list:
+    """
+    Formats an iterable of YamTimes instances or datetimes with a single compiled format.
+
+    Parameters:
+    - instants (iterable): YamTimes instances or datetimes.
+    - format (str): The format to use. Defaults to "%Y-%m-%d %H:%M:%S".
+    - language_code (str): The language used for names. Defaults to "en_US".
+
+    Returns:
+    - list: The formatted strings, in input order.
+    """
+    if hasattr(instants, "to_datetimes"):
+        instants = instants.to_datetimes()
+    return compile_format(format, language_code).format_many(instants)
+
+
+def parse_many(strings, format: str = DEFAULT_FORMAT, language_code: str = "en_US") -> list:
+    """
+    Parses an iterable of strings with a single compiled format.
+
+    Parameters:
+    - strings (iterable): The strings to parse.
+    - format (str): The format the strings are in. Defaults to "%Y-%m-%d %H:%M:%S".
+    - language_code (str): The language used for names. Defaults to "en_US".
+
+    Returns:
+    - list: YamTimes instances, in input order.
+    """
+    from .yamtimes import YamTimes
+
+    return [YamTimes(dt=dt) for dt in compile_format(format, language_code).parse_many(strings)]
@@ -0,0 +1,304 @@
+from datetime import MAXYEAR, MINYEAR, date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+from ._civil import to_datetime
+
+
+def easter(year: int) -> date:
+    """
+    Returns the date of (Western) Easter Sunday in the given year.
+    """
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def nearest_weekday(day: date) -> date:
+    """
+    Observed-date shift used in the US: Saturday moves to Friday and Sunday to Monday.
+    """
+    weekday = day.weekday()
+    if weekday == 5:
+        return day - timedelta(days=1)
+    if weekday == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def next_monday(day: date) -> date:
+    """
+    Substitute-day shift used in the UK: a holiday falling on a weekend moves to the following Monday.
+
+    Collisions with other holidays are resolved when the year's table is built.
+    """
+    weekday = day.weekday()
+    if weekday >= 5:
+        return day + timedelta(days=7 - weekday)
+    return day
+
+
+class HolidayRule:
+    """
+    Base class for holiday rules. Subclasses implement `date_in` for a given year.
+    """
+
+    def __init__(self, name: str, observed=None, since: int = None, until: int = None):
+        """
+        Parameters:
+        - name (str): The holiday name.
+        - observed (callable, optional): Maps the actual date to the date the holiday is observed on.
+        - since (int, optional): The first year the holiday exists.
+        - until (int, optional): The last year the holiday exists.
+        """
+        self.name = name
+        self.observed = observed
+        self.since = since
+        self.until = until
+
+    def applies_to(self, year: int) -> bool:
+        return (self.since is None or year >= self.since) and (self.until is None or year <= self.until)
+
+    def date_in(self, year: int) -> date:
+        raise NotImplementedError
+
+
+class FixedDate(HolidayRule):
+    """
+    A holiday on the same month and day every year.
+    """
+
+    def __init__(self, name: str, month: int, day: int, **kwargs):
+        super().__init__(name, **kwargs)
+        self.month = month
+        self.day = day
+
+    def date_in(self, year: int) -> date:
+        return date(year, self.month, self.day)
+
+
+class NthWeekday(HolidayRule):
+    """
+    A holiday on the n-th given weekday of a month (Monday is 0). A negative n counts from the end of the month.
+    """
+
+    def __init__(self, name: str, month: int, weekday: int, n: int, **kwargs):
+        super().__init__(name, **kwargs)
+        self.month = month
+        self.weekday = weekday
+        self.n = n
+
+    def date_in(self, year: int) -> date:
+        if self.n > 0:
+            first = date(year, self.month, 1)
+            offset = (self.weekday - first.weekday()) % 7
+            return first + timedelta(days=offset + (self.n - 1) * 7)
+        if self.month == 12:
+            last = date(year, 12, 31)
+        else:
+            last = date(year, self.month + 1, 1) - timedelta(days=1)
+        offset = (last.weekday() - self.weekday) % 7
+        return last - timedelta(days=offset + (-self.n - 1) * 7)
+
+
+class EasterOffset(HolidayRule):
+    """
+    A holiday a fixed number of days before or after Easter Sunday.
+    """
+
+    def __init__(self, name: str, days: int, **kwargs):
+        super().__init__(name, **kwargs)
+        self.days = days
+
+    def date_in(self, year: int) -> date:
+        return easter(year) + timedelta(days=self.days)
+
+
+_COUNTRY_RULES = {
+    "US": (
+        FixedDate("New Year's Day", 1, 1, observed=nearest_weekday),
+        NthWeekday("Martin Luther King Jr. Day", 1, 0, 3, since=1986),
+        NthWeekday("Washington's Birthday", 2, 0, 3),
+        NthWeekday("Memorial Day", 5, 0, -1),
+        FixedDate("Juneteenth National Independence Day", 6, 19, observed=nearest_weekday, since=2021),
+        FixedDate("Independence Day", 7, 4, observed=nearest_weekday),
+        NthWeekday("Labor Day", 9, 0, 1),
+        NthWeekday("Columbus Day", 10, 0, 2),
+        FixedDate("Veterans Day", 11, 11, observed=nearest_weekday),
+        NthWeekday("Thanksgiving Day", 11, 3, 4),
+        FixedDate("Christmas Day", 12, 25, observed=nearest_weekday),
+    ),
+    "BR": (
+        FixedDate("Confraternização Universal", 1, 1),
+        EasterOffset("Sexta-feira Santa", -2),
+        FixedDate("Tiradentes", 4, 21),
+        FixedDate("Dia do Trabalho", 5, 1),
+        FixedDate("Independência do Brasil", 9, 7),
+        FixedDate("Nossa Senhora Aparecida", 10, 12),
+        FixedDate("Finados", 11, 2),
+        FixedDate("Proclamação da República", 11, 15),
+        FixedDate("Dia Nacional de Zumbi e da Consciência Negra", 11, 20, since=2024),
+        FixedDate("Natal", 12, 25),
+    ),
+    "GB": (
+        FixedDate("New Year's Day", 1, 1, observed=next_monday),
+        EasterOffset("Good Friday", -2),
+        EasterOffset("Easter Monday", 1),
+        NthWeekday("Early May Bank Holiday", 5, 0, 1),
+        NthWeekday("Spring Bank Holiday", 5, 0, -1),
+        NthWeekday("Summer Bank Holiday", 8, 0, -1),
+        FixedDate("Christmas Day", 12, 25, observed=next_monday),
+        FixedDate("Boxing Day", 12, 26, observed=next_monday),
+    ),
+    "DE": (
+        FixedDate("Neujahr", 1, 1),
+        EasterOffset("Karfreitag", -2),
+        EasterOffset("Ostermontag", 1),
+        FixedDate("Tag der Arbeit", 5, 1),
+        EasterOffset("Christi Himmelfahrt", 39),
+        EasterOffset("Pfingstmontag", 50),
+        FixedDate("Tag der Deutschen Einheit", 10, 3, since=1990),
+        FixedDate("Erster Weihnachtstag", 12, 25),
+        FixedDate("Zweiter Weihnachtstag", 12, 26),
+    ),
+    "FR": (
+        FixedDate("Jour de l'an", 1, 1),
+        EasterOffset("Lundi de Pâques", 1),
+        FixedDate("Fête du Travail", 5, 1),
+        FixedDate("Victoire 1945", 5, 8),
+        EasterOffset("Ascension", 39),
+        EasterOffset("Lundi de Pentecôte", 50),
+        FixedDate("Fête nationale", 7, 14),
+        FixedDate("Assomption", 8, 15),
+        FixedDate("Toussaint", 11, 1),
+        FixedDate("Armistice", 11, 11),
+        FixedDate("Noël", 12, 25),
+    ),
+}
+_COUNTRY_RULES["UK"] = _COUNTRY_RULES["GB"]
+
+
+def register_country(code: str, rules) -> None:
+    """
+    Registers (or replaces) the holiday rules of a country or region, e.g. "US-CA".
+
+    Parameters:
+    - code (str): The country or region code. Matching is case-insensitive.
+    - rules (iterable): HolidayRule instances.
+    """
+    _COUNTRY_RULES[code.upper()] = tuple(rules)
+    holidays_for_year.cache_clear()
+
+
+def supported_countries() -> list:
+    """
+    Returns the codes of the countries and regions with holiday rules.
+    """
+    return sorted(_COUNTRY_RULES)
+
+
+def _rules_for(country_code: str) -> tuple:
+    try:
+        return _COUNTRY_RULES[country_code.upper()]
+    except KeyError:
+        raise ValueError(f"Unsupported country code: {country_code}") from None
+
+
+def _materialize(rules, year: int) -> dict:
+    actual = {}
+    shifted = []
+    # Observed shifts can cross the year boundary (e.g. New Year's Day observed on
+    # December 31st), so the neighbouring years are evaluated too.
+    for rule_year in (year - 1, year, year + 1):
+        if not MINYEAR <= rule_year <= MAXYEAR:
+            continue
+        for rule in rules:
+            if not rule.applies_to(rule_year):
+                continue
+            day = rule.date_in(rule_year)
+            actual.setdefault(day, rule.name)
+            if rule.observed is not None:
+                shifted.append((day, rule.observed(day), rule.name))
+    table = dict(actual)
+    for day, observed, name in sorted(shifted):
+        if observed == day:
+            continue
+        # A substitute day already taken by another holiday moves to the next free weekday.
+        while observed in table and observed != day:
+            observed += timedelta(days=1)
+            while observed.weekday() >= 5:
+                observed += timedelta(days=1)
+        table[observed] = f"{name} (observed)"
+    return {day: name for day, name in table.items() if day.year == year}
+
+
+@lru_cache(maxsize=512)
+def holidays_for_year(country_code: str, year: int) -> MappingProxyType:
+    """
+    Returns the holidays of a country in a year, computed once and cached.
+
+    Observed (substitute) days are included next to the actual dates.
+
+    Parameters:
+    - country_code (str): The country or region code, e.g. "US", "BR", "GB", "DE" or "FR".
+    - year (int): The year.
+
+    Returns:
+    - MappingProxyType: A read-only mapping of date to holiday name.
+
+    Raises:
+    - ValueError: If the country code has no holiday rules.
+    """
+    return MappingProxyType(_materialize(_rules_for(country_code), year))
+
+
+def is_holiday(day, country_code: str = "US") -> bool:
+    """
+    Checks if a day is a holiday in the given country.
+
+    Parameters:
+    - day (YamTimes, datetime or date): The day to check.
+    - country_code (str): The country or region code. Defaults to "US".
+
+    Returns:
+    - bool: True if the day is a holiday (or an observed holiday), False otherwise.
+    """
+    day = to_datetime(day).date()
+    return day in holidays_for_year(country_code, day.year)
+
+
+def holiday_name(day, country_code: str = "US"):
+    """
+    Returns the name of the holiday on the given day, or None if it is not a holiday.
+    """
+    day = to_datetime(day).date()
+    return holidays_for_year(country_code, day.year).get(day)
+
+
+def holidays_between(start, end, country_code: str = "US") -> list:
+    """
+    Returns the holidays between two days, both inclusive, in chronological order.
+
+    Parameters:
+    - start (YamTimes, datetime or date): The first day of the range.
+    - end (YamTimes, datetime or date): The last day of the range.
+    - country_code (str): The country or region code. Defaults to "US".
+
+    Returns:
+    - list: The holiday dates.
+    """
+    start = to_datetime(start).date()
+    end = to_datetime(end).date()
+    days = []
+    for year in range(start.year, end.year + 1):
+        days.extend(day for day in holidays_for_year(country_code, year) if start <= day <= end)
+    days.sort()
+    return days
@@ -0,0 +1,374 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import timedelta, timezone
+
+from ._civil import datetime_to_micros, micros_to_datetime, to_datetime
+from .yamtimes import YamTimes
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _read(value):
+    # Returns (micros, zone). Aware instants are read in UTC, so that instants in different
+    # zones compare correctly, and zone is their tzinfo; naive ones are read on the wall clock
+    # with zone False. Integers are taken as they are, with zone None: they are UTC micros for
+    # aware intervals and wall-clock micros for naive ones.
+    if isinstance(value, int):
+        return value, None
+    dt = to_datetime(value)
+    offset = dt.utcoffset()
+    if offset is None:
+        return datetime_to_micros(dt), False
+    return datetime_to_micros(dt) - offset // _MICROSECOND, dt.tzinfo
+
+
+def _check(aware: bool, zone):
+    # Like datetime comparisons, naive and aware instants cannot be mixed.
+    if zone is not None and (zone is not False) != aware:
+        raise TypeError("Cannot compare offset-naive and offset-aware instants")
+
+
+def _restore(start: int, end: int, tzinfo) -> "YamInterval":
+    # Unpickles a YamInterval.
+    return YamInterval._from_micros(start, end, tzinfo)
+
+
+class YamInterval:
+    """
+    A half-open span of time [start, end).
+
+    The bounds are kept as microseconds since the epoch, so comparisons and
+    set operations are integer arithmetic: wall-clock microseconds for naive
+    bounds, UTC microseconds for aware ones, whose zone is given back by start
+    and end. Instances are immutable and hashable.
+    """
+
+    __slots__ = ("_start", "_end", "_tzinfo")
+
+    def __init__(self, start, end):
+        """
+        Initializes the interval.
+
+        Parameters:
+        - start (YamTimes, datetime, date or int): The first instant of the interval.
+        - end (YamTimes, datetime, date or int): The end of the interval, which is not included.
+
+        Raises:
+        - ValueError: If end is before start.
+        - TypeError: If one bound is naive and the other aware.
+        """
+        start, start_zone = _read(start)
+        end, end_zone = _read(end)
+        if start_zone is not None and end_zone is not None:
+            _check(start_zone is not False, end_zone)
+        if end < start:
+            raise ValueError("The end of an interval cannot be before its start")
+        object.__setattr__(self, "_start", start)
+        object.__setattr__(self, "_end", end)
+        object.__setattr__(self, "_tzinfo", start_zone or end_zone or None)
+
+    @classmethod
+    def _from_micros(cls, start: int, end: int, tzinfo=None) -> "YamInterval":
+        self = cls.__new__(cls)
+        object.__setattr__(self, "_start", start)
+        object.__setattr__(self, "_end", end)
+        object.__setattr__(self, "_tzinfo", tzinfo)
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError("YamInterval instances are immutable")
+
+    def __reduce__(self):
+        return (_restore, (self._start, self._end, self._tzinfo))
+
+    def _datetime(self, micros: int):
+        dt = micros_to_datetime(micros)
+        if self._tzinfo is None:
+            return dt
+        return dt.replace(tzinfo=timezone.utc).astimezone(self._tzinfo)
+
+    def _micros(self, value) -> int:
+        micros, zone = _read(value)
+        _check(self._tzinfo is not None, zone)
+        return micros
+
+    def _other(self, other: "YamInterval"):
+        if (self._tzinfo is None) != (other._tzinfo is None):
+            raise TypeError("Cannot compare offset-naive and offset-aware intervals")
+
+    @property
+    def start(self) -> YamTimes:
+        """
+        Returns the first instant of the interval, in the zone of the bounds it was created with.
+        """
+        return YamTimes(dt=self._datetime(self._start))
+
+    @property
+    def end(self) -> YamTimes:
+        """
+        Returns the end of the interval, which is not part of it.
+        """
+        return YamTimes(dt=self._datetime(self._end))
+
+    def duration(self) -> timedelta:
+        """
+        Returns the length of the interval.
+        """
+        return timedelta(microseconds=self._end - self._start)
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the interval contains no instant, i.e. start == end.
+        """
+        return self._start == self._end
+
+    def __eq__(self, other):
+        if not isinstance(other, YamInterval):
+            return NotImplemented
+        return (self._start == other._start and self._end == other._end
+                and (self._tzinfo is None) == (other._tzinfo is None))
+
+    def __hash__(self):
+        return hash((self._start, self._end))
+
+    def __lt__(self, other):
+        if not isinstance(other, YamInterval):
+            return NotImplemented
+        return (self._start, self._end) < (other._start, other._end)
+
+    def __repr__(self):
+        return f"YamInterval({self._datetime(self._start)}, {self._datetime(self._end)})"
+
+    def __contains__(self, value) -> bool:
+        if isinstance(value, YamInterval):
+            self._other(value)
+            return self._start <= value._start and value._end <= self._end
+        micros = self._micros(value)
+        return self._start <= micros < self._end
+
+    def contains(self, value) -> bool:
+        """
+        Checks if an instant, or a whole interval, lies inside this interval.
+
+        Parameters:
+        - value (YamTimes, datetime, date, int or YamInterval): The instant or interval to check.
+
+        Returns:
+        - bool: True if it is contained, False otherwise.
+        """
+        return value in self
+
+    def overlaps(self, other: "YamInterval") -> bool:
+        """
+        Checks if the two intervals share at least one instant.
+        """
+        self._other(other)
+        return max(self._start, other._start) < min(self._end, other._end)
+
+    def intersection(self, other: "YamInterval"):
+        """
+        Returns the instants shared by both intervals.
+
+        Returns:
+        - YamInterval or None: The common interval, or None if they do not overlap.
+        """
+        self._other(other)
+        start = max(self._start, other._start)
+        end = min(self._end, other._end)
+        if start >= end:
+            return None
+        return YamInterval._from_micros(start, end, self._tzinfo)
+
+    def union(self, other: "YamInterval") -> "YamInterval":
+        """
+        Returns the interval covering both intervals.
+
+        Raises:
+        - ValueError: If the intervals neither overlap nor touch, since the union would not be an interval.
+        """
+        self._other(other)
+        if self._start > other._end or other._start > self._end:
+            raise ValueError("The union of disjoint intervals is not an interval")
+        return YamInterval._from_micros(min(self._start, other._start), max(self._end, other._end), self._tzinfo)
+
+    def gap(self, other: "YamInterval"):
+        """
+        Returns the interval between two disjoint intervals.
+
+        Returns:
+        - YamInterval or None: The span separating them, or None if they overlap or touch.
+        """
+        self._other(other)
+        if self._end < other._start:
+            return YamInterval._from_micros(self._end, other._start, self._tzinfo)
+        if other._end < self._start:
+            return YamInterval._from_micros(other._end, self._start, self._tzinfo)
+        return None
+
+
+def _as_interval(value) -> YamInterval:
+    if isinstance(value, YamInterval):
+        return value
+    start, end = value
+    return YamInterval(start, end)
+
+
+class IntervalIndex:
+    """
+    A static index answering containment and overlap queries over many intervals.
+
+    Intervals are sorted by start and their ends are kept in an implicit
+    segment tree holding the maximum end of every node, so a query descends
+    only into the parts of the tree that can still match: each query costs
+    O(log n + k) for k results. Bulk point queries use two sorted endpoint
+    arrays and a binary search per instant, vectorized with NumPy when it is
+    installed.
+
+    Query results are lists of YamInterval instances in start order.
+    """
+
+    def __init__(self, intervals=()):
+        """
+        Builds the index.
+
+        Parameters:
+        - intervals (iterable): YamInterval instances or (start, end) pairs.
+
+        Raises:
+        - TypeError: If naive and aware intervals are mixed.
+        """
+        self.intervals = sorted(_as_interval(value) for value in intervals)
+        kinds = {interval._tzinfo is not None for interval in self.intervals}
+        if len(kinds) > 1:
+            raise TypeError("Cannot index offset-naive and offset-aware intervals together")
+        self._aware = kinds == {True}
+        self._starts = [interval._start for interval in self.intervals]
+        ends = [interval._end for interval in self.intervals]
+        size = 1
+        while size < len(ends):
+            size *= 2
+        self._size = size
+        # Empty intervals never match, so their leaf stays below any threshold.
+        tree = [float("-inf")] * (2 * size)
+        for index, interval in enumerate(self.intervals):
+            if interval._end > interval._start:
+                tree[size + index] = interval._end
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+        # Sorted endpoints of the non-empty intervals, for bulk counting.
+        non_empty = [interval for interval in self.intervals if interval._end > interval._start]
+        self._sorted_starts = [interval._start for interval in non_empty]
+        self._sorted_ends = sorted(interval._end for interval in non_empty)
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __iter__(self):
+        return iter(self.intervals)
+
+    def __repr__(self):
+        return f"IntervalIndex(len={len(self)})"
+
+    def _micros(self, value) -> int:
+        micros, zone = _read(value)
+        _check(self._aware, zone)
+        return micros
+
+    def _collect(self, limit: int, threshold: int) -> list:
+        # Intervals among the first `limit` (in start order) whose end is after `threshold`.
+        found = []
+        if limit <= 0:
+            return found
+        tree = self._tree
+        size = self._size
+        stack = [(1, 0, size)]
+        while stack:
+            node, low, high = stack.pop()
+            if low >= limit or tree[node] <= threshold:
+                continue
+            if node >= size:
+                found.append(node - size)
+                continue
+            middle = (low + high) // 2
+            stack.append((2 * node + 1, middle, high))
+            stack.append((2 * node, low, middle))
+        return [self.intervals[index] for index in found]
+
+    def containing(self, instant) -> list:
+        """
+        Returns the intervals that contain an instant.
+
+        Parameters:
+        - instant (YamTimes, datetime, date or int): The instant to look up.
+
+        Returns:
+        - list: The matching intervals, in start order.
+        """
+        micros = self._micros(instant)
+        return self._collect(bisect_right(self._starts, micros), micros)
+
+    def overlapping(self, start, end) -> list:
+        """
+        Returns the intervals that share at least one instant with [start, end).
+
+        Parameters:
+        - start (YamTimes, datetime, date or int): The start of the window.
+        - end (YamTimes, datetime, date or int): The end of the window, which is not included.
+
+        Returns:
+        - list: The matching intervals, in start order.
+        """
+        low = self._micros(start)
+        high = self._micros(end)
+        if high <= low:
+            return []
+        return self._collect(bisect_left(self._starts, high), low)
+
+    def count_containing(self, instants):
+        """
+        Counts, for every instant, the intervals that contain it.
+
+        Parameters:
+        - instants: A YamTimesArray, or an iterable of YamTimes instances, datetimes, dates or integers.
+
+        Returns:
+        - A NumPy int64 array when NumPy is available, otherwise an `array('q')`.
+        """
+        from ._compat import np
+
+        if hasattr(instants, "micros"):
+            # A YamTimesArray holds naive wall-clock values.
+            _check(self._aware, False)
+            micros = instants.micros
+        else:
+            micros = [self._micros(instant) for instant in instants]
+        if np is not None:
+            micros = np.asarray(micros, dtype=np.int64)
+            starts = np.asarray(self._sorted_starts, dtype=np.int64)
+            ends = np.asarray(self._sorted_ends, dtype=np.int64)
+            return np.searchsorted(starts, micros, side="right") - np.searchsorted(ends, micros, side="right")
+        starts = self._sorted_starts
+        ends = self._sorted_ends
+        return array("q", [bisect_right(starts, value) - bisect_right(ends, value) for value in micros])
+
+    def contains_any(self, instants):
+        """
+        Returns a mask that is true for the instants contained in at least one interval.
+
+        Returns:
+        - A NumPy boolean array when NumPy is available, otherwise an `array('B')` of 0/1 values.
+        """
+        counts = self.count_containing(instants)
+        if isinstance(counts, array):
+            return array("B", [count > 0 for count in counts])
+        return counts > 0
+
+    def containing_many(self, instants) -> list:
+        """
+        Returns, for every instant, the list of intervals that contain it.
+        """
+        if hasattr(instants, "micros"):
+            _check(self._aware, False)
+            instants = [int(micros) for micros in instants.micros]
+        return [self.containing(instant) for instant in instants]
@@ -0,0 +1,240 @@
+import sys
+from datetime import datetime, timedelta, timezone
+
+from ._civil import days_from_civil, weekday_from_days, year_table
+
+
+# Python 3.11+ parses the full ISO 8601 profile (Z, basic format, week dates) natively.
+_NATIVE_FULL_ISO = sys.version_info >= (3, 11)
+_fromisoformat = getattr(datetime, "fromisoformat", None)
+
+_offsets = {0: timezone.utc}
+
+
+def _fixed_offset(seconds: int) -> timezone:
+    # Offsets repeat a lot in logs, so each one is only built once.
+    tz = _offsets.get(seconds)
+    if tz is None:
+        tz = _offsets.setdefault(seconds, timezone(timedelta(seconds=seconds)))
+    return tz
+
+
+def _invalid(text):
+    return ValueError(f"Invalid isoformat string: {text!r}")
+
+
+def _number(text: str, source) -> int:
+    if not (text.isdigit() and text.isascii()):
+        raise _invalid(source)
+    return int(text)
+
+
+def _parse_date(part: str, source) -> tuple:
+    length = len(part)
+    week = part.find("W")
+    if week in (4, 5):
+        year = _number(part[:4], source)
+        rest = part[week + 1:].replace("-", "")
+        if len(rest) not in (2, 3):
+            raise _invalid(source)
+        week_number = _number(rest[:2], source)
+        weekday = _number(rest[2:], source) if len(rest) == 3 else 1
+        if year < 1 or not 1 <= weekday <= 7 or not 1 <= week_number <= year_table(year).iso_weeks:
+            raise _invalid(source)
+        jan4 = days_from_civil(year, 1, 4)
+        days = jan4 - weekday_from_days(jan4) + (week_number - 1) * 7 + weekday - 1
+        value = datetime(1970, 1, 1) + timedelta(days=days)
+        return value.year, value.month, value.day
+    if length == 10 and part[4] == "-" and part[7] == "-":
+        return _number(part[:4], source), _number(part[5:7], source), _number(part[8:], source)
+    if length == 8 and part[4] != "-":
+        return _number(part[:4], source), _number(part[4:6], source), _number(part[6:], source)
+    if length == 8 or length == 7 and part[4] != "-":
+        year = _number(part[:4], source)
+        day_of_year = _number(part[-3:], source)
+        if not 1 <= day_of_year <= 366:
+            raise _invalid(source)
+        value = datetime(year, 1, 1) + timedelta(days=day_of_year - 1)
+        if value.year != year:
+            raise _invalid(source)
+        return value.year, value.month, value.day
+    if length == 7:
+        return _number(part[:4], source), _number(part[5:], source), 1
+    if length == 4:
+        return _number(part, source), 1, 1
+    raise _invalid(source)
+
+
+def _parse_offset(part: str, source):
+    if part in ("Z", "z"):
+        return timezone.utc
+    sign = -1 if part[0] == "-" else 1
+    digits = part[1:].replace(":", "")
+    if len(digits) not in (2, 4, 6):
+        raise _invalid(source)
+    seconds = _number(digits[:2], source) * 3600
+    if len(digits) >= 4:
+        seconds += _number(digits[2:4], source) * 60
+    if len(digits) == 6:
+        seconds += _number(digits[4:], source)
+    if seconds >= 86400:
+        raise _invalid(source)
+    return _fixed_offset(sign * seconds)
+
+
+def _parse_time(part: str, source) -> tuple:
+    tzinfo = None
+    if part[-1:] in ("Z", "z"):
+        tzinfo = timezone.utc
+        part = part[:-1]
+    else:
+        sign = max(part.rfind("+"), part.rfind("-"))
+        if sign != -1:
+            tzinfo = _parse_offset(part[sign:], source)
+            part = part[:sign]
+    microsecond = 0
+    fraction = max(part.find("."), part.find(","))
+    if fraction != -1:
+        digits = part[fraction + 1:]
+        if not digits:
+            raise _invalid(source)
+        microsecond = _number(digits[:6].ljust(6, "0"), source)
+        _number(digits, source)
+        part = part[:fraction]
+    compact = part.replace(":", "")
+    if len(compact) not in (2, 4, 6) or (":" in part and len(part) != len(compact) * 3 // 2 - 1):
+        raise _invalid(source)
+    hour = _number(compact[:2], source)
+    minute = _number(compact[2:4], source) if len(compact) >= 4 else 0
+    second = _number(compact[4:], source) if len(compact) == 6 else 0
+    return hour, minute, second, microsecond, tzinfo
+
+
+def _parse_iso_slow(text: str) -> datetime:
+    separator = -1
+    for index in range(4, len(text)):
+        if text[index] in "Tt ":
+            separator = index
+            break
+    date_part = text if separator == -1 else text[:separator]
+    year, month, day = _parse_date(date_part, text)
+    if separator == -1:
+        return datetime(year, month, day)
+    hour, minute, second, microsecond, tzinfo = _parse_time(text[separator + 1:], text)
+    if hour == 24:
+        # 24:00 is the end of the day, which is midnight of the next one.
+        if minute or second or microsecond:
+            raise _invalid(text)
+        return datetime(year, month, day, 0, 0, 0, 0, tzinfo) + timedelta(days=1)
+    return datetime(year, month, day, hour, minute, second, microsecond, tzinfo)
+
+
+def parse_iso(text) -> datetime:
+    """
+    Parses an ISO 8601 / RFC 3339 string into a datetime.
+
+    Accepts extended and basic formats, calendar, ordinal and week dates, a "T", "t" or
+    space separator, fractions with any number of digits (truncated to microseconds),
+    24:00, and "Z" or numeric UTC offsets, which produce fixed-offset aware datetimes.
+
+    Parameters:
+    - text (str or bytes): The ISO 8601 string. Bytes are decoded as ASCII.
+
+    Returns:
+    - datetime: The parsed datetime. It is naive when the string has no offset.
+
+    Raises:
+    - ValueError: If the string is not a valid ISO 8601 date or date and time.
+    """
+    if not isinstance(text, str):
+        text = bytes(text).decode("ascii")
+    if _fromisoformat is not None:
+        try:
+            if _NATIVE_FULL_ISO:
+                return _fromisoformat(text)
+            if text[-1:] == "Z":
+                return _fromisoformat(text[:-1] + "+00:00")
+            return _fromisoformat(text)
+        except ValueError:
+            pass
+    return _parse_iso_slow(text)
+
+
+def parse_iso_many(items, skip_invalid: bool = False):
+    """
+    Lazily parses an iterable of ISO 8601 strings or bytes, such as the lines of a file.
+
+    Surrounding whitespace (including trailing newlines) is ignored.
+
+    Parameters:
+    - items (iterable): The strings or bytes to parse.
+    - skip_invalid (bool): Silently drops items that cannot be parsed instead of raising. Defaults to False.
+
+    Returns:
+    - generator: The parsed datetimes, in input order.
+    """
+    for item in items:
+        if not skip_invalid:
+            yield _parse_item(item)
+            continue
+        try:
+            dt = _parse_item(item)
+        except ValueError:
+            # UnicodeDecodeError is a ValueError, so non-ASCII bytes are dropped too.
+            continue
+        yield dt
+
+
+def _parse_item(item) -> datetime:
+    if not isinstance(item, str):
+        item = bytes(item).decode("ascii")
+    return parse_iso(item.strip())
+
+
+def format_iso(dt: datetime, sep: str = "T", timespec: str = "auto", use_z: bool = False) -> str:
+    """
+    Formats a datetime as an ISO 8601 / RFC 3339 string.
+
+    Parameters:
+    - dt (datetime): The datetime to format.
+    - sep (str): The separator between date and time. Defaults to "T".
+    - timespec (str): The precision, as accepted by datetime.isoformat. Defaults to "auto".
+    - use_z (bool): Writes a zero UTC offset as "Z" instead of "+00:00". Defaults to False.
+
+    Returns:
+    - str: The ISO 8601 string.
+    """
+    text = dt.isoformat(sep, timespec)
+    if use_z and text.endswith("+00:00") and dt.utcoffset() == timedelta(0):
+        return text[:-6] + "Z"
+    return text
+
+
+def format_iso_date(dt: datetime) -> str:
+    """
+    Formats the date of a datetime as an ISO 8601 date (YYYY-MM-DD).
+    """
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def format_iso_time(dt: datetime) -> str:
+    """
+    Formats the time of a datetime as an ISO 8601 time (HH:MM:SS).
+    """
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+def format_iso_many(instants, sep: str = "T", timespec: str = "auto", use_z: bool = False) -> list:
+    """
+    Formats an iterable of YamTimes instances or datetimes as ISO 8601 strings.
+
+    Returns:
+    - list: The ISO 8601 strings, in input order.
+    """
+    if hasattr(instants, "to_datetimes"):
+        instants = instants.to_datetimes()
+    result = []
+    for instant in instants:
+        dt = instant if isinstance(instant, datetime) else instant.to_datetime()
+        result.append(format_iso(dt, sep, timespec, use_z))
+    return result
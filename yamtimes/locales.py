@@ -0,0 +1,203 @@
+import sys
+from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
+
+
+# Weekday names start on Monday, matching datetime.weekday(). The built-in tables use the
+# same names and casing as the glibc locales, e.g. "janeiro" in pt_BR but "Januar" in de_DE.
+LocaleNames = namedtuple("LocaleNames", ["months", "short_months", "weekdays", "short_weekdays", "am_pm"])
+
+_BUILTIN_NAMES = {
+    "en": LocaleNames(
+        ("January", "February", "March", "April", "May", "June",
+         "July", "August", "September", "October", "November", "December"),
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"),
+        ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"),
+        ("AM", "PM"),
+    ),
+    "pt": LocaleNames(
+        ("janeiro", "fevereiro", "março", "abril", "maio", "junho",
+         "julho", "agosto", "setembro", "outubro", "novembro", "dezembro"),
+        ("jan", "fev", "mar", "abr", "mai", "jun", "jul", "ago", "set", "out", "nov", "dez"),
+        ("segunda-feira", "terça-feira", "quarta-feira", "quinta-feira", "sexta-feira", "sábado", "domingo"),
+        ("seg", "ter", "qua", "qui", "sex", "sáb", "dom"),
+        ("AM", "PM"),
+    ),
+    "es": LocaleNames(
+        ("enero", "febrero", "marzo", "abril", "mayo", "junio",
+         "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre"),
+        ("ene", "feb", "mar", "abr", "may", "jun", "jul", "ago", "sep", "oct", "nov", "dic"),
+        ("lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"),
+        ("lun", "mar", "mié", "jue", "vie", "sáb", "dom"),
+        ("a. m.", "p. m."),
+    ),
+    "fr": LocaleNames(
+        ("janvier", "février", "mars", "avril", "mai", "juin",
+         "juillet", "août", "septembre", "octobre", "novembre", "décembre"),
+        ("janv.", "févr.", "mars", "avril", "mai", "juin", "juil.", "août", "sept.", "oct.", "nov.", "déc."),
+        ("lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche"),
+        ("lun.", "mar.", "mer.", "jeu.", "ven.", "sam.", "dim."),
+        ("AM", "PM"),
+    ),
+    "de": LocaleNames(
+        ("Januar", "Februar", "März", "April", "Mai", "Juni",
+         "Juli", "August", "September", "Oktober", "November", "Dezember"),
+        ("Jan", "Feb", "Mär", "Apr", "Mai", "Jun", "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"),
+        ("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"),
+        ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"),
+        ("AM", "PM"),
+    ),
+    "it": LocaleNames(
+        ("gennaio", "febbraio", "marzo", "aprile", "maggio", "giugno",
+         "luglio", "agosto", "settembre", "ottobre", "novembre", "dicembre"),
+        ("gen", "feb", "mar", "apr", "mag", "giu", "lug", "ago", "set", "ott", "nov", "dic"),
+        ("lunedì", "martedì", "mercoledì", "giovedì", "venerdì", "sabato", "domenica"),
+        ("lun", "mar", "mer", "gio", "ven", "sab", "dom"),
+        ("AM", "PM"),
+    ),
+    "nl": LocaleNames(
+        ("januari", "februari", "maart", "april", "mei", "juni",
+         "juli", "augustus", "september", "oktober", "november", "december"),
+        ("jan", "feb", "mrt", "apr", "mei", "jun", "jul", "aug", "sep", "okt", "nov", "dec"),
+        ("maandag", "dinsdag", "woensdag", "donderdag", "vrijdag", "zaterdag", "zondag"),
+        ("ma", "di", "wo", "do", "vr", "za", "zo"),
+        ("a.m.", "p.m."),
+    ),
+}
+_BUILTIN_NAMES["c"] = _BUILTIN_NAMES["posix"] = _BUILTIN_NAMES["en"]
+
+
+def _lc_time_mask():
+    # The LC_TIME bit of newlocale's category mask: 1 << LC_TIME on glibc and musl, a fixed bit
+    # on the BSDs and macOS. Other platforms have no per-thread locales. The locale module (and
+    # the re and enum modules it loads) is only imported once a built-in table is missing.
+    if sys.platform.startswith("linux"):
+        import locale
+
+        return 1 << locale.LC_TIME
+    if sys.platform == "darwin" or sys.platform.startswith("freebsd"):
+        return 1 << 5
+    return None
+
+
+def _read_system_locale(language_code: str):
+    # Reads the names of an installed locale without a built-in table. The locale is only
+    # installed for the calling thread (POSIX uselocale), so the process locale and the
+    # other threads never see it. Returns None if the locale is not installed.
+    mask = _lc_time_mask()
+    if mask is None:
+        return None
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL(None)
+        newlocale, uselocale, freelocale = libc.newlocale, libc.uselocale, libc.freelocale
+    except (OSError, AttributeError, TypeError):
+        return None
+    newlocale.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_void_p]
+    newlocale.restype = ctypes.c_void_p
+    uselocale.argtypes = [ctypes.c_void_p]
+    uselocale.restype = ctypes.c_void_p
+    freelocale.argtypes = [ctypes.c_void_p]
+    name, dot, codeset = language_code.partition(".")
+    name = name.replace("-", "_")
+    candidates = [name + dot + codeset] if dot else [name + ".UTF-8", name + ".utf8", name]
+    for candidate in candidates:
+        handle = newlocale(mask, candidate.encode("ascii", "replace"), None)
+        if handle:
+            break
+    else:
+        return None
+    previous = uselocale(handle)
+    try:
+        # 2024-01-01 is a Monday, so day offsets 0-6 walk Monday to Sunday.
+        months = tuple(datetime(2024, month, 1).strftime("%B") for month in range(1, 13))
+        short_months = tuple(datetime(2024, month, 1).strftime("%b") for month in range(1, 13))
+        weekdays = tuple(datetime(2024, 1, day).strftime("%A") for day in range(1, 8))
+        short_weekdays = tuple(datetime(2024, 1, day).strftime("%a") for day in range(1, 8))
+        am_pm = (datetime(2024, 1, 1, 9).strftime("%p"), datetime(2024, 1, 1, 21).strftime("%p"))
+    finally:
+        uselocale(previous)
+        freelocale(handle)
+    return LocaleNames(months, short_months, weekdays, short_weekdays, am_pm)
+
+
+@lru_cache(maxsize=64)
+def _resolve_names(language_code: str):
+    # The names of a language code, or None when it is neither built in nor installed.
+    normalized = language_code.split(".")[0].split("@")[0].replace("-", "_")
+    language = normalized.split("_")[0].lower()
+    names = _BUILTIN_NAMES.get(language)
+    if names is None:
+        names = _read_system_locale(language_code)
+    return names
+
+
+def get_locale_names(language_code: str = "en_US") -> LocaleNames:
+    """
+    Returns the month and weekday names for the given language code.
+
+    Names are resolved once per language code and kept in an LRU cache. Common languages
+    come from built-in tables; other codes are read from the system locale database for
+    the calling thread only, so the process locale is never changed. Codes that are not
+    installed fall back to English with a warning.
+
+    Parameters:
+    - language_code (str): A locale such as "pt_BR", "es-ES" or "fr_FR.UTF-8". Defaults to "en_US".
+
+    Returns:
+    - LocaleNames: The names for the language.
+    """
+    names = _resolve_names(language_code)
+    if names is None:
+        import warnings
+
+        warnings.warn(f"Language {language_code!r} is not supported, falling back to English", stacklevel=2)
+        names = _BUILTIN_NAMES["en"]
+    return names
+
+
+def localized_strftime(dt: datetime, format: str, language_code: str = "en_US") -> str:
+    """
+    Formats a datetime like datetime.strftime, taking %A, %a, %B, %b and %p from the given language.
+
+    Parameters:
+    - dt (datetime): The datetime to format.
+    - format (str): A strftime format string.
+    - language_code (str): The language to use for names. Defaults to "en_US".
+
+    Returns:
+    - str: The formatted string.
+    """
+    names = get_locale_names(language_code)
+    parts = []
+    start = index = 0
+    length = len(format)
+    while index < length - 1:
+        if format[index] != "%":
+            index += 1
+            continue
+        directive = format[index + 1]
+        if directive == "A":
+            name = names.weekdays[dt.weekday()]
+        elif directive == "a":
+            name = names.short_weekdays[dt.weekday()]
+        elif directive == "B":
+            name = names.months[dt.month - 1]
+        elif directive == "b":
+            name = names.short_months[dt.month - 1]
+        elif directive == "p":
+            name = names.am_pm[dt.hour >= 12]
+        else:
+            index += 2
+            continue
+        if start < index:
+            parts.append(dt.strftime(format[start:index]))
+        parts.append(name)
+        index += 2
+        start = index
+    if start < length:
+        parts.append(dt.strftime(format[start:]))
+    return "".join(parts)
@@ -0,0 +1,331 @@
+"""
+Process-pool versions of the batch operations, for jobs too large for one core.
+
+Instants travel to the worker processes through shared memory: the input
+buffer of epoch microseconds is copied once into a shared block, every worker
+converts the slice [start, end) it is given, and writes its result into a
+shared output block at the same offsets. Results are therefore in input order
+whatever order the workers finish in. Strings to parse are shared the same
+way, as one UTF-8 blob plus a table of offsets; formatted strings come back
+through the pool, one list per chunk.
+
+Inputs smaller than one chunk, or calls with workers=1, run in the calling
+process without a pool. Passing an existing ProcessPoolExecutor as `executor`
+avoids starting new processes on every call.
+
+Requires Python 3.8 or later (multiprocessing.shared_memory).
+"""
+import os
+from array import array
+from itertools import accumulate
+
+from ._civil import check_period, datetime_to_micros
+from ._compat import np
+from .columnar import YamTimesArray
+from .formats import DEFAULT_FORMAT, compile_format
+from .iso import format_iso, parse_iso
+
+ISO = "iso"
+MIN_CHUNK_SIZE = 10000
+
+# YamTimesArray methods that compare against "now". The reference is read once in the
+# calling process, so that every worker uses the same instant.
+_RELATIVE_METHODS = frozenset((
+    "is_past", "is_future", "is_today", "is_before_today", "is_after_today",
+    "is_in_current_week", "is_in_current_month", "is_in_current_year", "classify",
+))
+
+
+def _attach(name: str):
+    # Pool workers share the resource tracker of the process that created the block, which
+    # unlinks it, so attaching must not register it again where that can be avoided (3.13+).
+    from multiprocessing.shared_memory import SharedMemory
+
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        return SharedMemory(name=name)
+
+
+def _create(size: int):
+    from multiprocessing.shared_memory import SharedMemory
+
+    return SharedMemory(create=True, size=max(size, 1))
+
+
+def _view(block, typecode: str, length: int):
+    # A typed view of a shared block: a NumPy array, or a cast memoryview without NumPy.
+    # Views are only used inside one expression: a block cannot be closed while a view of
+    # it is alive, and an exception traceback would keep a named view alive.
+    if np is not None:
+        return np.ndarray((length,), dtype=np.int64 if typecode == "q" else np.uint8, buffer=block.buf)
+    return block.buf.cast(typecode)[:length]
+
+
+def _read(block, typecode: str, length: int, start: int = 0, end: int = None):
+    # A private copy of the items [start, end) of a shared block.
+    if np is not None:
+        return _view(block, typecode, length)[start:end].copy()
+    return array(typecode, _view(block, typecode, length)[start:end])
+
+
+def _write(block, typecode: str, length: int, start: int, values) -> None:
+    if np is None and not isinstance(values, array):
+        values = array(typecode, values)
+    _view(block, typecode, length)[start:start + len(values)] = values
+
+
+def _micros_of(instants):
+    if isinstance(instants, YamTimesArray):
+        return instants.micros
+    if np is not None and isinstance(instants, np.ndarray):
+        return np.asarray(instants, dtype=np.int64)
+    if isinstance(instants, array) and instants.typecode == "q":
+        return instants
+    return YamTimesArray(instants).micros
+
+
+def _chunks(length: int, workers: int, chunk_size: int = None) -> list:
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-length // (workers * 4)))
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    return [(start, min(start + chunk_size, length)) for start in range(0, length, chunk_size)]
+
+
+def _workers(workers) -> int:
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    return workers
+
+
+def _map(function, tasks: list, workers: int, executor) -> list:
+    # Runs the tasks, in a pool when there is more than one, and returns their results in order.
+    if len(tasks) <= 1 or (workers == 1 and executor is None):
+        return [function(*task) for task in tasks]
+    if executor is not None:
+        return [future.result() for future in [executor.submit(function, *task) for task in tasks]]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return [future.result() for future in [pool.submit(function, *task) for task in tasks]]
+
+
+def _method_chunk(input_name, output_name, length, typecode, start, end, method, args, kwargs):
+    # Worker: applies a YamTimesArray method to one slice of the shared input.
+    source = _attach(input_name)
+    target = _attach(output_name)
+    try:
+        result = getattr(YamTimesArray.from_micros(_read(source, "q", length, start, end)), method)(*args, **kwargs)
+        if isinstance(result, YamTimesArray):
+            result = result.micros
+        _write(target, typecode, length, start, result)
+    finally:
+        source.close()
+        target.close()
+
+
+def _apply(instants, method: str, typecode: str, args=(), kwargs=None, workers=None, chunk_size=None, executor=None):
+    micros = _micros_of(instants)
+    length = len(micros)
+    workers = _workers(workers)
+    chunks = _chunks(length, workers, chunk_size)
+    if len(chunks) <= 1 or (workers == 1 and executor is None):
+        return getattr(YamTimesArray.from_micros(micros), method)(*args, **(kwargs or {}))
+
+    source = _create(length * 8)
+    target = _create(length * (8 if typecode == "q" else 1))
+    try:
+        _write(source, "q", length, 0, micros)
+        tasks = [
+            (source.name, target.name, length, typecode, start, end, method, args, kwargs or {})
+            for start, end in chunks
+        ]
+        _map(_method_chunk, tasks, workers, executor)
+        return _read(target, typecode, length)
+    finally:
+        source.close()
+        source.unlink()
+        target.close()
+        target.unlink()
+
+
+def shift(instants, years=0, months=0, days=0, hours=0, minutes=0, seconds=0, workers=None, chunk_size=None,
+          executor=None) -> YamTimesArray:
+    """
+    Shifts every instant like YamTimesArray.shift, across a pool of processes.
+
+    Parameters:
+    - instants: A YamTimesArray, a buffer of epoch microseconds, or an iterable of instants.
+    - workers (int, optional): The number of processes. Defaults to the number of CPUs.
+    - chunk_size (int, optional): Instants per task. Defaults to a quarter of an even share per worker,
+      and at least MIN_CHUNK_SIZE.
+    - executor (ProcessPoolExecutor, optional): An existing pool to run the tasks in.
+
+    Returns:
+    - YamTimesArray: The shifted instants, in input order.
+    """
+    kwargs = dict(years=years, months=months, days=days, hours=hours, minutes=minutes, seconds=seconds)
+    result = _apply(instants, "shift", "q", (), kwargs, workers, chunk_size, executor)
+    return result if isinstance(result, YamTimesArray) else YamTimesArray.from_micros(result)
+
+
+def truncate(instants, period: str, every: int = 1, workers=None, chunk_size=None, executor=None) -> YamTimesArray:
+    """
+    Truncates every instant to the start of its period like YamTimesArray.truncate, across a pool of processes.
+
+    Raises:
+    - ValueError: If the period is unknown or every is not positive.
+    """
+    check_period(period, every)
+    result = _apply(instants, "truncate", "q", (period, every), None, workers, chunk_size, executor)
+    return result if isinstance(result, YamTimesArray) else YamTimesArray.from_micros(result)
+
+
+def evaluate(instants, predicate: str, *args, workers=None, chunk_size=None, executor=None, **kwargs):
+    """
+    Evaluates a YamTimesArray predicate, such as "is_weekend" or "is_in_current_week", across a pool of processes.
+
+    Relative predicates ("is_past", "is_in_current_month", "classify", ...) are evaluated against a
+    single reference: when none is given, the installed clock is read once before the work is split.
+
+    Parameters:
+    - instants: A YamTimesArray, a buffer of epoch microseconds, or an iterable of instants.
+    - predicate (str): The name of a YamTimesArray method returning a mask, or "classify".
+    - *args, **kwargs: Passed to the method.
+
+    Returns:
+    - A NumPy array (booleans, or int8 codes for classify) when NumPy is available, otherwise an `array('B')`
+      (or `array('b')` for classify).
+
+    Raises:
+    - ValueError: If the predicate is not a YamTimesArray method.
+    """
+    if predicate.startswith("_") or not callable(getattr(YamTimesArray, predicate, None)):
+        raise ValueError(f"Unknown predicate: {predicate}")
+    if predicate in _RELATIVE_METHODS and not args and kwargs.get("reference") is None:
+        from .clock import current_datetime
+
+        kwargs["reference"] = current_datetime()
+    typecode = "b" if predicate == "classify" else "B"
+    result = _apply(instants, predicate, typecode, args, kwargs, workers, chunk_size, executor)
+    if np is not None and typecode == "B":
+        return result.astype(bool, copy=False)
+    if np is not None and typecode == "b":
+        return result.view(np.int8)
+    return result
+
+
+def _parse_chunk(blob_name, offsets_name, output_name, count, start, end, format):
+    # Worker: parses the strings [start, end) of the shared blob into the shared output buffer.
+    blob = _attach(blob_name)
+    offsets_block = _attach(offsets_name)
+    target = _attach(output_name)
+    try:
+        offsets = _read(offsets_block, "q", count + 1, start, end + 1).tolist()
+        low = offsets[0]
+        raw = bytes(blob.buf[low:offsets[-1]])
+        bounds = [offset - low for offset in offsets]
+        if raw.isascii():
+            # Byte offsets are character offsets, so the chunk is decoded once.
+            text = raw.decode("ascii")
+            strings = [text[bounds[index]:bounds[index + 1]] for index in range(end - start)]
+        else:
+            strings = [raw[bounds[index]:bounds[index + 1]].decode("utf-8") for index in range(end - start)]
+        parse = parse_iso if format == ISO else compile_format(format).parse
+        values = [datetime_to_micros(parse(text)) for text in strings]
+        _write(target, "q", count, start, values)
+    finally:
+        blob.close()
+        offsets_block.close()
+        target.close()
+
+
+def parse_many(strings, format: str = DEFAULT_FORMAT, workers=None, chunk_size=None, executor=None) -> YamTimesArray:
+    """
+    Parses strings into a YamTimesArray across a pool of processes.
+
+    Parameters:
+    - strings (iterable): The strings to parse. They are shared with the workers as one UTF-8 blob.
+    - format (str): A strptime format, or "iso" for ISO 8601. Defaults to "%Y-%m-%d %H:%M:%S".
+      As with YamTimesArray.from_iso_strings, UTC offsets are not applied: instants keep their wall-clock time.
+
+    Returns:
+    - YamTimesArray: The parsed instants, in input order.
+
+    Raises:
+    - ValueError: If a string does not match the format.
+    """
+    strings = list(strings)
+    count = len(strings)
+    workers = _workers(workers)
+    chunks = _chunks(count, workers, chunk_size)
+    parse = parse_iso if format == ISO else compile_format(format).parse
+    if len(chunks) <= 1 or (workers == 1 and executor is None):
+        return YamTimesArray.from_micros([datetime_to_micros(parse(text)) for text in strings])
+
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = [0]
+    offsets.extend(accumulate(len(data) for data in encoded))
+    encoded = b"".join(encoded)
+
+    blob = _create(len(encoded))
+    offsets_block = _create((count + 1) * 8)
+    target = _create(count * 8)
+    try:
+        blob.buf[:len(encoded)] = encoded
+        _write(offsets_block, "q", count + 1, 0, offsets)
+        tasks = [(blob.name, offsets_block.name, target.name, count, start, end, format) for start, end in chunks]
+        _map(_parse_chunk, tasks, workers, executor)
+        return YamTimesArray.from_micros(_read(target, "q", count))
+    finally:
+        for block in (blob, offsets_block, target):
+            block.close()
+            block.unlink()
+
+
+def _format_chunk(input_name, length, start, end, format):
+    # Worker: formats one slice of the shared input and returns the strings.
+    source = _attach(input_name)
+    try:
+        instants = YamTimesArray.from_micros(_read(source, "q", length, start, end)).to_datetimes()
+    finally:
+        source.close()
+    if format == ISO:
+        return [format_iso(dt) for dt in instants]
+    return compile_format(format).format_many(instants)
+
+
+def format_many(instants, format: str = DEFAULT_FORMAT, workers=None, chunk_size=None, executor=None) -> list:
+    """
+    Formats every instant with a single compiled format, across a pool of processes.
+
+    Parameters:
+    - instants: A YamTimesArray, a buffer of epoch microseconds, or an iterable of instants.
+    - format (str): A strftime format, or "iso" for ISO 8601. Defaults to "%Y-%m-%d %H:%M:%S".
+
+    Returns:
+    - list: The formatted strings, in input order.
+    """
+    micros = _micros_of(instants)
+    length = len(micros)
+    workers = _workers(workers)
+    chunks = _chunks(length, workers, chunk_size)
+    if len(chunks) <= 1 or (workers == 1 and executor is None):
+        datetimes = YamTimesArray.from_micros(micros).to_datetimes()
+        if format == ISO:
+            return [format_iso(dt) for dt in datetimes]
+        return compile_format(format).format_many(datetimes)
+
+    source = _create(length * 8)
+    try:
+        _write(source, "q", length, 0, micros)
+        tasks = [(source.name, length, start, end, format) for start, end in chunks]
+        result = []
+        for strings in _map(_format_chunk, tasks, workers, executor):
+            result.extend(strings)
+        return result
+    finally:
+        source.close()
+        source.unlink()
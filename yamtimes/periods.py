@@ -0,0 +1,172 @@
+from array import array
+
+from ._civil import (
+    US_PER_DAY,
+    US_PER_HOUR,
+    US_PER_MINUTE,
+    US_PER_SECOND,
+    check_period,
+    civil_from_days,
+    days_from_civil,
+    micros_buffer,
+)
+
+_FIXED_UNITS = {
+    "second": US_PER_SECOND,
+    "minute": US_PER_MINUTE,
+    "hour": US_PER_HOUR,
+    "day": US_PER_DAY,
+}
+
+
+def _keys(micros, period: str):
+    # Index of the period containing each instant, counted from the period containing the epoch.
+    # The arithmetic is branch-free, so it works on integers and element-wise on NumPy arrays.
+    unit = _FIXED_UNITS.get(period)
+    if unit is not None:
+        return micros // unit
+    days = micros // US_PER_DAY
+    if period == "week":
+        # Weeks start on Monday; week 0 starts on Monday 1969-12-29.
+        return (days + 3) // 7
+    year, month, _ = civil_from_days(days)
+    if period == "month":
+        return year * 12 + month - 1
+    if period == "quarter":
+        return year * 4 + (month - 1) // 3
+    return year
+
+
+def _starts(keys, period: str):
+    # First instant of each period index, the inverse of _keys.
+    unit = _FIXED_UNITS.get(period)
+    if unit is not None:
+        return keys * unit
+    if period == "week":
+        return (keys * 7 - 3) * US_PER_DAY
+    if period == "month":
+        year, month = keys // 12, keys % 12 + 1
+    elif period == "quarter":
+        year, month = keys // 4, keys % 4 * 3 + 1
+    else:
+        year, month = keys, 1
+    return days_from_civil(year, month, 1) * US_PER_DAY
+
+
+def floor_micros(micros: int, period: str, every: int = 1) -> int:
+    """
+    Returns the start of the period containing an instant, in wall-clock microseconds since the epoch.
+
+    Parameters:
+    - micros (int): The instant.
+    - period (str): One of "second", "minute", "hour", "day", "week", "month", "quarter" or "year".
+      Weeks start on Monday.
+    - every (int, optional): Groups that many consecutive periods into one, e.g. period="minute", every=15.
+      Groups of months and quarters are aligned on the start of the year when they divide it evenly.
+
+    Raises:
+    - ValueError: If the period is unknown or every is not positive.
+    """
+    check_period(period, every)
+    return _starts(_keys(micros, period) // every * every, period)
+
+
+def ceil_micros(micros: int, period: str, every: int = 1) -> int:
+    """
+    Returns the first period boundary at or after an instant, in wall-clock microseconds since the epoch.
+
+    An instant that is already on a boundary is returned unchanged.
+    """
+    check_period(period, every)
+    key = _keys(micros, period) // every * every
+    start = _starts(key, period)
+    return micros if start == micros else _starts(key + every, period)
+
+
+def bucket_keys(instants, period: str, every: int = 1):
+    """
+    Returns the integer bucket key of every instant, for grouping.
+
+    Keys are consecutive integers: key + 1 is the next period, and bucket_starts turns keys
+    back into the first instant of each bucket.
+
+    Parameters:
+    - instants: A YamTimesArray, a buffer of epoch microseconds, or an iterable of YamTimes
+      instances, datetimes, dates or integers.
+    - period (str): One of "second", "minute", "hour", "day", "week", "month", "quarter" or "year".
+    - every (int, optional): The number of periods per bucket. Defaults to 1.
+
+    Returns:
+    - A NumPy int64 array when NumPy is available, otherwise an `array('q')`.
+    """
+    check_period(period, every)
+    np, micros = micros_buffer(instants)
+    if np is not None:
+        return _keys(micros, period) // every
+    return array("q", [_keys(value, period) // every for value in micros])
+
+
+def bucket_starts(keys, period: str, every: int = 1):
+    """
+    Returns the first instant, in epoch microseconds, of every bucket key returned by bucket_keys.
+    """
+    check_period(period, every)
+    from ._compat import np
+
+    if np is not None:
+        return _starts(np.asarray(keys, dtype=np.int64) * every, period)
+    return array("q", [_starts(key * every, period) for key in keys])
+
+
+def bucketize(instants, period: str, every: int = 1) -> tuple:
+    """
+    Counts the instants falling in every period, without creating any YamTimes objects.
+
+    Parameters:
+    - instants: A YamTimesArray, a buffer of epoch microseconds, or an iterable of YamTimes
+      instances, datetimes, dates or integers.
+    - period (str): One of "second", "minute", "hour", "day", "week", "month", "quarter" or "year".
+    - every (int, optional): The number of periods per bucket. Defaults to 1.
+
+    Returns:
+    - tuple: (keys, counts), the sorted distinct bucket keys and the number of instants in each.
+      Both are NumPy int64 arrays when NumPy is available, otherwise `array('q')` instances.
+      Use bucket_starts(keys, period, every) for the first instant of every bucket.
+    """
+    keys = bucket_keys(instants, period, every)
+    if isinstance(keys, array):
+        counts = {}
+        for key in keys:
+            counts[key] = counts.get(key, 0) + 1
+        ordered = sorted(counts)
+        return array("q", ordered), array("q", [counts[key] for key in ordered])
+    from ._compat import np
+
+    unique, counts = np.unique(keys, return_counts=True)
+    return unique, counts.astype(np.int64)
+
+
+def floor_many(instants, period: str, every: int = 1):
+    """
+    Returns the start of the period containing every instant, in epoch microseconds.
+
+    Returns:
+    - A NumPy int64 array when NumPy is available, otherwise an `array('q')`.
+    """
+    return bucket_starts(bucket_keys(instants, period, every), period, every)
+
+
+def ceil_many(instants, period: str, every: int = 1):
+    """
+    Returns the first period boundary at or after every instant, in epoch microseconds.
+
+    Returns:
+    - A NumPy int64 array when NumPy is available, otherwise an `array('q')`.
+    """
+    check_period(period, every)
+    np, micros = micros_buffer(instants)
+    if np is None:
+        return array("q", [ceil_micros(value, period, every) for value in micros])
+    key = _keys(micros, period) // every * every
+    start = _starts(key, period)
+    return np.where(start == micros, micros, _starts(key + every, period))
@@ -0,0 +1,428 @@
+from array import array
+from datetime import timedelta
+
+from ._civil import (
+    EPOCH_ORDINAL,
+    US_PER_DAY,
+    US_PER_SECOND,
+    civil_from_days,
+    datetime_to_micros,
+    days_from_civil,
+    micros_to_datetime,
+    to_datetime,
+    weekday_from_days,
+    year_table,
+)
+from .yamtimes import YamTimes
+
+
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+YEARLY = "yearly"
+_FREQUENCIES = (DAILY, WEEKLY, MONTHLY, YEARLY)
+
+# Day number of 9999-12-31, the last day datetime can represent.
+_LAST_DAY = days_from_civil(9999, 12, 31)
+
+
+def _step_micros(step) -> int:
+    if isinstance(step, timedelta):
+        return (step.days * 86400 + step.seconds) * US_PER_SECOND + step.microseconds
+    return int(step)
+
+
+def _instant(micros: int, tzinfo) -> YamTimes:
+    dt = micros_to_datetime(micros)
+    if tzinfo is not None:
+        dt = dt.replace(tzinfo=tzinfo)
+    return YamTimes(dt=dt)
+
+
+def _buffer(values):
+    from ._compat import np
+    from .columnar import YamTimesArray
+
+    if np is not None:
+        return YamTimesArray.from_micros(np.fromiter(values, dtype=np.int64))
+    return YamTimesArray.from_micros(array("q", values))
+
+
+class TimeRange:
+    """
+    A lazy, fixed-step sequence of instants over the half-open span [start, end).
+
+    Like the built-in range, it stores only its start, step and length: len(),
+    indexing, slicing and membership tests take constant time, and instants are
+    created one at a time while iterating. Steps are applied to the wall-clock
+    time; the tzinfo of `start`, if any, is attached to every instant.
+    """
+
+    def __init__(self, start, end, step=timedelta(days=1)):
+        """
+        Initializes the range.
+
+        Parameters:
+        - start (YamTimes, datetime or date): The first instant.
+        - end (YamTimes, datetime or date): The end of the range, which is not included.
+        - step (timedelta or int): The distance between instants, as a timedelta or in microseconds.
+          Can be negative to walk backwards. Defaults to one day.
+        """
+        step = _step_micros(step)
+        if not step:
+            raise ValueError("TimeRange step must not be zero")
+        first = to_datetime(start)
+        self._tzinfo = first.tzinfo
+        self._start = datetime_to_micros(first)
+        self._step = step
+        self._length = len(range(self._start, datetime_to_micros(to_datetime(end)), step))
+
+    @classmethod
+    def _from_parts(cls, start: int, step: int, length: int, tzinfo) -> "TimeRange":
+        self = cls.__new__(cls)
+        self._start = start
+        self._step = step
+        self._length = length
+        self._tzinfo = tzinfo
+        return self
+
+    @property
+    def step(self) -> timedelta:
+        """
+        Returns the step between consecutive instants.
+        """
+        return timedelta(microseconds=self._step)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __iter__(self):
+        micros = self._start
+        for _ in range(self._length):
+            yield _instant(micros, self._tzinfo)
+            micros += self._step
+
+    def __reversed__(self):
+        return iter(self[::-1])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indexes = range(self._length)[index]
+            return TimeRange._from_parts(
+                self._start + indexes.start * self._step,
+                self._step * indexes.step,
+                len(indexes),
+                self._tzinfo,
+            )
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("TimeRange index out of range")
+        return _instant(self._start + index * self._step, self._tzinfo)
+
+    def __contains__(self, value) -> bool:
+        try:
+            micros = datetime_to_micros(to_datetime(value))
+        except TypeError:
+            return False
+        index, remainder = divmod(micros - self._start, self._step)
+        return not remainder and 0 <= index < self._length
+
+    def index(self, value) -> int:
+        """
+        Returns the position of an instant in the range.
+
+        Raises:
+        - ValueError: If the instant is not in the range.
+        """
+        if value not in self:
+            raise ValueError(f"{value} is not in range")
+        return (datetime_to_micros(to_datetime(value)) - self._start) // self._step
+
+    def __repr__(self):
+        return f"TimeRange(start={micros_to_datetime(self._start)}, step={self.step}, len={self._length})"
+
+    def to_array(self):
+        """
+        Materializes the range as a YamTimesArray in a single pass.
+
+        Returns:
+        - YamTimesArray: The instants of the range, as wall-clock times.
+        """
+        from ._compat import np
+        from .columnar import YamTimesArray
+
+        if np is not None:
+            return YamTimesArray.from_micros(self._start + np.arange(self._length, dtype=np.int64) * self._step)
+        return _buffer(self._start + index * self._step for index in range(self._length))
+
+
+def _parse_weekdays(by_weekday) -> tuple:
+    # Splits weekdays into plain ones (every such day) and (weekday, n) pairs (the n-th one).
+    if by_weekday is None:
+        return frozenset(), ()
+    if isinstance(by_weekday, (int, tuple)):
+        by_weekday = [by_weekday]
+    plain = set()
+    nth = []
+    for entry in by_weekday:
+        weekday, n = entry if isinstance(entry, tuple) else (entry, None)
+        if not 0 <= weekday <= 6:
+            raise ValueError(f"Invalid weekday: {weekday} (Monday is 0 and Sunday is 6)")
+        if n is None:
+            plain.add(weekday)
+        elif n == 0 or abs(n) > 53:
+            raise ValueError(f"Invalid weekday position: {n}")
+        else:
+            nth.append((weekday, n))
+    return frozenset(plain), tuple(nth)
+
+
+def _as_tuple(values) -> tuple:
+    if values is None:
+        return ()
+    if isinstance(values, int):
+        return (values,)
+    return tuple(values)
+
+
+class Recurrence:
+    """
+    An RRULE-style (RFC 5545) recurrence rule that yields its occurrences lazily.
+
+    Occurrences are generated one period (day, week, month or year) at a time
+    from integer day numbers, so iterating a rule never materializes more than
+    one period, and `to_array` writes a bounded rule straight into a columnar
+    buffer. Every occurrence keeps the time of day and tzinfo of `start`, and
+    the start itself is only included when it matches the rule.
+    """
+
+    def __init__(self, frequency: str, start, interval: int = 1, count: int = None, until=None,
+                 by_weekday=None, by_monthday=None, by_month=None):
+        """
+        Initializes the rule.
+
+        Parameters:
+        - frequency (str): "daily", "weekly", "monthly" or "yearly".
+        - start (YamTimes, datetime or date): The first instant the rule can produce.
+        - interval (int): The number of periods between repetitions, e.g. 2 for every other week. Defaults to 1.
+        - count (int, optional): The maximum number of occurrences.
+        - until (YamTimes, datetime or date, optional): The last instant an occurrence can fall on (inclusive).
+        - by_weekday (int, tuple or iterable, optional): Weekdays (Monday is 0) to expand to or filter by. A
+          (weekday, n) pair selects the n-th such weekday of the month (of the year, for yearly rules without
+          by_month), counting from the end when n is negative; it is only allowed for monthly and yearly rules.
+        - by_monthday (int or iterable, optional): Days of the month; negative values count from the end.
+        - by_month (int or iterable, optional): Months (1-12) to expand to or filter by.
+        """
+        frequency = frequency.lower()
+        if frequency not in _FREQUENCIES:
+            raise ValueError(f"Unsupported frequency: {frequency} (expected one of {', '.join(_FREQUENCIES)})")
+        if interval < 1:
+            raise ValueError("The interval must be a positive integer")
+        first = to_datetime(start)
+        self.frequency = frequency
+        self.interval = interval
+        self.count = count
+        self._tzinfo = first.tzinfo
+        self._first_day = first.toordinal() - EPOCH_ORDINAL
+        self._time = datetime_to_micros(first) - self._first_day * US_PER_DAY
+        self._until = None if until is None else datetime_to_micros(to_datetime(until))
+        self._weekdays, self._nth_weekdays = _parse_weekdays(by_weekday)
+        if self._nth_weekdays and frequency in (DAILY, WEEKLY):
+            raise ValueError("Positional weekdays are only supported by monthly and yearly rules")
+        self._monthdays = _as_tuple(by_monthday)
+        self._months = frozenset(_as_tuple(by_month))
+
+    def __repr__(self):
+        return f"Recurrence({self.frequency!r}, start={micros_to_datetime(self._first_day * US_PER_DAY + self._time)})"
+
+    def _monthday_set(self, year: int, month: int) -> set:
+        length = year_table(year).month_lengths[month - 1]
+        first = days_from_civil(year, month, 1)
+        days = set()
+        for day in self._monthdays:
+            day = day if day > 0 else length + day + 1
+            if 1 <= day <= length:
+                days.add(first + day - 1)
+        return days
+
+    def _weekday_set(self, first: int, length: int) -> set:
+        # Matching weekdays in the span of `length` days starting at day number `first`;
+        # positional weekdays count within the span.
+        days = set()
+        first_weekday = weekday_from_days(first)
+        for weekday in self._weekdays:
+            days.update(range(first + (weekday - first_weekday) % 7, first + length, 7))
+        last_weekday = (first_weekday + length - 1) % 7
+        for weekday, n in self._nth_weekdays:
+            if n > 0:
+                offset = (weekday - first_weekday) % 7 + (n - 1) * 7
+            else:
+                offset = length - 1 - (last_weekday - weekday) % 7 + (n + 1) * 7
+            if 0 <= offset < length:
+                days.add(first + offset)
+        return days
+
+    def _select(self, monthdays, first: int, length: int, default) -> list:
+        weekdays = self._weekday_set(first, length) if self._weekdays or self._nth_weekdays else None
+        if monthdays is not None and weekdays is not None:
+            days = monthdays & weekdays
+        elif monthdays is not None:
+            days = monthdays
+        elif weekdays is not None:
+            days = weekdays
+        else:
+            days = default
+        return sorted(days)
+
+    def _month_days(self, year: int, month: int, start_day: int) -> list:
+        # Day numbers of the occurrences within one month, in order.
+        length = year_table(year).month_lengths[month - 1]
+        first = days_from_civil(year, month, 1)
+        monthdays = self._monthday_set(year, month) if self._monthdays else None
+        default = {first + start_day - 1} if start_day <= length else ()
+        return self._select(monthdays, first, length, default)
+
+    def _period_start(self, index: int) -> int:
+        # Day number of the first day of the index-th period.
+        first = self._first_day
+        if self.frequency == DAILY:
+            return first + index * self.interval
+        if self.frequency == WEEKLY:
+            return first - weekday_from_days(first) + index * self.interval * 7
+        start_year, start_month, _ = civil_from_days(first)
+        if self.frequency == MONTHLY:
+            year, month = divmod(start_year * 12 + start_month - 1 + index * self.interval, 12)
+            return days_from_civil(year, month + 1, 1)
+        return days_from_civil(start_year + index * self.interval, 1, 1)
+
+    def _period(self, index: int):
+        # Day numbers of the occurrences in the index-th period, or None past year 9999.
+        first = self._first_day
+        if self.frequency == DAILY:
+            day = first + index * self.interval
+            if day > _LAST_DAY:
+                return None
+            return self._filter([day])
+        if self.frequency == WEEKLY:
+            monday = first - weekday_from_days(first) + index * self.interval * 7
+            if monday > _LAST_DAY:
+                return None
+            if self._weekdays:
+                weekdays = sorted(self._weekdays)
+            elif self._monthdays:
+                weekdays = range(7)
+            else:
+                weekdays = [weekday_from_days(first)]
+            return self._filter([monday + weekday for weekday in weekdays if monday + weekday <= _LAST_DAY])
+        start_year, start_month, start_day = civil_from_days(first)
+        if self.frequency == MONTHLY:
+            year, month = divmod(start_year * 12 + start_month - 1 + index * self.interval, 12)
+            month += 1
+            if year > 9999:
+                return None
+            if self._months and month not in self._months:
+                return []
+            return self._month_days(year, month, start_day)
+        year = start_year + index * self.interval
+        if year > 9999:
+            return None
+        if self._months or not (self._weekdays or self._nth_weekdays or self._monthdays):
+            days = []
+            for month in sorted(self._months) or [start_month]:
+                days.extend(self._month_days(year, month, start_day))
+            return days
+        # Without by_month, a yearly rule expands over the whole year, and positional
+        # weekdays count from the start (or end) of the year.
+        monthdays = None
+        if self._monthdays:
+            monthdays = set()
+            for month in range(1, 13):
+                monthdays |= self._monthday_set(year, month)
+        return self._select(monthdays, days_from_civil(year, 1, 1), 366 if year_table(year).leap else 365, ())
+
+    def _filter(self, days: list) -> list:
+        # Daily and weekly rules use by_month, by_monthday and by_weekday as filters.
+        selected = []
+        for day in days:
+            year, month, month_day = civil_from_days(day)
+            if self._months and month not in self._months:
+                continue
+            if self._weekdays and weekday_from_days(day) not in self._weekdays:
+                continue
+            if self._monthdays:
+                length = year_table(year).month_lengths[month - 1]
+                if month_day not in self._monthdays and month_day - length - 1 not in self._monthdays:
+                    continue
+            selected.append(day)
+        return selected
+
+    def iter_micros(self):
+        """
+        Lazily yields the occurrences as wall-clock microseconds since the epoch.
+        """
+        produced = 0
+        index = 0
+        while True:
+            # Rules whose filters reject whole periods would otherwise scan up to year 9999.
+            if self._until is not None and self._period_start(index) * US_PER_DAY + self._time > self._until:
+                return
+            days = self._period(index)
+            if days is None:
+                return
+            for day in days:
+                if day < self._first_day:
+                    continue
+                micros = day * US_PER_DAY + self._time
+                if self._until is not None and micros > self._until:
+                    return
+                yield micros
+                produced += 1
+                if self.count is not None and produced >= self.count:
+                    return
+            index += 1
+
+    def __iter__(self):
+        for micros in self.iter_micros():
+            yield _instant(micros, self._tzinfo)
+
+    def between(self, start, end, inclusive: bool = True):
+        """
+        Lazily yields the occurrences between two instants.
+
+        Parameters:
+        - start (YamTimes, datetime or date): The beginning of the window.
+        - end (YamTimes, datetime or date): The end of the window.
+        - inclusive (bool): Whether occurrences equal to start or end are included. Defaults to True.
+
+        Returns:
+        - generator: The YamTimes occurrences in the window, in order.
+        """
+        low = datetime_to_micros(to_datetime(start))
+        high = datetime_to_micros(to_datetime(end))
+        for micros in self.iter_micros():
+            if micros > high or (micros == high and not inclusive):
+                return
+            if micros > low or (micros == low and inclusive):
+                yield _instant(micros, self._tzinfo)
+
+    def to_array(self, limit: int = None):
+        """
+        Writes the occurrences into a YamTimesArray without creating YamTimes instances.
+
+        Parameters:
+        - limit (int, optional): The maximum number of occurrences to write. Required when the rule has
+          neither a count nor an until bound.
+
+        Returns:
+        - YamTimesArray: The occurrences, as wall-clock times.
+        """
+        if limit is None and self.count is None and self._until is None:
+            raise ValueError("An unbounded recurrence needs a limit to be materialized")
+        values = self.iter_micros()
+        if limit is not None:
+            values = (micros for micros, _ in zip(values, range(limit)))
+        return _buffer(values)
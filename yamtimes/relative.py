@@ -0,0 +1,121 @@
+from array import array
+from collections import namedtuple
+
+from ._civil import US_PER_DAY, civil_from_days, days_from_civil, to_micros
+from ._compat import np
+from .clock import current_datetime
+
+# The edges of the periods around a reference instant, in wall-clock microseconds since the
+# epoch. Every period is half-open: an instant is in the current week when
+# week_start <= instant < next_week.
+Boundaries = namedtuple(
+    "Boundaries", "now today tomorrow week_start next_week month_start next_month year_start next_year"
+)
+
+# Bucket codes returned by classify, from the most specific period containing an instant.
+PAST = 0
+THIS_YEAR = 1
+THIS_MONTH = 2
+THIS_WEEK = 3
+TODAY = 4
+FUTURE = 5
+BUCKET_LABELS = ("past", "this_year", "this_month", "this_week", "today", "future")
+
+
+def reference_boundaries(reference=None) -> Boundaries:
+    """
+    Computes the period boundaries around a reference instant, once for a whole batch.
+
+    Parameters:
+    - reference (YamTimes, datetime, date or int, optional): The instant taken as "now".
+      Defaults to the current time of the installed clock (see yamtimes.clock).
+
+    Returns:
+    - Boundaries: The edges of the current day, week (starting on Monday), month and year.
+    """
+    if reference is None:
+        reference = current_datetime()
+    now = to_micros(reference)
+    today = now // US_PER_DAY
+    year, month, _ = civil_from_days(today)
+    week_start = today - (today + 3) % 7
+    next_year, next_month = divmod(year * 12 + month, 12)
+    return Boundaries(
+        now=now,
+        today=today * US_PER_DAY,
+        tomorrow=(today + 1) * US_PER_DAY,
+        week_start=week_start * US_PER_DAY,
+        next_week=(week_start + 7) * US_PER_DAY,
+        month_start=days_from_civil(year, month, 1) * US_PER_DAY,
+        next_month=days_from_civil(next_year, next_month + 1, 1) * US_PER_DAY,
+        year_start=days_from_civil(year, 1, 1) * US_PER_DAY,
+        next_year=days_from_civil(year + 1, 1, 1) * US_PER_DAY,
+    )
+
+
+def between(micros, low: int, high: int):
+    """
+    Returns a mask that is true where low <= value < high.
+
+    Parameters:
+    - micros: A NumPy int64 array or `array('q')` of epoch microseconds.
+
+    Returns:
+    - A NumPy boolean array when NumPy is available, otherwise an `array('B')` of 0/1 values.
+    """
+    if np is not None:
+        return (micros >= low) & (micros < high)
+    return array("B", [low <= value < high for value in micros])
+
+
+def before(micros, limit: int):
+    """
+    Returns a mask that is true where value < limit.
+    """
+    if np is not None:
+        return micros < limit
+    return array("B", [value < limit for value in micros])
+
+
+def at_or_after(micros, limit: int):
+    """
+    Returns a mask that is true where value >= limit.
+    """
+    if np is not None:
+        return micros >= limit
+    return array("B", [value >= limit for value in micros])
+
+
+def classify(micros, boundaries: Boundaries):
+    """
+    Assigns every instant the code of the most specific period around the reference that contains it:
+    TODAY, THIS_WEEK, THIS_MONTH, THIS_YEAR, or PAST / FUTURE for instants outside the current year.
+
+    Parameters:
+    - micros: A NumPy int64 array or `array('q')` of epoch microseconds.
+    - boundaries (Boundaries): The reference periods, from reference_boundaries.
+
+    Returns:
+    - A NumPy int8 array when NumPy is available, otherwise an `array('b')`. BUCKET_LABELS[code] names each code.
+    """
+    b = boundaries
+    if np is not None:
+        codes = np.where(micros < b.year_start, PAST, FUTURE).astype(np.int8)
+        codes[(micros >= b.year_start) & (micros < b.next_year)] = THIS_YEAR
+        codes[(micros >= b.month_start) & (micros < b.next_month)] = THIS_MONTH
+        codes[(micros >= b.week_start) & (micros < b.next_week)] = THIS_WEEK
+        codes[(micros >= b.today) & (micros < b.tomorrow)] = TODAY
+        return codes
+    codes = array("b")
+    for value in micros:
+        if b.today <= value < b.tomorrow:
+            codes.append(TODAY)
+        elif b.week_start <= value < b.next_week:
+            codes.append(THIS_WEEK)
+        elif b.month_start <= value < b.next_month:
+            codes.append(THIS_MONTH)
+        elif b.year_start <= value < b.next_year:
+            codes.append(THIS_YEAR)
+        else:
+            codes.append(PAST if value < b.year_start else FUTURE)
+    return codes
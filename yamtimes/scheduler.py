@@ -0,0 +1,393 @@
+"""
+An asyncio scheduler that runs callbacks at the instants given by calendar rules.
+
+Pending fire times live in one heap keyed by POSIX timestamp, and a single
+event-loop timer is armed for the earliest one, so thousands of schedules cost
+one wakeup per due instant rather than one sleeping task per schedule.
+
+A rule is any object with a `next_fire(after)` method returning the first fire
+time strictly after `after` (a datetime), or None when the rule is exhausted.
+Cron expression strings, iterables of instants (a Recurrence, a TimeRange, a
+list) and callables such as `lambda last: last.next_business_day()` are adapted
+automatically, and Every fires at a fixed interval.
+"""
+import asyncio
+import heapq
+import inspect
+from datetime import datetime, timedelta, timezone
+
+from ._civil import to_datetime
+from .clock import current_datetime
+from .yamtimes import YamTimes
+
+
+def _localize(dt, after: datetime) -> datetime:
+    # Naive fire times are wall-clock times in the zone of `after`, so they can be compared with it.
+    dt = to_datetime(dt)
+    if dt.tzinfo is None and after.tzinfo is not None:
+        return dt.replace(tzinfo=after.tzinfo)
+    return dt
+
+
+class Every:
+    """
+    A rule firing at a fixed interval, aligned on a start instant.
+    """
+
+    def __init__(self, interval, start=None):
+        """
+        Initializes the rule.
+
+        Parameters:
+        - interval (timedelta or number): The period, as a timedelta or in seconds.
+        - start (YamTimes or datetime, optional): An instant the schedule is aligned on. Defaults to the
+          first time next_fire is called, so the first run is one interval later.
+
+        Raises:
+        - ValueError: If the interval is not positive.
+        """
+        if not isinstance(interval, timedelta):
+            interval = timedelta(seconds=interval)
+        if interval <= timedelta(0):
+            raise ValueError("The interval must be positive")
+        self.interval = interval
+        self.start = to_datetime(start) if start is not None else None
+
+    def next_fire(self, after: datetime) -> datetime:
+        if self.start is None:
+            self.start = after
+        self.start = _localize(self.start, after)
+        if after < self.start:
+            return self.start
+        # Like cron rules, the schedule is exhausted once its next fire time is past year 9999.
+        try:
+            if after.tzinfo is None:
+                periods = (after - self.start) // self.interval + 1
+                return self.start + periods * self.interval
+            # Aware intervals are elapsed time, so step in UTC: wall-clock arithmetic would repeat the
+            # skipped hour at a spring-forward transition and skip the repeated one at a fall-back.
+            start = self.start.astimezone(timezone.utc)
+            periods = (after.astimezone(timezone.utc) - start) // self.interval + 1
+            return (start + periods * self.interval).astimezone(after.tzinfo)
+        except OverflowError:
+            return None
+
+    def __repr__(self):
+        return f"Every({self.interval!r}, start={self.start!r})"
+
+
+class _CallableRule:
+    # Adapts `function(last: YamTimes) -> YamTimes or datetime`, called until it passes `after`.
+    def __init__(self, function):
+        self.function = function
+
+    def next_fire(self, after: datetime):
+        instant = after
+        while True:
+            result = self.function(YamTimes(dt=instant))
+            if result is None:
+                return None
+            result = _localize(result, after)
+            if result > after:
+                return result
+            if result <= instant:
+                raise ValueError(f"The rule {self.function!r} did not move forward from {instant}")
+            instant = result
+
+
+class _IterableRule:
+    # Adapts an ascending iterable of instants, consuming it as the schedule advances.
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+        self._next = None
+
+    def next_fire(self, after: datetime):
+        while self._next is None or self._next <= after:
+            instant = next(self._iterator, None)
+            if instant is None:
+                return None
+            self._next = _localize(instant, after)
+        return self._next
+
+
+def as_rule(rule):
+    """
+    Returns an object with a next_fire method for a rule, a cron expression string, an iterable of
+    instants, or a callable.
+
+    Raises:
+    - TypeError: If the value cannot be used as a rule.
+    """
+    if hasattr(rule, "next_fire"):
+        return rule
+    if isinstance(rule, str):
+        from .cron import compile_cron
+
+        return compile_cron(rule)
+    if callable(rule):
+        return _CallableRule(rule)
+    if hasattr(rule, "__iter__"):
+        return _IterableRule(rule)
+    raise TypeError("A rule must have a next_fire method, be callable, or be an iterable of instants")
+
+
+class Job:
+    """
+    A scheduled callback. Returned by Scheduler.schedule.
+    """
+
+    __slots__ = ("rule", "callback", "args", "name", "max_runs", "runs", "next_fire", "last_fire", "_timestamp",
+                 "_entry", "_scheduler")
+
+    def __init__(self, scheduler, rule, callback, args, name, max_runs):
+        self._scheduler = scheduler
+        self.rule = rule
+        self.callback = callback
+        self.args = args
+        self.name = name
+        self.max_runs = max_runs
+        self.runs = 0
+        self.next_fire = None
+        self.last_fire = None
+        self._timestamp = None
+        self._entry = None
+
+    @property
+    def active(self) -> bool:
+        """
+        True while the job has a pending fire time.
+        """
+        return self._timestamp is not None
+
+    def cancel(self) -> None:
+        """
+        Removes the job from its scheduler. Runs that already started are not interrupted.
+        """
+        self._scheduler.cancel(self)
+
+    def __repr__(self):
+        return f"Job(name={self.name!r}, next_fire={self.next_fire!r}, runs={self.runs})"
+
+
+class Scheduler:
+    """
+    Runs callbacks at the instants produced by calendar rules, on the running asyncio loop.
+
+        async with Scheduler(tz="America/New_York") as scheduler:
+            scheduler.schedule(Every(timedelta(minutes=5)), poll)
+            scheduler.schedule(lambda last: last.next_business_day().set_time(9), report)
+            await scheduler.wait()
+
+    Coroutine functions are started as tasks; plain functions are called on the loop. Exceptions
+    raised by callbacks go to the loop's exception handler and do not stop the schedule; a rule
+    that raises is reported the same way and ends only its own job. When the
+    loop was too busy to run a job on time, it runs once and resumes at the next fire time after
+    the current time instead of replaying every missed instant.
+    """
+
+    def __init__(self, tz=None):
+        """
+        Initializes the scheduler.
+
+        Parameters:
+        - tz (str or tzinfo, optional): The time zone of the rules. Rules get aware datetimes in that zone,
+          and naive fire times are taken as wall-clock times in it. Defaults to naive local time.
+        """
+        if tz is not None:
+            from .zones import get_zone
+
+            tz = get_zone(tz)
+        self.tz = tz
+        self._heap = []
+        self._counter = 0
+        self._pending = 0
+        self._timer = None
+        self._timer_at = None
+        self._loop = None
+        self._tasks = set()
+        self._idle = None
+        self._running = False
+
+    def _now(self) -> datetime:
+        return current_datetime(self.tz)
+
+    def _timestamp(self, dt: datetime) -> float:
+        if dt.tzinfo is None and self.tz is not None:
+            dt = dt.replace(tzinfo=self.tz)
+        return dt.timestamp()
+
+    @property
+    def jobs(self) -> list:
+        """
+        Returns the pending jobs, earliest first.
+        """
+        return [job for _, entry, job in sorted(self._heap) if job._timestamp is not None and job._entry == entry]
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def schedule(self, rule, callback, *args, name: str = None, max_runs: int = None) -> Job:
+        """
+        Schedules a callback.
+
+        Parameters:
+        - rule: An object with next_fire(after), a cron expression such as "*/5 9-17 * * MON-FRI", an iterable of instants (Recurrence, TimeRange, ...),
+          or a callable mapping the previous fire time (a YamTimes) to the next one.
+        - callback (callable): A function or coroutine function, called with *args.
+        - name (str, optional): A label for the job.
+        - max_runs (int, optional): Stops the job after that many runs.
+
+        Returns:
+        - Job: The scheduled job. It is inactive if the rule never fires.
+        """
+        job = Job(self, as_rule(rule), callback, args, name, max_runs)
+        self._advance(job, self._now())
+        return job
+
+    def cancel(self, job: Job) -> None:
+        """
+        Cancels a job. Its heap entry is dropped lazily when it reaches the top.
+        """
+        if job._timestamp is not None:
+            self._pending -= 1
+        job._timestamp = None
+        job.next_fire = None
+        self._check_idle()
+
+    def _advance(self, job: Job, after: datetime) -> None:
+        # Computes the next fire time of the job and pushes it on the heap.
+        fire = None
+        if job.max_runs is None or job.runs < job.max_runs:
+            fire = job.rule.next_fire(after)
+        if fire is None:
+            self.cancel(job)
+            return
+        fire = to_datetime(fire)
+        if self.tz is not None and fire.tzinfo is None:
+            fire = fire.replace(tzinfo=self.tz)
+        if job._timestamp is None:
+            self._pending += 1
+        job.next_fire = fire
+        job._timestamp = self._timestamp(fire)
+        self._counter += 1
+        job._entry = self._counter
+        heapq.heappush(self._heap, (job._timestamp, self._counter, job))
+        if self._idle is not None:
+            self._idle.clear()
+        if self._running and (self._timer_at is None or job._timestamp < self._timer_at):
+            self._arm()
+
+    def _arm(self) -> None:
+        # Points the single timer at the earliest live heap entry.
+        heap = self._heap
+        # Entries of cancelled or rescheduled jobs are stale; they are dropped here instead of searched for.
+        while heap and (heap[0][2]._timestamp is None or heap[0][2]._entry != heap[0][1]):
+            heapq.heappop(heap)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_at = None
+        if not heap or not self._running:
+            return
+        timestamp = heap[0][0]
+        delay = timestamp - self._now().timestamp()
+        self._timer_at = timestamp
+        self._timer = self._loop.call_at(self._loop.time() + max(delay, 0.0), self._wake)
+
+    def _wake(self) -> None:
+        self._timer = None
+        self._timer_at = None
+        now = self._now()
+        now_timestamp = now.timestamp()
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= now_timestamp:
+            _, entry, job = heapq.heappop(heap)
+            if job._timestamp is not None and job._entry == entry:
+                due.append(job)
+        try:
+            for job in due:
+                # An earlier callback may have cancelled this job.
+                if job._timestamp is None:
+                    continue
+                job.runs += 1
+                job.last_fire = job.next_fire
+                self._run(job)
+                if job._timestamp is None:
+                    continue
+                after = job.next_fire if job.next_fire > now else now
+                try:
+                    self._advance(job, after)
+                except Exception as error:
+                    # A failing rule ends its own job only; the others keep their schedule.
+                    self._report(error, job)
+                    self.cancel(job)
+        finally:
+            self._arm()
+
+    def _run(self, job: Job) -> None:
+        try:
+            if inspect.iscoroutinefunction(job.callback):
+                task = self._loop.create_task(job.callback(*job.args))
+                self._tasks.add(task)
+                task.add_done_callback(self._task_done)
+            else:
+                job.callback(*job.args)
+        except Exception as error:
+            self._report(error, job)
+
+    def _task_done(self, task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._report(task.exception(), None)
+        self._check_idle()
+
+    def _report(self, error: BaseException, job) -> None:
+        self._loop.call_exception_handler({
+            "message": f"Scheduled job {job.name!r} failed" if job is not None else "Scheduled job failed",
+            "exception": error,
+            "job": job,
+        })
+
+    def _check_idle(self) -> None:
+        if self._idle is not None and not self._tasks and not self._pending:
+            self._idle.set()
+
+    def start(self) -> None:
+        """
+        Starts firing jobs. Must be called from a running event loop.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+        self._idle = asyncio.Event()
+        self._arm()
+        self._check_idle()
+
+    def stop(self) -> None:
+        """
+        Stops firing jobs. Pending jobs stay scheduled and resume on the next start.
+        """
+        self._running = False
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_at = None
+
+    async def wait(self) -> None:
+        """
+        Waits until no job is pending and every started coroutine has finished.
+        """
+        if self._idle is None:
+            raise RuntimeError("The scheduler is not started")
+        self._check_idle()
+        await self._idle.wait()
+
+    async def __aenter__(self) -> "Scheduler":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.stop()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        return False
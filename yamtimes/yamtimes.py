@@ -1,11 +1,75 @@
-import locale
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta  
-import calendar
+
+from ._civil import (
+    add_months_to_datetime,
+    datetime_to_micros,
+    days_in_month,
+    iso_week_number,
+    iso_week_year,
+    micros_to_datetime,
+    months_between,
+    ordinal_day,
+    shift_datetime,
+    year_table,
+)
+from .clock import current_datetime
+from .formats import compile_format
+from .iso import format_iso, format_iso_date, format_iso_time, parse_iso
+
+# Type checkers take any TYPE_CHECKING constant as true; defining it here keeps typing off the cold start.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .business import BusinessCalendar
+    from .recurrence import Recurrence, TimeRange
+
+
+def _zone(tz):
+    # zoneinfo is only loaded once a time zone is actually used.
+    from .zones import get_zone
+    return get_zone(tz)
+
+
+def _locale_names(language_code: str):
+    # Like zones, the locale tables are only loaded once a localized name is asked for.
+    from .locales import get_locale_names
+    return get_locale_names(language_code)
+
+
+def _calendar(calendar):
+    from .business import DEFAULT_CALENDAR
+    return calendar or DEFAULT_CALENDAR
+
+
+def _whole_seconds(delta: timedelta) -> int:
+    # Rounded toward zero with integer arithmetic: total_seconds() is a float and loses
+    # microseconds once the delta spans a few centuries.
+    micros = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+    return -(-micros // 1000000) if micros < 0 else micros // 1000000
+
+
+def _aligned(dt: datetime, reference: datetime) -> datetime:
+    # Calendar fields are only comparable on the same wall clock.
+    if dt.tzinfo is not None and reference.tzinfo is not None:
+        return dt.astimezone(reference.tzinfo)
+    return dt
+
+
+def _monday_ordinal(dt: datetime) -> int:
+    # Proleptic ordinal of the Monday starting the week of dt.
+    return dt.toordinal() - dt.weekday()
+
+
+def _restore(dt: datetime) -> "YamTimes":
+    # Unpickles a YamTimes instance.
+    instance = object.__new__(YamTimes)
+    object.__setattr__(instance, "_YamTimes__datetime", dt)
+    return instance
 
 
 class YamTimes:
-    def __init__(self,year = None, month = None, day = None, hour = None, minute = None, dt=None):
+    __slots__ = ("__datetime",)
+
+    def __init__(self,year = None, month = None, day = None, hour = None, minute = None, dt=None, tz=None):
         """
         Initializes the YamTimes object, setting the date and time based on the given parameters or the current datetime.
 
@@ -16,14 +80,58 @@ class YamTimes:
         - hour (int, optional): The hour to set. Defaults to the current hour if not provided.
         - minute (int, optional): The minute to set. Defaults to the current minute if not provided.
         - dt (datetime, optional): A specific datetime object to set. If not provided, the current datetime is used.
+        - tz (str or tzinfo, optional): The time zone, e.g. "America/Sao_Paulo" or "UTC". A naive `dt` is taken as
+          wall-clock time in that zone and an aware one is converted to it. Defaults to a naive (zone-less) instance.
+
+        YamTimes instances are immutable and hashable, so they can be used as dict keys and set members.
         """
-        self.__datetime = datetime
+        zone = _zone(tz) if tz is not None else None
         if dt is None:
-            self.__datetime : datetime = datetime.now()
+            dt = current_datetime(zone)
             if(year is not None or month is not None or day is not None or hour is not None or minute is not None):
-                self.__datetime = datetime(year if year is not None else self.__datetime.year,month if month is not None else self.__datetime.month,day if day is not None else self.__datetime.day,hour if hour is not None else self.__datetime.hour,minute if minute is not None else self.__datetime.minute)
-        else:
-            self.__datetime : datetime = dt
+                dt = datetime(year if year is not None else dt.year,month if month is not None else dt.month,day if day is not None else dt.day,hour if hour is not None else dt.hour,minute if minute is not None else dt.minute, tzinfo=zone)
+        elif zone is not None:
+            dt = dt.replace(tzinfo=zone) if dt.tzinfo is None else dt.astimezone(zone)
+        object.__setattr__(self, "_YamTimes__datetime", dt)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("YamTimes instances are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("YamTimes instances are immutable")
+
+    def __reduce__(self):
+        # Restores the datetime directly instead of going through __init__ and its five None arguments.
+        return (_restore, (self.__datetime,))
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the instant in the compact binary format of yamtimes.binary.
+
+        Returns:
+        - bytes: 8 bytes of wall-clock microseconds since the epoch, followed by the zone for aware instants.
+
+        Raises:
+        - ValueError: If the time zone has no IANA key and is not a fixed offset.
+        """
+        from .binary import pack_datetime
+
+        return pack_datetime(self.__datetime)
+
+    @classmethod
+    def from_bytes(cls, data) -> "YamTimes":
+        """
+        Decodes an instant written by to_bytes.
+
+        Parameters:
+        - data (bytes-like): The encoded instant.
+
+        Returns:
+        - YamTimes: The decoded instant.
+        """
+        from .binary import unpack_datetime
+
+        return cls(dt=unpack_datetime(data))
 
     def to_datetime(self) -> datetime:
         """
@@ -43,7 +151,7 @@ class YamTimes:
         - bool: True if the current date is within the Aries range (March 21 - April 19), False otherwise.
         """
 
-        return self.__is_between_dates(3, 21, 4, 19)
+        return self.zodiac_sign() == "aries"
 
     def is_taurus_sign(self) -> bool:
         """
@@ -53,7 +161,7 @@ class YamTimes:
         - bool: True if the current date is within the Taurus range (April 20 - May 20), False otherwise.
         """
 
-        return self.__is_between_dates(4, 20, 5, 20)
+        return self.zodiac_sign() == "taurus"
 
     def is_gemini_sign(self) -> bool:
         """
@@ -62,7 +170,7 @@ class YamTimes:
         Returns:
         - bool: True if the current date is within the Gemini range (May 21 - June 20), False otherwise.
         """
-        return self.__is_between_dates(5, 21, 6, 20)
+        return self.zodiac_sign() == "gemini"
 
     def is_cancer_sign(self) -> bool:
         """
@@ -71,7 +179,7 @@ class YamTimes:
         Returns:
         - bool: True if the current date is within the Cancer range (June 21 - July 22), False otherwise.
         """
-        return self.__is_between_dates(6, 21, 7, 22)
+        return self.zodiac_sign() == "cancer"
 
     def is_leo_sign(self) -> bool:
         """
@@ -80,7 +188,7 @@ class YamTimes:
         Returns:
         - bool: True if the current date is within the Leo range (July 23 - August 22), False otherwise.
         """
-        return self.__is_between_dates(7, 23, 8, 22)
+        return self.zodiac_sign() == "leo"
 
     def is_virgo_sign(self) -> bool:
         """
@@ -90,7 +198,7 @@ class YamTimes:
         - bool: True if the current date is within the Virgo range (August 23 - September 22), False otherwise.
         """
        
-        return self.__is_between_dates(8, 23, 9, 22)
+        return self.zodiac_sign() == "virgo"
 
     def is_libra_sign(self) -> bool:
         """
@@ -100,7 +208,7 @@ class YamTimes:
         - bool: True if the current date is within the Libra range (September 23 - October 22), False otherwise.
         """
         
-        return self.__is_between_dates(9, 23, 10, 22)
+        return self.zodiac_sign() == "libra"
 
     def is_scorpio_sign(self) -> bool:
         """
@@ -110,7 +218,7 @@ class YamTimes:
         - bool: True if the current date is within the Scorpio range (October 23 - November 21), False otherwise.
         """
         
-        return self.__is_between_dates(10, 23, 11, 21)
+        return self.zodiac_sign() == "scorpio"
 
     def is_sagittarius_sign(self) -> bool:
         """
@@ -119,7 +227,7 @@ class YamTimes:
         Returns:
         - bool: True if the current date is within the Sagittarius range (November 22 - December 21), False otherwise.
         """
-        return self.__is_between_dates(11, 22, 12, 21)
+        return self.zodiac_sign() == "sagittarius"
 
     def is_capricorn_sign(self) -> bool:
         """
@@ -128,7 +236,7 @@ class YamTimes:
         Returns:
         - bool: True if the current date is within the Capricorn range (December 22 - January 19), False otherwise.
         """
-        return self.__is_between_dates(12, 22, 1, 19)
+        return self.zodiac_sign() == "capricorn"
 
     def is_aquarius_sign(self) -> bool:
         """
@@ -138,7 +246,7 @@ class YamTimes:
         - bool: True if the current date is within the Aquarius range (January 20 - February 18), False otherwise.
         """
         
-        return self.__is_between_dates(1, 20, 2, 18)
+        return self.zodiac_sign() == "aquarius"
 
     def is_pisces_sign(self) -> bool:
         """
@@ -148,19 +256,18 @@ class YamTimes:
         - bool: True if the current date is within the Pisces range (February 19 - March 20), False otherwise.
         """
         
-        return self.__is_between_dates(2, 19, 3, 20)
-
-    def __is_between_dates(self, start_month: int, start_day: int, end_month: int, end_day: int) -> bool:
-        date = self.__datetime
-        if start_month < end_month or (start_month == end_month and start_day <= end_day):
-            return (start_month == date.month and start_day <= date.day) or \
-                   (end_month == date.month and date.day <= end_day) or \
-                   (start_month < date.month < end_month)
-        else:
-            # Handles Capricorn, which wraps around the year
-            return (start_month == date.month and start_day <= date.day) or \
-                   (end_month == date.month and date.day <= end_day) or \
-                   (date.month > start_month or date.month < end_month)
+        return self.zodiac_sign() == "pisces"
+
+    def zodiac_sign(self) -> str:
+        """
+        Returns the zodiac sign of the current date.
+
+        Returns:
+        - str: The lowercase English name of the sign, e.g. "aries" or "capricorn".
+        """
+        from .zodiac import ZODIAC_SIGNS, sign_code
+
+        return ZODIAC_SIGNS[sign_code(self.__datetime.month, self.__datetime.day)]
 
     def to_datetime(self) -> datetime:
         """
@@ -179,15 +286,9 @@ class YamTimes:
         Returns:
         - str: The string representation of the internal datetime object according to the given format.
         """
-        return self.__datetime.strftime(format)
+        return compile_format(format).format(self.__datetime)
     
     
-    def _set_locale(self, language_code: str):
-        try:
-            locale.setlocale(locale.LC_TIME, language_code)
-        except locale.Error:
-            print(f"Idioma {language_code} não é suportado.")
-
     def month_name(self, language_code: str = 'en_US') -> str:
         """
         Returns the name of the month of the internal datetime object based on the given language_code.
@@ -198,8 +299,7 @@ class YamTimes:
         Returns:
         - str: The name of the month of the internal datetime object according to the given language_code.
         """
-        self._set_locale(language_code)
-        return self.__datetime.strftime("%B")
+        return _locale_names(language_code).months[self.__datetime.month - 1]
 
     def weekday_name(self, language_code: str = 'en_US') -> str:
         """
@@ -211,8 +311,7 @@ class YamTimes:
         Returns:
         - str: The name of the weekday of the internal datetime object according to the given language_code.
         """
-        self._set_locale(language_code)
-        return self.__datetime.strftime("%A")
+        return _locale_names(language_code).weekdays[self.__datetime.weekday()]
 
     def day_of_month(self) -> int:
         """
@@ -223,11 +322,24 @@ class YamTimes:
 
     def week_number(self) -> int:
         """
-        Returns the week number of the internal datetime object as an integer.
+        Returns the ISO 8601 week number of the internal datetime object as an integer.
 
+        The first days of January can belong to the last week of the previous ISO year, and
+        the last days of December to week 1 of the next one; see iso_week_year.
         """
-        
-        return self.__datetime.isocalendar()[1]
+        dt = self.__datetime
+        return iso_week_number(dt.year, dt.month, dt.day)
+
+    def iso_week_year(self) -> int:
+        """
+        Returns the ISO 8601 week-numbering year of the internal datetime object.
+
+        Returns:
+        - int: The year that owns the ISO week of the date. It differs from the calendar year
+          for dates like 2024-12-30, which falls in week 1 of 2025.
+        """
+        dt = self.__datetime
+        return iso_week_year(dt.year, dt.month, dt.day)
 
     def is_weekend(self) -> bool:
         """
@@ -246,7 +358,7 @@ class YamTimes:
         - int: The number of days in the current month.
         """
 
-        return calendar.monthrange(self.__datetime.year, self.__datetime.month)[1]
+        return year_table(self.__datetime.year).month_lengths[self.__datetime.month - 1]
 
     def is_leap_year(self) -> bool:
         """
@@ -256,7 +368,7 @@ class YamTimes:
         - bool: True if the year is a leap year, False otherwise.
         """
 
-        return (self.__datetime.year % 4 == 0 and (self.__datetime.year % 100 != 0 or self.__datetime.year % 400 == 0))
+        return year_table(self.__datetime.year).leap
 
     def month(self) -> int:
         """
@@ -375,12 +487,12 @@ class YamTimes:
 
     def weeks_in_year(self) -> int:
         """
-        Determines the number of weeks in the year of the internal datetime object.
+        Determines the number of ISO 8601 weeks in the year of the internal datetime object.
 
         Returns:
-        - int: 52 if it's a common year, 53 if it's a leap year.
+        - int: 53 if the year starts on a Thursday (or on a Wednesday in a leap year), 52 otherwise.
         """
-        return 52 if not self.is_leap_year() else 53
+        return year_table(self.__datetime.year).iso_weeks
 
     def start_of_month(self) -> "YamTimes":
         """
@@ -399,7 +511,7 @@ class YamTimes:
         - YamTimes: A new YamTimes instance representing the last day of the month.
         """
 
-        last_day = calendar.monthrange(self.__datetime.year, self.__datetime.month)[1]
+        last_day = days_in_month(self.__datetime.year, self.__datetime.month)
         return YamTimes(dt = self.__datetime.replace(day=last_day, hour=23, minute=59, second=59, microsecond=999999))
 
     def start_of_year(self) -> "YamTimes":
@@ -514,16 +626,15 @@ class YamTimes:
         """
         Adds a specified number of months to the internal datetime object.
 
+        If the target month is shorter than the current day, the day is clamped to the last day of that month.
+
         Parameters:
         - months (int): The number of months to add. Can be positive or negative.
 
         Returns:
         - YamTimes: A new YamTimes instance representing the datetime after adding the specified number of months.
         """
-        new_month = self.__datetime.month + months
-        year_adjustment = (new_month - 1) // 12
-        new_month = new_month % 12 + 1
-        return YamTimes(dt = self.__datetime.replace(year=self.__datetime.year + year_adjustment, month=new_month))
+        return YamTimes(dt = add_months_to_datetime(self.__datetime, months))
 
     def subtract_months(self, months: int) -> "YamTimes":
         """
@@ -542,13 +653,15 @@ class YamTimes:
         """
         Adds a specified number of years to the internal datetime object.
 
+        February 29th is clamped to February 28th when the target year is not a leap year.
+
         Parameters:
         - years (int): The number of years to add. Can be positive or negative.
 
         Returns:
         - YamTimes: A new YamTimes instance representing the datetime after adding the specified number of years.
         """
-        return YamTimes(dt = self.__datetime.replace(year=self.__datetime.year + years))
+        return YamTimes(dt = add_months_to_datetime(self.__datetime, years * 12))
 
     def subtract_years(self, years: int) -> "YamTimes":
         """
@@ -574,7 +687,7 @@ class YamTimes:
         - int: The number of seconds from the current instance to the `other` instance.
         """
 
-        return int((other.datetime - self.__datetime).total_seconds())
+        return _whole_seconds(other.datetime - self.__datetime)
 
     def days_until(self, other: "YamTimes") -> int:
         """
@@ -600,7 +713,8 @@ class YamTimes:
         - int: The number of whole hours from the current instance to the `other` instance.
         """
 
-        return (other.datetime - self.__datetime).seconds // 3600
+        seconds = self.seconds_until(other)
+        return -(-seconds // 3600) if seconds < 0 else seconds // 3600
 
     def day_of_year(self) -> int:
         """
@@ -609,7 +723,7 @@ class YamTimes:
         Returns:
         - int: The day of the year of the current date.
         """
-        return self.__datetime.timetuple().tm_yday
+        return ordinal_day(self.__datetime.year, self.__datetime.month, self.__datetime.day)
 
     def short_month_name(self, language_code: str = 'en_US') -> str:
         """
@@ -621,8 +735,7 @@ class YamTimes:
         Returns:
         - str: The short name of the month of the internal datetime object according to the given language_code.
         """
-        self._set_locale(language_code)
-        return self.__datetime.strftime("%b")
+        return _locale_names(language_code).short_months[self.__datetime.month - 1]
 
     def short_weekday_name(self, language_code: str = 'en_US') -> str:
         """
@@ -634,8 +747,7 @@ class YamTimes:
         Returns:
         - str: The short name of the weekday of the internal datetime object according to the given language_code.
         """
-        self._set_locale(language_code)
-        return self.__datetime.strftime("%a")
+        return _locale_names(language_code).short_weekdays[self.__datetime.weekday()]
 
     def week_day_number(self) -> int:
         """
@@ -667,21 +779,28 @@ class YamTimes:
         Returns:
         - str: A formatted string representing the date and time in the format "Day, DD Month YYYY HH:MM:SS AM/PM".
         """
+        from .locales import localized_strftime
 
-        self._set_locale(language_code)
-        return self.__datetime.strftime("%A, %d %B %Y %I:%M:%S %p")
+        return localized_strftime(self.__datetime, "%A, %d %B %Y %I:%M:%S %p", language_code)
 
-    def is_holiday(self) -> bool:
+    def is_holiday(self, country_code: str = "US") -> bool:
         """
         Checks if the internal datetime object is a holiday in the given country.
 
+        Observed days (e.g. a Friday standing in for a Saturday holiday) also count as holidays.
+
         Parameters:
         - country_code (str): The ISO 3166-1 alpha-2 country code. Defaults to "US" if not provided.
 
         Returns:
         - bool: True if the internal datetime object is a holiday, False otherwise.
+
+        Raises:
+        - ValueError: If there are no holiday rules for the country.
         """
-        return False  
+        from .holidays import is_holiday
+
+        return is_holiday(self.__datetime, country_code)
 
     def years_difference(self, other: "YamTimes") -> int:
         """
@@ -696,6 +815,36 @@ class YamTimes:
 
         return abs(self.__datetime.year - other.datetime.year)
 
+    def months_until(self, other: "YamTimes") -> int:
+        """
+        Calculates the number of whole calendar months until another YamTimes instance.
+
+        A month is counted once adding it to the current instance, clamped to the end of the
+        month, does not go past `other`: 2024-01-31 to 2024-02-29 is one month.
+
+        Parameters:
+        - other (YamTimes): The YamTimes instance to compare against.
+
+        Returns:
+        - int: The number of whole months from the current instance to the `other` instance, negative if `other` is earlier.
+        """
+
+        return months_between(self.__datetime, _aligned(other.datetime, self.__datetime))
+
+    def years_until(self, other: "YamTimes") -> int:
+        """
+        Calculates the number of whole calendar years until another YamTimes instance.
+
+        Parameters:
+        - other (YamTimes): The YamTimes instance to compare against.
+
+        Returns:
+        - int: The number of whole years from the current instance to the `other` instance, negative if `other` is earlier.
+        """
+
+        months = self.months_until(other)
+        return -(-months // 12) if months < 0 else months // 12
+
     def current_quarter(self) -> int:
         """
         Returns the current quarter of the year of the internal datetime object.
@@ -713,7 +862,7 @@ class YamTimes:
         - int: The day of the year of the current date.
         """
 
-        return self.__datetime.timetuple().tm_yday
+        return ordinal_day(self.__datetime.year, self.__datetime.month, self.__datetime.day)
 
     def time_24hr_format(self) -> str:
         """
@@ -731,7 +880,7 @@ class YamTimes:
         Returns:
         - str: The internal datetime object as an ISO 8601 formatted string with microsecond precision.
         """
-        return self.__datetime.isoformat()
+        return format_iso(self.__datetime, timespec="microseconds")
 
     @property
     def datetime(self) -> datetime:
@@ -752,7 +901,7 @@ class YamTimes:
         Returns:
         - YamTimes: A new YamTimes instance set to the current date and time.
         """
-        return YamTimes(dt = datetime.now())
+        return YamTimes(dt = current_datetime(self.__datetime.tzinfo))
 
     def tomorrow(self) -> "YamTimes":
         """
@@ -795,32 +944,36 @@ class YamTimes:
         - YamTimes: A new YamTimes instance initialized with the parsed date and time.
         """
 
-        return YamTimes(dt = datetime.strptime(date_string, format))
+        return YamTimes(dt = compile_format(format).parse(date_string))
 
     def from_iso_format(self, iso_string: str) -> "YamTimes":
         """
         Class method to create a YamTimes instance from an ISO 8601 format string.
 
+        Accepts RFC 3339 and the common ISO 8601 variants: a trailing "Z", numeric offsets,
+        the basic format (e.g. "20240315T101500Z"), ordinal dates and week dates.
+
         Parameters:
-        - iso_string (str): The ISO 8601 format string representation of the date and time.
+        - iso_string (str or bytes): The ISO 8601 format string representation of the date and time.
 
         Returns:
         - YamTimes: A new YamTimes instance initialized with the parsed date and time.
         """
-        return YamTimes(dt = datetime.fromisoformat(iso_string))
+        return YamTimes(dt = parse_iso(iso_string))
 
 
-    def from_timestamp(self, ts: float) -> "YamTimes":
+    def from_timestamp(self, ts: float, tz=None) -> "YamTimes":
         """
         Class method to create a YamTimes instance from a given timestamp.
 
         Parameters:
         - ts (float): The timestamp to use for the internal datetime object.
+        - tz (str or tzinfo, optional): The time zone of the result. Defaults to naive local time.
 
         Returns:
         - YamTimes: A new YamTimes instance initialized with the given timestamp.
         """
-        return YamTimes(dt = datetime.fromtimestamp(ts))
+        return YamTimes(dt = datetime.fromtimestamp(ts, _zone(tz) if tz is not None else None))
 
     def after(self, years=0, months=0, days=0, hours=0, minutes=0, seconds=0) -> "YamTimes":
         """
@@ -839,8 +992,8 @@ class YamTimes:
         - YamTimes: A new YamTimes instance ahead of the current datetime object by the given time period.
         """
         return YamTimes(
-            dy = self.__datetime + relativedelta(
-                years=years, months=months, days=days, hours=hours, minutes=minutes, seconds=seconds
+            dt = shift_datetime(
+                self.__datetime, years=years, months=months, days=days, hours=hours, minutes=minutes, seconds=seconds
             )
         )
 
@@ -862,8 +1015,8 @@ class YamTimes:
         """
 
         return YamTimes(
-            dt = self.__datetime - relativedelta(
-                years=years, months=months, days=days, hours=hours, minutes=minutes, seconds=seconds
+            dt = shift_datetime(
+                self.__datetime, years=-years, months=-months, days=-days, hours=-hours, minutes=-minutes, seconds=-seconds
             )
         )
 
@@ -941,7 +1094,7 @@ class YamTimes:
         - YamTimes: A new YamTimes instance at the end of the month.
         """
 
-        last_day = calendar.monthrange(self.__datetime.year, self.__datetime.month)[1]
+        last_day = days_in_month(self.__datetime.year, self.__datetime.month)
         return YamTimes(dt = self.__datetime.replace(day=last_day, hour=23, minute=59, second=59, microsecond=999999))
 
     def start_of_year(self) -> "YamTimes":
@@ -988,7 +1141,7 @@ class YamTimes:
         - bool: True if the internal datetime object is earlier than the current datetime, False otherwise.
         """
 
-        return self.__datetime < datetime.now()
+        return self.__datetime < current_datetime(self.__datetime.tzinfo)
 
     def is_future(self) -> bool:
         """
@@ -997,7 +1150,7 @@ class YamTimes:
         Returns:
         - bool: True if the internal datetime object is later than the current datetime, False otherwise.
         """
-        return self.__datetime > datetime.now()
+        return self.__datetime > current_datetime(self.__datetime.tzinfo)
 
     def days_in_month(self) -> int:
         """
@@ -1006,7 +1159,7 @@ class YamTimes:
         Returns:
         - int: The number of days in the current month.
         """
-        return calendar.monthrange(self.__datetime.year, self.__datetime.month)[1]
+        return year_table(self.__datetime.year).month_lengths[self.__datetime.month - 1]
 
     def to_iso_format(self) -> str:
         """
@@ -1015,7 +1168,7 @@ class YamTimes:
         Returns:
         - str: The internal datetime object as an ISO 8601 formatted string.
         """
-        return self.__datetime.isoformat()
+        return format_iso(self.__datetime)
 
     def string(self, format: str = "%Y-%m-%d %H:%M:%S") -> str:
         """
@@ -1028,7 +1181,7 @@ class YamTimes:
         - str: The string representation of the internal datetime object according to the given format.
         """
 
-        return self.__datetime.strftime(format)
+        return compile_format(format).format(self.__datetime)
 
     def timestamp(self) -> float:
         """
@@ -1289,9 +1442,60 @@ class YamTimes:
             end_month = 9
         else:
             end_month = 12
-        last_day = calendar.monthrange(self.__datetime.year, end_month)[1]
+        last_day = days_in_month(self.__datetime.year, end_month)
         return YamTimes(dt=self.__datetime.replace(month=end_month, day=last_day, hour=23, minute=59, second=59))
 
+    def truncate(self, period: str, every: int = 1) -> "YamTimes":
+        """
+        Returns a new YamTimes instance at the start of the period containing the internal datetime.
+
+        For example, truncate("month") is the same instant as start_of_month(), and
+        truncate("minute", every=15) rounds down to a quarter of an hour.
+
+        Parameters:
+        - period (str): One of "second", "minute", "hour", "day", "week", "month", "quarter" or "year".
+          Weeks start on Monday.
+        - every (int, optional): Groups that many consecutive periods into one. Defaults to 1.
+
+        Returns:
+        - YamTimes: A new YamTimes instance at the start of the period, in the same time zone.
+
+        Raises:
+        - ValueError: If the period is unknown or every is not positive.
+        """
+        from .periods import floor_micros
+
+        return self.__with_micros(floor_micros(datetime_to_micros(self.__datetime), period, every))
+
+    def floor(self, period: str, every: int = 1) -> "YamTimes":
+        """
+        Returns a new YamTimes instance at the start of the period containing the internal datetime.
+
+        This is the same as truncate.
+        """
+        return self.truncate(period, every)
+
+    def ceil(self, period: str, every: int = 1) -> "YamTimes":
+        """
+        Returns a new YamTimes instance at the first period boundary at or after the internal datetime.
+
+        Instants that are already on a boundary are returned unchanged, so ceil("day") of
+        2024-03-15 00:00 is 2024-03-15 00:00 and of 2024-03-15 00:01 is 2024-03-16 00:00.
+
+        Parameters:
+        - period (str): One of "second", "minute", "hour", "day", "week", "month", "quarter" or "year".
+        - every (int, optional): Groups that many consecutive periods into one. Defaults to 1.
+
+        Returns:
+        - YamTimes: A new YamTimes instance on the boundary, in the same time zone.
+        """
+        from .periods import ceil_micros
+
+        return self.__with_micros(ceil_micros(datetime_to_micros(self.__datetime), period, every))
+
+    def __with_micros(self, micros: int) -> "YamTimes":
+        return YamTimes(dt=micros_to_datetime(micros).replace(tzinfo=self.__datetime.tzinfo))
+
     def is_weekday(self) -> bool:
         """
         Checks if the internal datetime object is a weekday (Monday to Friday).
@@ -1316,33 +1520,100 @@ class YamTimes:
 
         return start.datetime <= self.__datetime <= end.datetime
 
-    def next_business_day(self) -> "YamTimes":
+    def range(self, end, step=timedelta(days=1)) -> "TimeRange":
+        """
+        Returns a lazy range of instants from this one up to `end`, excluded.
+
+        Can be called as `YamTimes.range(start, end, step)` or `start.range(end, step)`. The range
+        supports len(), indexing and slicing in constant time and creates instants only while iterating.
+
+        Parameters:
+        - end (YamTimes, datetime or date): The end of the range, which is not included.
+        - step (timedelta or int): The distance between instants, as a timedelta or in microseconds. Defaults to one day.
+
+        Returns:
+        - TimeRange: The range of instants.
+        """
+        from .recurrence import TimeRange
+        return TimeRange(self, end, step)
+
+    def recurrence(self, frequency: str, interval: int = 1, count: int = None, until=None,
+                   by_weekday=None, by_monthday=None, by_month=None) -> "Recurrence":
+        """
+        Returns an RRULE-style recurrence starting at this instant.
+
+        Parameters:
+        - frequency (str): "daily", "weekly", "monthly" or "yearly".
+        - interval (int): The number of periods between repetitions. Defaults to 1.
+        - count (int, optional): The maximum number of occurrences.
+        - until (YamTimes, datetime or date, optional): The last instant an occurrence can fall on (inclusive).
+        - by_weekday (int, tuple or iterable, optional): Weekdays (Monday is 0), or (weekday, n) pairs for the n-th one of the month.
+        - by_monthday (int or iterable, optional): Days of the month; negative values count from the end.
+        - by_month (int or iterable, optional): Months (1-12).
+
+        Returns:
+        - Recurrence: A lazy iterable of the occurrences.
+        """
+        from .recurrence import Recurrence
+        return Recurrence(frequency, self, interval, count, until, by_weekday, by_monthday, by_month)
+
+    def next_business_day(self, calendar: "BusinessCalendar" = None) -> "YamTimes":
         """
         Returns a new YamTimes instance representing the next business day.
 
-        The next business day is defined as the next day that is not a weekend (Saturday or Sunday).
+        The next business day is defined as the next day that is not a weekend (Saturday or Sunday),
+        or the next business day of the given calendar.
+
+        Parameters:
+        - calendar (BusinessCalendar, optional): The calendar to use. Defaults to Monday to Friday without holidays.
 
         Returns:
         - YamTimes: A new YamTimes instance representing the next business day.
         """
-        next_day = self.__datetime + timedelta(days=1)
-        while next_day.weekday() >= 5:  # Skip weekends
-            next_day += timedelta(days=1)
-        return YamTimes(dt=next_day)
+        return _calendar(calendar).next_business_day(self)
 
-    def last_business_day(self) -> "YamTimes":
+    def last_business_day(self, calendar: "BusinessCalendar" = None) -> "YamTimes":
         """
         Returns a new YamTimes instance representing the last business day.
 
-        The last business day is defined as the last day that is not a weekend (Saturday or Sunday).
+        The last business day is defined as the last day that is not a weekend (Saturday or Sunday),
+        or the previous business day of the given calendar.
+
+        Parameters:
+        - calendar (BusinessCalendar, optional): The calendar to use. Defaults to Monday to Friday without holidays.
 
         Returns:
         - YamTimes: A new YamTimes instance representing the last business day.
         """
-        last_day = self.__datetime - timedelta(days=1)
-        while last_day.weekday() >= 5:  # Skip weekends
-            last_day -= timedelta(days=1)
-        return YamTimes(dt=last_day)
+        return _calendar(calendar).previous_business_day(self)
+
+    def add_business_days(self, days: int, calendar: "BusinessCalendar" = None) -> "YamTimes":
+        """
+        Adds a specified number of business days to the internal datetime object.
+
+        If the current day is not a business day, counting starts from the next business day.
+
+        Parameters:
+        - days (int): The number of business days to add. Can be positive or negative.
+        - calendar (BusinessCalendar, optional): The calendar to use. Defaults to Monday to Friday without holidays.
+
+        Returns:
+        - YamTimes: A new YamTimes instance representing the datetime after adding the business days.
+        """
+        return _calendar(calendar).add_business_days(self, days)
+
+    def business_days_until(self, other: "YamTimes", calendar: "BusinessCalendar" = None) -> int:
+        """
+        Counts the business days from the internal datetime object (inclusive) to another YamTimes instance (exclusive).
+
+        Parameters:
+        - other (YamTimes): The YamTimes instance to count up to.
+        - calendar (BusinessCalendar, optional): The calendar to use. Defaults to Monday to Friday without holidays.
+
+        Returns:
+        - int: The number of business days. Negative if `other` is earlier.
+        """
+        return _calendar(calendar).business_days_between(self, other)
 
     def to_unix_timestamp(self) -> int:
         """
@@ -1361,7 +1632,7 @@ class YamTimes:
         Returns:
         - bool: True if the internal datetime object is a weekday, False otherwise.
         """
-        return not self.is_weekend_day()
+        return not self.is_weekend()
 
     def is_am(self) -> bool:
         """
@@ -1496,9 +1767,7 @@ class YamTimes:
         Returns:
         - bool: True if the internal datetime object is in the same week as the other YamTimes instance, False otherwise.
         """
-        start_of_week_self = self.start_of_week().datetime.date()
-        start_of_week_other = other.start_of_week().datetime.date()
-        return start_of_week_self == start_of_week_other
+        return _monday_ordinal(self.__datetime) == _monday_ordinal(other.datetime)
 
     def time_difference_in_seconds(self, other: "YamTimes") -> int:
         """
@@ -1510,7 +1779,7 @@ class YamTimes:
         Returns:
         - int: The absolute difference in seconds.
         """
-        return int(abs((self.__datetime - other.datetime).total_seconds()))
+        return _whole_seconds(abs(self.__datetime - other.datetime))
 
     def time_difference_in_minutes(self, other: "YamTimes") -> int:
         """
@@ -1526,6 +1795,7 @@ class YamTimes:
 
     def time_difference_in_hours(self, other: "YamTimes") -> int:
         """
+        Calculates the absolute difference in hours between the internal datetime object and another YamTimes instance.
 
         Parameters:
         - other (YamTimes): The YamTimes instance to compare against.
@@ -1533,7 +1803,7 @@ class YamTimes:
         Returns:
         - int: The absolute difference in hours.
         """
-        return self.time_difference_in_minutes(other) // 60
+        return self.time_difference_in_seconds(other) // 3600
 
     def time_difference_in_days(self, other: "YamTimes") -> int:
         """
@@ -1545,7 +1815,7 @@ class YamTimes:
         Returns:
         - int: The absolute difference in days.
         """
-        return abs((self.__datetime - other.datetime).days)
+        return abs(self.__datetime - other.datetime).days
 
     def is_before_today(self) -> bool:
         """
@@ -1554,7 +1824,7 @@ class YamTimes:
         Returns:
         - bool: True if the internal datetime object is before the current date, False otherwise.
         """
-        return self.__datetime.date() < datetime.today().date()
+        return self.__datetime.date() < current_datetime(self.__datetime.tzinfo).date()
 
     def is_after_today(self) -> bool:
         """
@@ -1563,16 +1833,17 @@ class YamTimes:
         Returns:
         - bool: True if the internal datetime object is after the current date, False otherwise.
         """
-        return self.__datetime.date() > datetime.today().date()
+        return self.__datetime.date() > current_datetime(self.__datetime.tzinfo).date()
 
     def is_in_current_month(self) -> bool:
         """
-        Checks if the internal datetime object is in the current month.
+        Checks if the internal datetime object is in the current month of the current year.
 
         Returns:
         - bool: True if the internal datetime object is in the current month, False otherwise.
         """
-        return self.__datetime.month == datetime.now().month
+        now = current_datetime(self.__datetime.tzinfo)
+        return self.__datetime.month == now.month and self.__datetime.year == now.year
 
     def is_in_current_year(self) -> bool:
         """
@@ -1581,7 +1852,7 @@ class YamTimes:
         Returns:
         - bool: True if the internal datetime object is in the current year, False otherwise.
         """
-        return self.__datetime.year == datetime.now().year
+        return self.__datetime.year == current_datetime(self.__datetime.tzinfo).year
 
     def is_in_current_week(self) -> bool:
         """
@@ -1590,7 +1861,7 @@ class YamTimes:
         Returns:
         - bool: True if the internal datetime object is in the current week, False otherwise.
         """
-        return self.is_same_week(YamTimes.now())
+        return _monday_ordinal(self.__datetime) == _monday_ordinal(current_datetime(self.__datetime.tzinfo))
 
     def get_month_name(self, language_code: str = 'en_US') -> str:
         """
@@ -1602,8 +1873,7 @@ class YamTimes:
         Returns:
         - str: The full name of the month of the internal datetime object according to the given language_code.
         """
-        self._set_locale(language_code)
-        return self.__datetime.strftime('%B')
+        return _locale_names(language_code).months[self.__datetime.month - 1]
 
     def get_short_month_name(self, language_code: str = 'en_US') -> str:
         """
@@ -1616,8 +1886,7 @@ class YamTimes:
         - str: The abbreviated name of the month of the internal datetime object according to the given language_code.
         """
 
-        self._set_locale(language_code)
-        return self.__datetime.strftime('%b')
+        return _locale_names(language_code).short_months[self.__datetime.month - 1]
 
     def get_weekday_name(self, language_code: str = 'en_US') -> str:
         """
@@ -1630,8 +1899,7 @@ class YamTimes:
         - str: The full name of the weekday of the internal datetime object according to the given language_code.
         """
 
-        self._set_locale(language_code)
-        return self.__datetime.strftime('%A')
+        return _locale_names(language_code).weekdays[self.__datetime.weekday()]
 
     def get_short_weekday_name(self, language_code: str = 'en_US') -> str:
         """
@@ -1644,8 +1912,7 @@ class YamTimes:
         - str: The abbreviated name of the weekday of the internal datetime object according to the given language_code.
         """
 
-        self._set_locale(language_code)
-        return self.__datetime.strftime('%a')
+        return _locale_names(language_code).short_weekdays[self.__datetime.weekday()]
 
     def is_birthday(self, birthday: "YamTimes") -> bool:
         """
@@ -1666,7 +1933,7 @@ class YamTimes:
         Returns:
         - YamTimes: A new YamTimes instance set to the last day of the month of the internal datetime object.
         """
-        last_day = calendar.monthrange(self.__datetime.year, self.__datetime.month)[1]
+        last_day = days_in_month(self.__datetime.year, self.__datetime.month)
         return YamTimes(dt=self.__datetime.replace(day=last_day))
 
     def add_weeks_from_now(self, weeks: int) -> "YamTimes":
@@ -1680,7 +1947,7 @@ class YamTimes:
         Returns:
         - YamTimes: A new YamTimes instance ahead of the current datetime object by the given number of weeks.
         """        
-        return YamTimes(dt=datetime.now() + timedelta(weeks=weeks))
+        return YamTimes(dt=current_datetime(self.__datetime.tzinfo) + timedelta(weeks=weeks))
 
     def subtract_weeks_from_now(self, weeks: int) -> "YamTimes":
         """
@@ -1694,7 +1961,7 @@ class YamTimes:
         - YamTimes: A new YamTimes instance behind the current datetime object by the given number of weeks.
         """
 
-        return YamTimes(dt=datetime.now() - timedelta(weeks=weeks))
+        return YamTimes(dt=current_datetime(self.__datetime.tzinfo) - timedelta(weeks=weeks))
 
     def add_months_from_now(self, months: int) -> "YamTimes":
         """
@@ -1848,6 +2115,62 @@ class YamTimes:
         """
         return self.__datetime.strftime('%Z')
 
+    def time_zone_key(self):
+        """
+        Returns the key of the time zone of the internal datetime object.
+
+        Returns:
+        - str or None: The zone key (e.g., "America/Sao_Paulo" or "UTC"), or None for a naive instance.
+        """
+        tzinfo = self.__datetime.tzinfo
+        if tzinfo is None:
+            return None
+        return getattr(tzinfo, "key", None) or str(tzinfo)
+
+    def utc_offset(self):
+        """
+        Returns the UTC offset of the internal datetime object.
+
+        Returns:
+        - timedelta or None: The offset from UTC, or None for a naive instance.
+        """
+        return self.__datetime.utcoffset()
+
+    def to_zone(self, tz) -> "YamTimes":
+        """
+        Converts the instant to another time zone.
+
+        A naive instance is taken to be in the system local time zone.
+
+        Parameters:
+        - tz (str or tzinfo): The target time zone, e.g. "Europe/Lisbon" or "UTC".
+
+        Returns:
+        - YamTimes: A new YamTimes instance for the same instant, expressed in the target zone.
+        """
+        return YamTimes(dt=self.__datetime.astimezone(_zone(tz)))
+
+    def to_utc(self) -> "YamTimes":
+        """
+        Converts the instant to UTC.
+
+        Returns:
+        - YamTimes: A new YamTimes instance for the same instant, expressed in UTC.
+        """
+        return self.to_zone("UTC")
+
+    def replace_zone(self, tz) -> "YamTimes":
+        """
+        Attaches a time zone to the wall-clock time without converting it.
+
+        Parameters:
+        - tz (str or tzinfo or None): The time zone. None makes the instance naive.
+
+        Returns:
+        - YamTimes: A new YamTimes instance with the same wall-clock time in the given zone.
+        """
+        return YamTimes(dt=self.__datetime.replace(tzinfo=_zone(tz) if tz is not None else None))
+
     def add_hours(self, hours: int) -> "YamTimes":
         """
         Adds a specified number of hours to the internal datetime object.
@@ -1930,7 +2253,7 @@ class YamTimes:
         Returns:
         - str: The internal datetime object as an ISO 8601 formatted date string (YYYY-MM-DD).
         """
-        return self.__datetime.strftime('%Y-%m-%d')
+        return format_iso_date(self.__datetime)
 
     def get_iso_time(self) -> str:
         """
@@ -1939,18 +2262,23 @@ class YamTimes:
         Returns:
         - str: The internal datetime object as an ISO 8601 formatted time string (HH:MM:SS).
         """        
-        return self.__datetime.strftime('%H:%M:%S')
+        return format_iso_time(self.__datetime)
 
-    def is_working_day(self) -> bool:
+    def is_working_day(self, calendar: "BusinessCalendar" = None) -> bool:
         """
         Determines if the internal datetime object represents a working day.
 
-        A working day is considered to be any weekday (Monday to Friday).
+        A working day is considered to be any weekday (Monday to Friday), or a business day of the given calendar.
+
+        Parameters:
+        - calendar (BusinessCalendar, optional): The calendar to use. Defaults to Monday to Friday without holidays.
 
         Returns:
         - bool: True if the internal datetime object is a working day, False otherwise.
         """
-        return self.__datetime.weekday() < 5
+        if calendar is None:
+            return self.__datetime.weekday() < 5
+        return calendar.is_business_day(self)
 
     def get_current_timestamp(self) -> float:
         """
@@ -1960,7 +2288,7 @@ class YamTimes:
         - float: The current timestamp in seconds since the Epoch (January 1, 1970).
         """
         
-        return datetime.now().timestamp()
+        return current_datetime().timestamp()
 
     def get_current_datetime(self) -> "YamTimes":
         """
@@ -1969,7 +2297,7 @@ class YamTimes:
         Returns:
         - YamTimes: A new YamTimes instance set to the current date and time.
         """
-        return YamTimes(dt=datetime.now())
+        return YamTimes(dt=current_datetime(self.__datetime.tzinfo))
     
     def __call__(self):
         return self.string()
@@ -1981,19 +2309,32 @@ class YamTimes:
         return f"YamTimes({self.__datetime!r})"
 
     def __format__(self, format_spec):
-        return self.__datetime.strftime(format_spec or "%Y-%m-%d %H:%M:%S")
+        return compile_format(format_spec or "%Y-%m-%d %H:%M:%S").format(self.__datetime)
 
     def __eq__(self, other):
-        return isinstance(other, YamTimes) and self.__datetime == other.datetime
+        if not isinstance(other, YamTimes):
+            return NotImplemented
+        return self.__datetime == other.datetime
+
+    def __hash__(self):
+        return hash(self.__datetime)
 
     def __lt__(self, other):
-        return isinstance(other, YamTimes) and self.__datetime < other.datetime
+        if not isinstance(other, YamTimes):
+            return NotImplemented
+        return self.__datetime < other.datetime
 
     def __le__(self, other):
-        return isinstance(other, YamTimes) and self.__datetime <= other.datetime
+        if not isinstance(other, YamTimes):
+            return NotImplemented
+        return self.__datetime <= other.datetime
 
     def __gt__(self, other):
-        return isinstance(other, YamTimes) and self.__datetime > other.datetime
+        if not isinstance(other, YamTimes):
+            return NotImplemented
+        return self.__datetime > other.datetime
 
     def __ge__(self, other):
-        return isinstance(other, YamTimes) and self.__datetime >= other.datetime
+        if not isinstance(other, YamTimes):
+            return NotImplemented
+        return self.__datetime >= other.datetime
@@ -0,0 +1,76 @@
+from array import array
+
+from ._civil import US_PER_DAY, civil_from_days, micros_buffer
+
+# Sign codes returned by sign_code and zodiac_signs; ZODIAC_SIGNS[code] names each code.
+ARIES = 0
+TAURUS = 1
+GEMINI = 2
+CANCER = 3
+LEO = 4
+VIRGO = 5
+LIBRA = 6
+SCORPIO = 7
+SAGITTARIUS = 8
+CAPRICORN = 9
+AQUARIUS = 10
+PISCES = 11
+ZODIAC_SIGNS = (
+    "aries", "taurus", "gemini", "cancer", "leo", "virgo",
+    "libra", "scorpio", "sagittarius", "capricorn", "aquarius", "pisces",
+)
+
+# First (month, day) of every sign, in the order of ZODIAC_SIGNS.
+_SIGN_STARTS = ((3, 21), (4, 20), (5, 21), (6, 21), (7, 23), (8, 23),
+                (9, 23), (10, 23), (11, 22), (12, 22), (1, 20), (2, 19))
+
+# Index of the first day of every month in a leap year, so that month and day map to
+# one of 366 slots whatever the year.
+_MONTH_OFFSETS = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+
+
+def _build_table() -> bytes:
+    table = bytearray(366)
+    starts = sorted((_MONTH_OFFSETS[month - 1] + day - 1, code) for code, (month, day) in enumerate(_SIGN_STARTS))
+    # Days before the first start of the year (January 20) still belong to Capricorn.
+    code = CAPRICORN
+    position = 0
+    for start, next_code in starts:
+        table[position:start] = bytes([code]) * (start - position)
+        position, code = start, next_code
+    table[position:] = bytes([code]) * (366 - position)
+    return bytes(table)
+
+
+_SIGN_TABLE = _build_table()
+
+
+def sign_code(month: int, day: int) -> int:
+    """
+    Returns the code of the zodiac sign of a month and day, an index into ZODIAC_SIGNS.
+    """
+    return _SIGN_TABLE[_MONTH_OFFSETS[month - 1] + day - 1]
+
+
+def zodiac_signs(instants):
+    """
+    Returns the zodiac sign code of every instant, without creating any YamTimes objects.
+
+    Parameters:
+    - instants: A YamTimesArray, a buffer of epoch microseconds, or an iterable of YamTimes
+      instances, datetimes, dates or integers.
+
+    Returns:
+    - A NumPy uint8 array when NumPy is available, otherwise an `array('B')`. ZODIAC_SIGNS[code] names each code.
+    """
+    np, micros = micros_buffer(instants)
+    if np is None:
+        codes = array("B")
+        for value in micros:
+            _, month, day = civil_from_days(value // US_PER_DAY)
+            codes.append(_SIGN_TABLE[_MONTH_OFFSETS[month - 1] + day - 1])
+        return codes
+    _, month, day = civil_from_days(micros // US_PER_DAY)
+    offsets = np.array(_MONTH_OFFSETS, dtype=np.int64)
+    table = np.frombuffer(_SIGN_TABLE, dtype=np.uint8)
+    return table[offsets[month - 1] + day - 1]
@@ -0,0 +1,387 @@
+import threading
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+
+from ._civil import US_PER_SECOND, civil_from_days, days_from_civil
+
+
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ZERO = timedelta(0)
+# Probes are clamped two days inside the datetime range, so that neither the UTC instant nor
+# its local time overflows; offsets do not change in the first and last days of the range.
+_MIN_PROBE = (datetime.min - datetime(1970, 1, 1)) // timedelta(seconds=1) + 2 * 86400
+_MAX_PROBE = (datetime.max - datetime(1970, 1, 1)) // timedelta(seconds=1) - 2 * 86400
+
+# Years whose transitions are compiled into tables; instants outside this range
+# are answered by the underlying tzinfo directly.
+_MIN_TABLE_YEAR = 1800
+_MAX_TABLE_YEAR = 2400
+
+
+class CompiledZone(tzinfo):
+    """
+    A tzinfo backed by a compiled table of UTC offset transitions.
+
+    Transitions are extracted once from the system zone database (zoneinfo, or
+    dateutil on older Pythons), one year at a time as years are first used, and
+    every later utcoffset/dst/tzname/fromutc call is a binary search over the
+    table instead of a call into the zone implementation.
+
+    Instances are obtained through get_zone, which caches them per zone key.
+    """
+
+    def __init__(self, key: str, source: tzinfo):
+        """
+        Parameters:
+        - key (str): The IANA zone key, e.g. "America/Sao_Paulo".
+        - source (tzinfo): The zone implementation transitions are read from.
+        """
+        self.key = key
+        self._source = source
+        self._lock = threading.Lock()
+        # (first year, last year, first second, end second, transition starts in UTC seconds,
+        #  offset infos, wall-clock interval starts, (fold=0, fold=1) infos per interval)
+        self._table = (None, None, None, None, [], [], [], [])
+
+    def __repr__(self):
+        return f"CompiledZone({self.key!r})"
+
+    def __str__(self):
+        return self.key
+
+    def __reduce__(self):
+        return (get_zone, (self.key,))
+
+    def _probe(self, seconds: int) -> tuple:
+        seconds = min(max(seconds, _MIN_PROBE), _MAX_PROBE)
+        local = (_UTC_EPOCH + timedelta(seconds=seconds)).astimezone(self._source)
+        offset = local.utcoffset()
+        dst = local.dst() or _ZERO
+        return (int(offset.total_seconds()), int(dst.total_seconds()), local.tzname(), offset, dst)
+
+    def _compile_year(self, year: int) -> tuple:
+        start = days_from_civil(year, 1, 1) * 86400
+        end = days_from_civil(year + 1, 1, 1) * 86400
+        info = self._probe(start)
+        starts = [start]
+        infos = [info]
+        moment = start
+        while moment < end:
+            following = min(moment + 86400, end)
+            candidate = self._probe(following)
+            if candidate != info:
+                low, high = moment, following
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._probe(middle) == info:
+                        low = middle
+                    else:
+                        high = middle
+                info = self._probe(high)
+                starts.append(high)
+                infos.append(info)
+            moment = following
+        return starts, infos
+
+    def _ensure_years(self, first: int, last: int) -> tuple:
+        table = self._table
+        if table[0] is not None and table[0] <= first and last <= table[1]:
+            return table
+        with self._lock:
+            table_first, table_last, _, _, starts, infos, _, _ = self._table
+            if table_first is None:
+                table_first = table_last = first
+                starts, infos = self._compile_year(first)
+            pieces = [(starts, infos)]
+            for year in list(range(first, table_first)) + list(range(table_last + 1, last + 1)):
+                pieces.append(self._compile_year(year))
+            pieces.sort(key=lambda piece: piece[0][0])
+            merged_starts, merged_infos = [], []
+            for piece_starts, piece_infos in pieces:
+                for moment, info in zip(piece_starts, piece_infos):
+                    if merged_infos and merged_infos[-1] == info:
+                        continue
+                    merged_starts.append(moment)
+                    merged_infos.append(info)
+            first = min(first, table_first)
+            last = max(last, table_last)
+            # Wall-clock view of the same table: each transition opens a skipped or repeated
+            # interval, where fold=0 keeps the previous offset and fold=1 takes the new one
+            # (PEP 495), followed by an interval where only the new offset applies.
+            local_keys = [merged_starts[0] + merged_infos[0][0]]
+            local_pairs = [(merged_infos[0], merged_infos[0])]
+            for index in range(1, len(merged_starts)):
+                moment = merged_starts[index]
+                previous, info = merged_infos[index - 1], merged_infos[index]
+                low, high = sorted((moment + previous[0], moment + info[0]))
+                if low != high:
+                    local_keys.append(low)
+                    local_pairs.append((previous, info))
+                local_keys.append(high)
+                local_pairs.append((info, info))
+            self._table = (
+                first,
+                last,
+                days_from_civil(first, 1, 1) * 86400,
+                days_from_civil(last + 1, 1, 1) * 86400,
+                merged_starts,
+                merged_infos,
+                local_keys,
+                local_pairs,
+            )
+            return self._table
+
+    def _table_for(self, seconds: int, margin: int = 0):
+        # The compiled table covering seconds +/- margin, or None outside the compiled range.
+        table = self._table
+        if table[0] is not None and table[2] <= seconds - margin and seconds + margin < table[3]:
+            return table
+        first = civil_from_days((seconds - margin) // 86400)[0]
+        last = civil_from_days((seconds + margin) // 86400)[0]
+        if first < _MIN_TABLE_YEAR or last > _MAX_TABLE_YEAR:
+            return None
+        return self._ensure_years(first, last)
+
+    def _info_at(self, seconds: int) -> tuple:
+        # Offset information in effect at a UTC instant, in seconds since the epoch.
+        table = self._table_for(seconds)
+        if table is None:
+            return self._probe(seconds)
+        return table[5][bisect_right(table[4], seconds) - 1]
+
+    def _local_info(self, local_seconds: int, fold: int) -> tuple:
+        # Offset information for a wall-clock time, in seconds since the epoch.
+        table = self._table_for(local_seconds, 86400)
+        if table is None:
+            return self._local_info_slow(local_seconds, fold)
+        return table[7][bisect_right(table[6], local_seconds) - 1][fold]
+
+    def _local_info_slow(self, local_seconds: int, fold: int) -> tuple:
+        before = self._info_at(local_seconds - 86400)
+        after = self._info_at(local_seconds + 86400)
+        if before == after:
+            return before
+        before_valid = self._info_at(local_seconds - before[0]) == before
+        after_valid = self._info_at(local_seconds - after[0]) == after
+        if before_valid != after_valid:
+            return before if before_valid else after
+        return after if fold else before
+
+    def utcoffset(self, dt):
+        if dt is None:
+            return None
+        seconds = (dt.toordinal() - 719163) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+        return self._local_info(seconds, dt.fold)[3]
+
+    def dst(self, dt):
+        if dt is None:
+            return None
+        seconds = (dt.toordinal() - 719163) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+        return self._local_info(seconds, dt.fold)[4]
+
+    def tzname(self, dt):
+        if dt is None:
+            return None
+        seconds = (dt.toordinal() - 719163) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+        return self._local_info(seconds, dt.fold)[2]
+
+    def fromutc(self, dt):
+        if dt.tzinfo is not self:
+            raise ValueError("fromutc: dt.tzinfo is not self")
+        seconds = (dt.toordinal() - 719163) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+        table = self._table_for(seconds)
+        if table is None:
+            info = self._probe(seconds)
+            earlier = self._probe(seconds - 86400)
+            repeated = earlier[0] > info[0] and self._probe(seconds - (earlier[0] - info[0])) == earlier
+        else:
+            starts, infos = table[4], table[5]
+            index = bisect_right(starts, seconds) - 1
+            info = infos[index]
+            previous = infos[index - 1] if index else info
+            # The second pass through a repeated interval has fold=1.
+            repeated = previous[0] > info[0] and seconds - starts[index] < previous[0] - info[0]
+        local = dt + info[3]
+        return local.replace(fold=1) if repeated else local
+
+    def offsets_at_utc(self, seconds):
+        """
+        Returns the UTC offset, in seconds, in effect at each of the given UTC instants.
+
+        Parameters:
+        - seconds: A NumPy array, or an iterable of integer seconds since the epoch.
+
+        Returns:
+        - A NumPy int64 array when NumPy is available, otherwise a list.
+        """
+        from ._compat import np
+
+        if np is not None:
+            seconds = np.asarray(seconds, dtype=np.int64)
+            if not len(seconds):
+                return seconds.copy()
+            starts, offsets = self._arrays_for(int(seconds.min()), int(seconds.max()))
+            if starts is None:
+                return np.array([self._info_at(int(value))[0] for value in seconds], dtype=np.int64)
+            return offsets[np.searchsorted(starts, seconds, side="right") - 1]
+        return [self._info_at(value)[0] for value in seconds]
+
+    def _arrays_for(self, low: int, high: int):
+        from ._compat import np
+
+        table = self._table_for(low)
+        if table is None or self._table_for(high) is None:
+            return None, None
+        table = self._table
+        return np.array(table[4], dtype=np.int64), np.array([info[0] for info in table[5]], dtype=np.int64)
+
+    def local_to_utc_seconds(self, seconds):
+        """
+        Converts wall-clock times in this zone to UTC instants, with fold=0 semantics.
+
+        Parameters:
+        - seconds: A NumPy array, or an iterable of integer wall-clock seconds since the epoch.
+
+        Returns:
+        - A NumPy int64 array when NumPy is available, otherwise a list.
+        """
+        from ._compat import np
+
+        if np is None:
+            return [value - self._local_info(value, 0)[0] for value in seconds]
+        seconds = np.asarray(seconds, dtype=np.int64)
+        if not len(seconds):
+            return seconds.copy()
+        starts, offsets = self._arrays_for(int(seconds.min()) - 86400, int(seconds.max()) + 86400)
+        if starts is None:
+            return np.array([value - self._local_info(int(value), 0)[0] for value in seconds], dtype=np.int64)
+        before_index = np.searchsorted(starts, seconds - 86400, side="right") - 1
+        after_index = np.searchsorted(starts, seconds + 86400, side="right") - 1
+        before = seconds - offsets[before_index]
+        after = seconds - offsets[after_index]
+        transition = starts[after_index]
+        before_valid = (before_index == after_index) | (before < transition)
+        after_valid = after >= transition
+        return np.where(after_valid & ~before_valid, after, before)
+
+
+def _load_zone(key: str):
+    try:
+        from zoneinfo import ZoneInfo
+    except ImportError:  # Python < 3.9
+        from dateutil.tz import gettz
+        return gettz(key)
+    return ZoneInfo(key)
+
+
+@lru_cache(maxsize=None)
+def _zone_for_key(key: str) -> CompiledZone:
+    source = _load_zone(key)
+    if source is None:
+        raise ValueError(f"Unknown time zone: {key}")
+    return CompiledZone(key, source)
+
+
+def get_zone(zone) -> tzinfo:
+    """
+    Returns the compiled zone for an IANA zone key, reusing it across calls.
+
+    Parameters:
+    - zone (str or tzinfo): A zone key such as "Europe/Lisbon" or "UTC". A tzinfo with an IANA
+      key (such as zoneinfo.ZoneInfo) is replaced by the compiled zone for that key; other tzinfo
+      objects (fixed offsets, CompiledZone, dateutil zones, ...) are returned unchanged.
+
+    Returns:
+    - tzinfo: The compiled zone.
+
+    Raises:
+    - ValueError: If the zone key is unknown.
+    """
+    if isinstance(zone, (CompiledZone, timezone)):
+        return zone
+    if isinstance(zone, tzinfo):
+        key = getattr(zone, "key", None)
+        if not isinstance(key, str):
+            return zone
+        try:
+            return _zone_for_key(key)
+        except (KeyError, OSError, ValueError):
+            return zone
+    if zone.upper() == "UTC":
+        return timezone.utc
+    try:
+        return _zone_for_key(zone)
+    except (KeyError, OSError, ValueError):
+        raise ValueError(f"Unknown time zone: {zone}") from None
+
+
+def convert_zone_micros(micros, from_zone, to_zone):
+    """
+    Converts a buffer of wall-clock microseconds from one zone to another.
+
+    Ambiguous and skipped wall-clock times in the source zone are resolved with fold=0.
+
+    Parameters:
+    - micros: A NumPy int64 array, `array('q')` or iterable of wall-clock microseconds since the epoch.
+    - from_zone (str or tzinfo): The zone the wall-clock times are expressed in.
+    - to_zone (str or tzinfo): The zone to express them in.
+
+    Returns:
+    - A NumPy int64 array when NumPy is available, otherwise a list.
+    """
+    from ._compat import np
+
+    source = get_zone(from_zone)
+    target = get_zone(to_zone)
+    if np is not None:
+        micros = np.asarray(micros, dtype=np.int64)
+        seconds, remainder = np.divmod(micros, US_PER_SECOND)
+        utc = _local_to_utc(source, seconds)
+        return (utc + _offsets_at(target, utc)) * US_PER_SECOND + remainder
+    result = []
+    for value in micros:
+        seconds, remainder = divmod(value, US_PER_SECOND)
+        utc = _local_to_utc(source, [seconds])[0]
+        result.append((utc + _offsets_at(target, [utc])[0]) * US_PER_SECOND + remainder)
+    return result
+
+
+def _local_to_utc(zone, seconds):
+    from ._compat import np
+
+    if isinstance(zone, CompiledZone):
+        return zone.local_to_utc_seconds(seconds)
+    if isinstance(zone, timezone):
+        offset = int(zone.utcoffset(None).total_seconds())
+        if np is not None:
+            return seconds - offset
+        return [value - offset for value in seconds]
+    # Any other tzinfo is asked one instant at a time.
+    utc = [value - _local_offset(zone, int(value)) for value in seconds]
+    return np.array(utc, dtype=np.int64) if np is not None else utc
+
+
+def _offsets_at(zone, seconds):
+    from ._compat import np
+
+    if isinstance(zone, CompiledZone):
+        return zone.offsets_at_utc(seconds)
+    if isinstance(zone, timezone):
+        offset = int(zone.utcoffset(None).total_seconds())
+        if np is not None:
+            return np.full(len(seconds), offset, dtype=np.int64)
+        return [offset] * len(seconds)
+    offsets = [_utc_offset(zone, int(value)) for value in seconds]
+    return np.array(offsets, dtype=np.int64) if np is not None else offsets
+
+
+def _local_offset(zone: tzinfo, seconds: int) -> int:
+    # UTC offset of a wall-clock time (fold=0) in a zone, in seconds.
+    local = (_UTC_EPOCH + timedelta(seconds=seconds)).replace(tzinfo=zone)
+    return int(local.utcoffset().total_seconds())
+
+
+def _utc_offset(zone: tzinfo, seconds: int) -> int:
+    # UTC offset of a zone at a UTC instant, in seconds.
+    return int((_UTC_EPOCH + timedelta(seconds=seconds)).astimezone(zone).utcoffset().total_seconds())